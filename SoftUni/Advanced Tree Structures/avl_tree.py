@@ -1,4 +1,17 @@
 
+def _size(node):
+    return 0 if node is None else node.size
+
+
+def _height(node):
+    """ Follows the higher child down to a leaf, O(log n) """
+    height = 0
+    while node is not None:
+        height += 1
+        node = node.right if node.balance_factor < 0 else node.left
+    return height
+
+
 class Node:
     def __init__(self, value, parent, left=None, right=None):
         self.value = value
@@ -6,7 +19,10 @@ class Node:
         self.left = left
         self.right = right
         self.balance_factor = 0
-        self.index = 0
+        self.size = 1  # the count of nodes in this subtree
+
+    def update_size(self):
+        self.size = 1 + _size(self.left) + _size(self.right)
 
     def __iter__(self):
         if self.left is not None:
@@ -36,29 +52,38 @@ class AvlTree:
         return self.count
 
     def __iter__(self):
-        yield from self.root.__iter__()
+        if self.root is not None:
+            yield from self.root.__iter__()
 
     def __getitem__(self, index):
-        # some pathetic support for negative indexing
+        """ Walks down by the subtree sizes, O(log n) """
         if index < 0:
             index += self.count
+        node = self.root
+        while node is not None:
+            left_size = _size(node.left)
+            if index == left_size:
+                return node.value
+            elif index < left_size:
+                node = node.left
+            else:
+                index -= left_size + 1
+                node = node.right
+        return None
 
-        def get_node(node):
-            if index == node.index:
-                return node
-            elif index < node.index:
-                if node.left is not None:
-                    return get_node(node.left)
-                else:
-                    return None
+    def index_of(self, value):
+        """ Returns the in-order index of the value, O(log n) """
+        index = 0
+        node = self.root
+        while node is not None:
+            if value < node.value:
+                node = node.left
+            elif node.value < value:
+                index += _size(node.left) + 1
+                node = node.right
             else:
-                if node.right is not None:
-                    return get_node(node.right)
-                else:
-                    return None
-        node = get_node(self.root)
-        if node is not None:
-            return node.value
+                return index + _size(node.left)
+        raise ValueError('{} is not in the tree'.format(value))
 
     def print_tree(self):
         if self.root is not None:
@@ -77,56 +102,235 @@ class AvlTree:
             parent.left = new_node
         else:
             parent.right = new_node
+        ancestor = parent
+        while ancestor is not None:
+            ancestor.size += 1
+            ancestor = ancestor.parent
         self.modify_balance_factor(new_node)
-        self.update_indexes()
         self.count += 1
 
-    def modify_balance_factor(self, node):
-        """ Modifies the balance factor for each node upwards of the given one"""
+    def remove(self, value):
+        node = self._find_node(value)
+        if node is None:
+            return  # value is not in the tree
+        if node.left is not None and node.right is not None:
+            # take the in-order successor's value and remove the successor, which has no left child
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+            node.value = successor.value
+            node = successor
+        child = node.left if node.left is not None else node.right
         parent = node.parent
+        if child is not None:
+            child.parent = parent
         if parent is None:
-            return
-        direction = 'L' if parent.value > node.value else 'R'
-        if direction == 'L':
-            parent.balance_factor += 1
+            self.root = child
         else:
-            parent.balance_factor += -1
-        if parent.balance_factor != 0:
+            direction = 'L' if parent.left is node else 'R'
+            if direction == 'L':
+                parent.left = child
+            else:
+                parent.right = child
+            ancestor = parent
+            while ancestor is not None:
+                ancestor.size -= 1
+                ancestor = ancestor.parent
+            self.modify_balance_factor_after_removal(parent, direction)
+        self.count -= 1
+
+    def pop(self, index=-1):
+        """ Removes and returns the element at the given in-order index """
+        if not -self.count <= index < self.count:
+            raise IndexError('Index {idx} is out of range!'.format(idx=index))
+        value = self[index]
+        self.remove(value)
+        return value
+
+    def remove_range(self, start, end):
+        """
+        Removes every element between start and end (inclusive) and returns how many were removed.
+        The tree is split around the range and the two outer parts are joined back, so this is O(log n)
+        no matter how many elements get removed.
+        """
+        smaller, smaller_height, rest, rest_height = self._split(self.root, start, inclusive=False)
+        removed, _, greater, _ = self._split(rest.root, end, inclusive=True, height=rest_height)
+        tree, _ = self._concat(smaller, smaller_height, greater)
+        self.root, self.count = tree.root, tree.count
+        return removed.count
+
+    def split(self, key):
+        """
+        Splits the tree into a tree with the values smaller than the key and a tree with the rest, in O(log n).
+        The nodes are moved to the new trees, so this one is left empty
+        """
+        smaller, _, greater, _ = self._split(self.root, key, inclusive=False)
+        self.root, self.count = None, 0
+        return smaller, greater
+
+    @classmethod
+    def join(cls, left, right):
+        """
+        Joins two trees, where every value of the left one is smaller than the right one's, in O(log n).
+        The nodes are moved to the new tree, so both trees are left empty
+        """
+        if left.count and right.count and not left[-1] < right[0]:
+            raise Exception('The left tree\'s values must be smaller than the right tree\'s!')
+        root = cls._concat(left, _height(left.root), right)[0].root
+        left.root, left.count = None, 0
+        right.root, right.count = None, 0
+        return cls._from_root(root)
+
+    @classmethod
+    def _from_root(cls, root):
+        tree = cls()
+        if root is not None:
+            root.parent = None
+            tree.root = root
+            tree.count = root.size
+        return tree
+
+    @classmethod
+    def _split(cls, node, key, inclusive, height=None):
+        """
+        Splits the subtree into a tree with the values smaller than the key and one with the bigger values,
+        returns (smaller, its height, greater, its height). The key itself goes to the left tree if inclusive is True.
+        The height of the subtree is walked once at the top and then derived from the balance factors on the way down,
+        and each level joins a subtree whose height is close to the tree it's joined to, which sums up to O(log n)
+        """
+        if node is None:
+            return cls(), 0, cls(), 0
+        if height is None:
+            height = _height(node)
+        left, right = node.left, node.right
+        left_height = height - 1 if node.balance_factor >= 0 else height - 2
+        right_height = height - 1 if node.balance_factor <= 0 else height - 2
+        if node.value < key or (inclusive and node.value == key):
+            smaller, smaller_height, greater, greater_height = cls._split(right, key, inclusive, right_height)
+            smaller, smaller_height = cls._join(left, left_height, node, smaller.root, smaller_height)
+            return smaller, smaller_height, greater, greater_height
+        smaller, smaller_height, greater, greater_height = cls._split(left, key, inclusive, left_height)
+        greater, greater_height = cls._join(greater.root, greater_height, node, right, right_height)
+        return smaller, smaller_height, greater, greater_height
+
+    @classmethod
+    def _concat(cls, left_tree, left_height, right_tree):
+        """ Joins two trees where every value of the left one is smaller than the right one's, returns (tree, height) """
+        if right_tree.root is None:
+            return left_tree, left_height
+        smallest = right_tree[0]
+        right_tree.remove(smallest)
+        right_height = _height(right_tree.root)  # the removal may have lowered it
+        return cls._join(left_tree.root, left_height, Node(smallest, None), right_tree.root, right_height)
+
+    @classmethod
+    def _join(cls, left, left_height, pivot, right, right_height):
+        """
+        Joins the two subtrees of the given heights with the pivot between them, every value in left must be smaller
+        than the pivot and every value in right bigger. Returns the tree and its height - O(difference of heights)
+        """
+        for subtree in (left, right):
+            if subtree is not None:
+                subtree.parent = None
+        pivot.parent = None
+        if abs(left_height - right_height) <= 1:
+            pivot.left, pivot.right = left, right
+            for subtree in (left, right):
+                if subtree is not None:
+                    subtree.parent = pivot
+            pivot.balance_factor = left_height - right_height
+            pivot.update_size()
+            return cls._from_root(pivot), max(left_height, right_height) + 1
+
+        if left_height > right_height:
+            # go down the right spine of the left tree until a subtree as high as the right one
+            tree = cls._from_root(left)
+            parent, node, height = None, left, left_height
+            while height > right_height + 1:
+                height -= 2 if node.balance_factor == 1 else 1
+                parent, node = node, node.right
+            parent.right = pivot
+            pivot.left, pivot.right = node, right
+            pivot.balance_factor = height - right_height
+        else:
+            tree = cls._from_root(right)
+            parent, node, height = None, right, right_height
+            while height > left_height + 1:
+                height -= 2 if node.balance_factor == -1 else 1
+                parent, node = node, node.left
+            parent.left = pivot
+            pivot.left, pivot.right = left, node
+            pivot.balance_factor = left_height - height
+        pivot.parent = parent
+        for subtree in (pivot.left, pivot.right):
+            if subtree is not None:
+                subtree.parent = pivot
+        ancestor = pivot
+        while ancestor is not None:
+            ancestor.update_size()
+            ancestor = ancestor.parent
+        # the pivot's subtree is one level higher than the one it replaced
+        grew = tree.modify_balance_factor(pivot)
+        tree.count = tree.root.size
+        return tree, max(left_height, right_height) + (1 if grew else 0)
+
+    def modify_balance_factor(self, node):
+        """
+        Modifies the balance factor for each node upwards of the given one, whose subtree got higher.
+        Returns whether the whole tree got higher
+        """
+        parent = node.parent
+        while parent is not None:
+            if parent.left is node:
+                parent.balance_factor += 1
+            else:
+                parent.balance_factor -= 1
+            if parent.balance_factor == 0:
+                return False  # the parent's height did not change
             if parent.balance_factor in [-2, 2]:
-                # TODO: ROTATE :)
-                if parent.balance_factor == -2:
-                    parent_dir = 'R'
-                    if node.balance_factor == -1:
-                        node_dir = 'R'
-                    else:
-                        node_dir = 'L'
-                    general_dir = node_dir + parent_dir
-                    if general_dir == 'RR':
-                        self.left_rotation(node=node, parent=parent)
-                    elif general_dir == 'LR':
-                        # TODO: RIGHT-LEFT ROTATION
-                        self.right_rotation(node.left, node)
-                        self.left_rotation(node.parent, parent)
-
-                    else:
-                        raise Exception('Unexpected behavior!')
-                else:
-                    parent_dir = 'L'
-                    if node.balance_factor == -1:
-                        node_dir = 'R'
-                    else:
-                        node_dir = 'L'
-                    general_dir = node_dir + parent_dir
-                    if general_dir == 'LL':
-                        self.right_rotation(node, parent)
-                    elif general_dir == 'RL':
-                        # TODO: LEFT-RIGHT ROTATION
-                        self.left_rotation(node.right, node)
-                        self.right_rotation(node.parent, parent)
-                    else:
-                        raise Exception('Unexpected behavior!')
+                node = self.rotate(parent)
+                if node.balance_factor == 0:
+                    return False  # the rotation brought the height back
             else:
-                self.modify_balance_factor(parent)
+                node = parent
+            parent = node.parent
+        return True
+
+    def modify_balance_factor_after_removal(self, parent, direction):
+        """ Modifies the balance factor for each node upwards of the parent, whose subtree in direction got lower """
+        while parent is not None:
+            if direction == 'L':
+                parent.balance_factor -= 1
+            else:
+                parent.balance_factor += 1
+            if parent.balance_factor in [-1, 1]:
+                return  # the other side keeps the parent's height
+            node = parent
+            if parent.balance_factor in [-2, 2]:
+                node = self.rotate(parent)
+                if node.balance_factor != 0:
+                    return  # the rotation kept the height
+            parent = node.parent
+            if parent is not None:
+                direction = 'L' if parent.left is node else 'R'
+
+    def rotate(self, parent: Node) -> Node:
+        """ Rotates around a parent with a balance factor of 2 or -2, returns the new root of its subtree """
+        if parent.balance_factor == -2:
+            node = parent.right
+            if node.balance_factor == 1:
+                # right-left rotation
+                self.right_rotation(node.left, node)
+                node = parent.right
+            self.left_rotation(node, parent)
+        else:
+            node = parent.left
+            if node.balance_factor == -1:
+                # left-right rotation
+                self.left_rotation(node.right, node)
+                node = parent.left
+            self.right_rotation(node, parent)
+        return node
 
     def left_rotation(self, node: Node, parent: Node):
         grand_parent = parent.parent
@@ -140,12 +344,14 @@ class AvlTree:
         if grand_parent is None:
             self.root = node
         else:
-            if grand_parent.value > node.value:
+            if grand_parent.left is parent:
                 grand_parent.left = node
             else:
                 grand_parent.right = node
-        parent.balance_factor = 0
-        node.balance_factor = 0
+        parent.balance_factor += 1 - min(node.balance_factor, 0)
+        node.balance_factor += 1 + max(parent.balance_factor, 0)
+        parent.update_size()
+        node.update_size()
 
     def right_rotation(self, node: Node, parent: Node):
         grand_parent = parent.parent
@@ -159,12 +365,25 @@ class AvlTree:
         if grand_parent is None:
             self.root = node
         else:
-            if grand_parent.value > node.value:
+            if grand_parent.left is parent:
                 grand_parent.left = node
             else:
                 grand_parent.right = node
-        parent.balance_factor = 0
-        node.balance_factor = 0
+        parent.balance_factor -= 1 + max(node.balance_factor, 0)
+        node.balance_factor -= 1 - min(parent.balance_factor, 0)
+        parent.update_size()
+        node.update_size()
+
+    def _find_node(self, value):
+        node = self.root
+        while node is not None:
+            if value < node.value:
+                node = node.left
+            elif node.value < value:
+                node = node.right
+            else:
+                return node
+        return None
 
     def _find_parent(self, value):
         """ Find the appropriate parent for a newly-added value """
@@ -184,42 +403,74 @@ class AvlTree:
 
         return _find(self.root)
 
-    def update_indexes(self):
-        """ Go through the whole tree in-order and modify the indexes of each node """
-        index = 0
+    def range(self, start, end):
+        return list(self.irange(start, end))
 
-        def update_index(node):
-            nonlocal index
-            if node.left is not None:
-                update_index(node.left)
-            node.index = index
-            index += 1
-            if node.right is not None:
-                update_index(node.right)
-        update_index(self.root)
+    def irange(self, start=None, end=None, limit=None, offset=0, reverse=False):
+        """
+        Lazily yields the values between start and end (inclusive, None means unbounded),
+        skipping the first offset of them and stopping after limit values.
+        The offset is skipped by walking down the subtree sizes, so a page costs O(log n + limit)
+        """
+        if reverse:
+            index = (self.count if end is None else self._count_smaller(end, or_equal=True)) - 1 - offset
+        else:
+            index = (0 if start is None else self._count_smaller(start)) + offset
+        if not 0 <= index < self.count:
+            return
+        # go down to the first node, remembering the ones which come after it on the way
+        stack = []
+        node = self.root
+        while index != _size(node.left):
+            left_size = _size(node.left)
+            if index < left_size:
+                if not reverse:
+                    stack.append(node)
+                node = node.left
+            else:
+                if reverse:
+                    stack.append(node)
+                index -= left_size + 1
+                node = node.right
 
-    def range(self, start, end):
-        items = []
-        if self.root is None:
-            return []
-
-        def in_order_dfs(node):
-            nonlocal items
-            if node.value > start and node.left is not None:
-                in_order_dfs(node.left)
-            if end >= node.value >= start:
-                items.append(node.value)
-            if node.value < end and node.right is not None:
-                in_order_dfs(node.right)
-
-        in_order_dfs(self.root)
-        return items
-
-tr = AvlTree()
-tr.add(1)
-tr.add(2)
-tr.add(-4)
-tr.add(-50)
-tr.add(4)
-tr.add(3)
-print(tr[-1])
+        yielded = 0
+        while node is not None and (limit is None or yielded < limit):
+            if reverse and start is not None and node.value < start:
+                return
+            if not reverse and end is not None and node.value > end:
+                return
+            yield node.value
+            yielded += 1
+            # the next node is the outermost one in the subtree on the far side, or the last one remembered
+            child = node.left if reverse else node.right
+            while child is not None:
+                stack.append(child)
+                child = child.right if reverse else child.left
+            node = stack.pop() if stack else None
+
+    def _count_smaller(self, value, or_equal=False):
+        """ Returns the count of values smaller than (or equal to) the given one """
+        count = 0
+        node = self.root
+        while node is not None:
+            if node.value < value or (or_equal and node.value == value):
+                count += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+
+def main():
+    tr = AvlTree()
+    tr.add(1)
+    tr.add(2)
+    tr.add(-4)
+    tr.add(-50)
+    tr.add(4)
+    tr.add(3)
+    print(tr[-1])
+
+
+if __name__ == '__main__':
+    main()
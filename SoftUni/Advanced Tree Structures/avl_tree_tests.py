@@ -1,6 +1,6 @@
 import unittest
 import random
-from avl_tree import AvlTree
+from avl_tree import AvlTree, _height
 
 class AvlInsertTests(unittest.TestCase):
     def test_add_several_elements_should_increase_count(self):
@@ -74,5 +74,241 @@ class AvlInsertTests(unittest.TestCase):
         contains_two = 2 in avl_tree
         self.assertFalse(contains_two)
 
+
+class AvlIndexTests(unittest.TestCase):
+    def assertValidSizes(self, node):
+        if node is None:
+            return 0
+        size = 1 + self.assertValidSizes(node.left) + self.assertValidSizes(node.right)
+        self.assertEqual(node.size, size)
+        return size
+
+    def test_getitem_should_return_in_order_element(self):
+        nums = random.sample(range(-500, 500), 300)
+        avl_tree = AvlTree()
+        for num in nums:
+            avl_tree.add(num)
+        self.assertValidSizes(avl_tree.root)
+        expected_items = list(sorted(nums))
+        for index in range(len(expected_items)):
+            self.assertEqual(avl_tree[index], expected_items[index])
+            self.assertEqual(avl_tree[-index - 1], expected_items[-index - 1])
+
+    def test_getitem_out_of_range_should_return_none(self):
+        avl_tree = AvlTree()
+        for num in [3, 1, 2]:
+            avl_tree.add(num)
+        self.assertIsNone(avl_tree[3])
+        self.assertIsNone(avl_tree[-4])
+
+    def test_index_of_should_return_in_order_index(self):
+        nums = random.sample(range(1000), 300)
+        avl_tree = AvlTree()
+        for num in nums:
+            avl_tree.add(num)
+        for index, num in enumerate(sorted(nums)):
+            self.assertEqual(avl_tree.index_of(num), index)
+
+    def test_index_of_missing_element_should_raise(self):
+        avl_tree = AvlTree()
+        for num in [10, 20, 30]:
+            avl_tree.add(num)
+        self.assertRaises(ValueError, avl_tree.index_of, 15)
+
+
+class AvlTestCase(unittest.TestCase):
+    def assertValidAvlTree(self, avl_tree):
+        def check(node, parent):
+            if node is None:
+                return 0, 0
+            self.assertIs(node.parent, parent)
+            left_height, left_size = check(node.left, node)
+            right_height, right_size = check(node.right, node)
+            self.assertEqual(node.balance_factor, left_height - right_height)
+            self.assertIn(node.balance_factor, [-1, 0, 1])
+            self.assertEqual(node.size, left_size + right_size + 1)
+            return max(left_height, right_height) + 1, node.size
+        _, size = check(avl_tree.root, None)
+        self.assertEqual(size, len(avl_tree))
+        items = list(avl_tree)
+        self.assertEqual(items, sorted(set(items)))
+
+
+class AvlRemoveTests(AvlTestCase):
+    def test_add_many_elements_should_stay_balanced(self):
+        avl_tree = AvlTree()
+        for num in random.sample(range(5000), 2000):
+            avl_tree.add(num)
+        self.assertValidAvlTree(avl_tree)
+
+    def test_remove_should_remove_elements(self):
+        nums = random.sample(range(2000), 1000)
+        avl_tree = AvlTree()
+        for num in nums:
+            avl_tree.add(num)
+        expected_items = set(nums)
+        for num in nums[::2]:
+            avl_tree.remove(num)
+            expected_items.remove(num)
+        self.assertValidAvlTree(avl_tree)
+        self.assertEqual(list(avl_tree), list(sorted(expected_items)))
+        self.assertEqual(len(avl_tree), len(expected_items))
+
+    def test_remove_all_elements_should_empty_the_tree(self):
+        nums = list(range(100))
+        avl_tree = AvlTree()
+        for num in nums:
+            avl_tree.add(num)
+        random.shuffle(nums)
+        for num in nums:
+            avl_tree.remove(num)
+            self.assertValidAvlTree(avl_tree)
+        self.assertIsNone(avl_tree.root)
+        self.assertEqual(list(avl_tree), [])
+
+    def test_remove_missing_element_should_do_nothing(self):
+        avl_tree = AvlTree()
+        for num in [1, 2, 3]:
+            avl_tree.add(num)
+        avl_tree.remove(4)
+        self.assertEqual(list(avl_tree), [1, 2, 3])
+
+    def test_pop_should_remove_element_at_index(self):
+        avl_tree = AvlTree()
+        for num in [5, 1, 4, 2, 3]:
+            avl_tree.add(num)
+        self.assertEqual(avl_tree.pop(), 5)
+        self.assertEqual(avl_tree.pop(0), 1)
+        self.assertEqual(avl_tree.pop(1), 3)
+        self.assertEqual(list(avl_tree), [2, 4])
+        self.assertRaises(IndexError, avl_tree.pop, 2)
+        self.assertValidAvlTree(avl_tree)
+
+    def test_remove_range_should_remove_inclusive_range(self):
+        for _ in range(50):
+            nums = random.sample(range(1000), random.randint(0, 300))
+            start = random.randint(-10, 1000)
+            end = random.randint(start, 1010)
+            avl_tree = AvlTree()
+            for num in nums:
+                avl_tree.add(num)
+            removed = avl_tree.remove_range(start, end)
+            expected_items = [num for num in sorted(nums) if not start <= num <= end]
+            self.assertEqual(list(avl_tree), expected_items)
+            self.assertEqual(removed, len(nums) - len(expected_items))
+            self.assertValidAvlTree(avl_tree)
+
+    def test_tree_should_work_after_remove_range(self):
+        avl_tree = AvlTree()
+        for num in range(200):
+            avl_tree.add(num)
+        avl_tree.remove_range(50, 149)
+        for num in range(60, 70):
+            avl_tree.add(num)
+        avl_tree.remove(0)
+        self.assertEqual(list(avl_tree), list(range(1, 50)) + list(range(60, 70)) + list(range(150, 200)))
+        self.assertEqual(avl_tree[49], 60)
+        self.assertValidAvlTree(avl_tree)
+
+class AvlRangeTests(unittest.TestCase):
+    def setUp(self):
+        self.nums = list(sorted(random.sample(range(1000), 300)))
+        self.avl_tree = AvlTree()
+        for num in self.nums:
+            self.avl_tree.add(num)
+
+    def test_range_should_return_inclusive_range(self):
+        self.assertEqual(self.avl_tree.range(100, 500), [num for num in self.nums if 100 <= num <= 500])
+        self.assertEqual(AvlTree().range(1, 2), [])
+
+    def test_irange_should_be_lazy(self):
+        values = self.avl_tree.irange()
+        self.assertEqual(next(values), self.nums[0])
+        self.assertEqual(next(values), self.nums[1])
+
+    def test_irange_with_limit_and_offset(self):
+        for _ in range(100):
+            start = random.randint(-10, 1010)
+            end = random.randint(start - 10, 1010)
+            limit = random.choice([None, 0, 1, 10, 50])
+            offset = random.randint(0, 50)
+            expected_items = [num for num in self.nums if start <= num <= end]
+            for reverse in [False, True]:
+                expected = expected_items[::-1] if reverse else expected_items
+                expected = expected[offset:] if limit is None else expected[offset:offset + limit]
+                self.assertEqual(list(self.avl_tree.irange(start, end, limit, offset, reverse)), expected)
+
+    def test_irange_without_bounds(self):
+        self.assertEqual(list(self.avl_tree.irange()), self.nums)
+        self.assertEqual(list(self.avl_tree.irange(reverse=True)), self.nums[::-1])
+        self.assertEqual(list(self.avl_tree.irange(start=500, limit=5)), [num for num in self.nums if num >= 500][:5])
+        self.assertEqual(list(self.avl_tree.irange(end=500, reverse=True, offset=3)),
+                         [num for num in self.nums if num <= 500][::-1][3:])
+        self.assertEqual(list(self.avl_tree.irange(offset=300)), [])
+        self.assertEqual(list(AvlTree().irange()), [])
+
+class AvlSplitJoinTests(AvlTestCase):
+    def test_split_and_concat_should_return_the_heights(self):
+        """ The heights are derived on the way down instead of walked at every level, they must match the real ones """
+        for _ in range(100):
+            tree = AvlTree()
+            for num in random.sample(range(1000), random.randint(0, 300)):
+                tree.add(num)
+            key = random.randint(-5, 1005)
+            smaller, smaller_height, greater, greater_height = AvlTree._split(tree.root, key, random.random() < 0.5)
+            self.assertEqual(smaller_height, _height(smaller.root))
+            self.assertEqual(greater_height, _height(greater.root))
+            joined, joined_height = AvlTree._concat(smaller, smaller_height, greater)
+            self.assertEqual(joined_height, _height(joined.root))
+            self.assertValidAvlTree(joined)
+
+    def test_split_should_partition_by_key(self):
+        for _ in range(30):
+            nums = random.sample(range(1000), random.randint(0, 300))
+            key = random.randint(-10, 1010)
+            avl_tree = AvlTree()
+            for num in nums:
+                avl_tree.add(num)
+            smaller, greater = avl_tree.split(key)
+            self.assertEqual(list(smaller), [num for num in sorted(nums) if num < key])
+            self.assertEqual(list(greater), [num for num in sorted(nums) if num >= key])
+            self.assertEqual(len(avl_tree), 0)
+            self.assertValidAvlTree(smaller)
+            self.assertValidAvlTree(greater)
+
+    def test_join_should_concatenate_trees(self):
+        for _ in range(30):
+            left, right = AvlTree(), AvlTree()
+            left_nums = random.sample(range(500), random.randint(0, 300))
+            right_nums = random.sample(range(500, 1000), random.randint(0, 30))
+            for num in left_nums:
+                left.add(num)
+            for num in right_nums:
+                right.add(num)
+            joined = AvlTree.join(left, right)
+            self.assertEqual(list(joined), list(sorted(left_nums + right_nums)))
+            self.assertEqual(len(left), 0)
+            self.assertEqual(len(right), 0)
+            self.assertValidAvlTree(joined)
+            joined.add(-1)
+            self.assertEqual(joined[0], -1)
+
+    def test_join_overlapping_trees_should_raise(self):
+        left, right = AvlTree(), AvlTree()
+        for num in [1, 5]:
+            left.add(num)
+        for num in [3, 10]:
+            right.add(num)
+        self.assertRaises(Exception, AvlTree.join, left, right)
+
+    def test_split_and_join_should_restore_tree(self):
+        avl_tree = AvlTree()
+        for num in range(1000):
+            avl_tree.add(num)
+        smaller, greater = avl_tree.split(400)
+        joined = AvlTree.join(smaller, greater)
+        self.assertEqual(list(joined), list(range(1000)))
+        self.assertValidAvlTree(joined)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
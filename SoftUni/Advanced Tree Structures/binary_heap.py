@@ -1,59 +1,313 @@
+import operator
+
+
 class BinaryHeap:
-    def __init__(self, elements=None):
+    """
+    A max-heap by default, order='min' makes it a min-heap.
+    arity sets how many children each node has, a 4-ary heap is half as high as a binary one.
+    key is an optional function that returns the value to compare by, it's called once per element
+    and the result is kept in a list parallel to the elements.
+    """
+    def __init__(self, elements=None, arity=2, order='max', key=None):
+        if arity < 2:
+            raise Exception('The arity must be at least 2!')
+        if order not in ('max', 'min'):
+            raise Exception('The order must be either \'max\' or \'min\'!')
+        self.arity = arity
+        self.order = order
+        self.key = key
+        # _higher(a, b) tells if a should be above b
+        self._higher = operator.gt if order == 'max' else operator.lt
         self._elements = []
+        self._keys = self._elements if key is None else []  # without a key the elements are compared directly
         self.count = 0
-        if elements is not None and isinstance(elements, list):
-            for el in elements:
-                self.insert(el)
+        if elements is not None:
+            self._elements = list(elements)
+            self._keys = self._elements if key is None else [key(el) for el in self._elements]
+            self.count = len(self._elements)
+            self._heapify()
 
     def __len__(self):
         return self.count
 
     def insert(self, value):
         """ Add the value at the end and heapify up from there """
-        self._elements.append(value)
-        new_value_idx = len(self._elements) - 1
-        self._heapify_up(new_value_idx)
-        self.count += 1
+        self._append(value, value if self.key is None else self.key(value))
 
     def extract_max(self):
-        """ Remove the max element by placing the last element on it's place and heapifying down"""
+        """ Remove the max (the min with order='min') element by placing the last element on it's place and heapifying down"""
+        last_el = self._elements.pop()
+        last_key = self._keys.pop() if self._keys is not self._elements else last_el
+        self.count -= 1
+        if not self._elements:
+            return last_el
         max_el = self._elements[0]
-        last_idx = len(self._elements) - 1
-
-        self._elements[0] = self._elements[last_idx]
-        self._elements = self._elements[:last_idx]
+        self._elements[0] = last_el
+        self._keys[0] = last_key
         self._heapify_down(0)
-        self.count -= 1
 
         return max_el
 
+    def peek(self):
+        """ Returns the max element without removing it """
+        return self._elements[0]
+
+    def pushpop(self, value):
+        """ Insert the value and extract the max, faster than calling both """
+        key = value if self.key is None else self.key(value)
+        if not self._elements or not self._higher(self._keys[0], key):
+            return value  # the value would be extracted right away, the heap stays the same
+        return self._replace_top(value, key)
+
+    def replace(self, value):
+        """ Extract the max and insert the value, faster than calling both. Unlike pushpop, the value may be returned only later """
+        return self._replace_top(value, value if self.key is None else self.key(value))
+
+    def nlargest(self, k):
+        """
+        Returns the k biggest elements in descending order without modifying the heap (the smallest with order='min').
+        The next biggest element is always a child of one that's already taken,
+        so only the frontier of those children is kept in a heap of its own - O(k log k)
+        """
+        return [self._elements[idx] for idx in self._nlargest_indexes(k)]
+
+    def merge(self, other):
+        """ Adds all the elements of the other heap to this one, the other heap stays the same """
+        if other.order != self.order:
+            raise Exception('Cannot merge a max-heap with a min-heap!')
+        total = self.count + other.count
+        self._elements.extend(other._elements)
+        if self._keys is not self._elements:
+            self._keys.extend(other._keys if other._keys is not other._elements else map(self.key, other._elements))
+        if other.count * total.bit_length() > total:
+            # heapifying everything again is O(n + m), cheaper than m inserts of O(log(n + m)) each
+            self.count = total
+            self._heapify()
+        else:
+            for idx in range(self.count, total):
+                self._heapify_up(idx)
+            self.count = total
+
+    def _append(self, value, key):
+        self._elements.append(value)
+        if self._keys is not self._elements:
+            self._keys.append(key)
+        self._heapify_up(len(self._elements) - 1)
+        self.count += 1
+
+    def _replace_top(self, value, key):
+        max_el = self._elements[0]
+        self._elements[0] = value
+        self._keys[0] = key
+        self._heapify_down(0)
+        return max_el
+
+    def _nlargest_indexes(self, k):
+        indexes = []
+        if not self._elements:
+            return indexes
+        frontier = BinaryHeap(order=self.order)
+        frontier.insert((self._keys[0], 0))
+        while frontier.count > 0 and len(indexes) < k:
+            _, idx = frontier.extract_max()
+            indexes.append(idx)
+            first_child_idx = (idx*self.arity) + 1
+            for child_idx in range(first_child_idx, min(first_child_idx + self.arity, self.count)):
+                frontier.insert((self._keys[child_idx], child_idx))
+        return indexes
+
+    def _heapify(self):
+        """ Floyd's bottom-up heapify, every parent is heapified down starting from the last one - O(n) """
+        for idx in reversed(range((len(self._elements) + self.arity - 2) // self.arity)):
+            self._heapify_down(idx)
+
     def _heapify_up(self, idx):
-        parent_idx = (idx - 1) // 2
-        if idx < 0 or parent_idx < 0:
-            return
-        if self._elements[parent_idx] < self._elements[idx]:
-            # swap
-            self._elements[parent_idx], self._elements[idx] = self._elements[idx], self._elements[parent_idx]
-            self._heapify_up(parent_idx)
+        """
+        Move the value up while it's higher than its parent.
+        The parents are shifted down into the hole and the value is written once at the end, instead of swapping.
+        The elements are moved along with the keys only when they're kept apart
+        """
+        keys, higher, arity = self._keys, self._higher, self.arity
+        elements = self._elements if keys is not self._elements else None
+        key = keys[idx]
+        value = elements[idx] if elements is not None else None
+        while idx > 0:
+            parent_idx = (idx - 1) // arity
+            if not higher(key, keys[parent_idx]):
+                break
+            keys[idx] = keys[parent_idx]
+            if elements is not None:
+                elements[idx] = elements[parent_idx]
+            idx = parent_idx
+        keys[idx] = key
+        if elements is not None:
+            elements[idx] = value
 
     def _heapify_down(self, idx):
         """
-        Heapify the value down by getting it's bigger child and swapping values. Then continue heapifying down
-        until we find children that are not bigger than the value.
+        Heapify the value down by getting it's highest child and moving it up. Then continue heapifying down
+        until we find children that are not higher than the value.
         """
-        l_child_idx, r_child_idx = (idx*2) + 1, (idx*2) + 2
+        keys, higher, arity = self._keys, self._higher, self.arity
+        elements = self._elements if keys is not self._elements else None
+        size = len(keys)
+        key = keys[idx]
+        value = elements[idx] if elements is not None else None
+        first_child_idx = (idx*arity) + 1
+        while first_child_idx < size:
+            # get the index of the highest child
+            top_idx = first_child_idx
+            if arity == 2:
+                # a range() per level doubles the time of a binary heap's sift
+                if first_child_idx + 1 < size and higher(keys[first_child_idx + 1], keys[first_child_idx]):
+                    top_idx = first_child_idx + 1
+            else:
+                for child_idx in range(first_child_idx + 1, min(first_child_idx + arity, size)):
+                    if higher(keys[child_idx], keys[top_idx]):
+                        top_idx = child_idx
+            # check if the child is higher than the value, if not, stop
+            if not higher(keys[top_idx], key):
+                break
+
+            keys[idx] = keys[top_idx]
+            if elements is not None:
+                elements[idx] = elements[top_idx]
+            idx = top_idx
+            first_child_idx = (idx*arity) + 1
+        keys[idx] = key
+        if elements is not None:
+            elements[idx] = value
+
+
+class IndexedBinaryHeap(BinaryHeap):
+    """
+    A heap of handles, ordered by the priority given to each one.
+    The array index of every handle is kept in a dict and updated whenever the handle moves,
+    so a queued handle can be found in O(1) and have its priority changed or be removed in O(log n).
+    Handles must be hashable and unique.
+    """
+    def __init__(self, items=None, arity=2, order='max'):
+        """ items is an iterable of (handle, priority) pairs """
+        super().__init__(arity=arity, order=order)
+        self._keys = []  # the priorities, the handles are the elements
+        self._positions = {}
+        if items is not None:
+            for handle, priority in items:
+                self.__check_new(handle)
+                self._positions[handle] = len(self._elements)
+                self._elements.append(handle)
+                self._keys.append(priority)
+            self.count = len(self._elements)
+            self._heapify()
+
+    def __contains__(self, handle):
+        return handle in self._positions
+
+    def insert(self, handle, priority):
+        self.__check_new(handle)
+        self._positions[handle] = len(self._elements)
+        self._append(handle, priority)
+
+    def extract_max(self):
+        """ Removes the handle with the max priority and returns it """
+        max_handle = self._elements[0]
+        self.remove(max_handle)
+        return max_handle
+
+    def peek(self):
+        """ Returns the handle with the max priority without removing it """
+        return self._elements[0]
+
+    def priority(self, handle):
+        return self._keys[self._positions[handle]]
+
+    def pushpop(self, handle, priority):
+        self.__check_new(handle)
+        if not self._elements or not self._higher(self._keys[0], priority):
+            return handle
+        return self._replace_top(handle, priority)
 
-        if l_child_idx < len(self._elements):
-            # get the index of the bigger child
-            if r_child_idx < len(self._elements) and self._elements[r_child_idx] > self._elements[l_child_idx]:
-                max_idx = r_child_idx
+    def replace(self, handle, priority):
+        self.__check_new(handle)
+        return self._replace_top(handle, priority)
+
+    def nlargest(self, k):
+        """ Returns the k handles with the biggest priorities in descending order """
+        return [self._elements[idx] for idx in self._nlargest_indexes(k)]
+
+    def merge(self, other):
+        for handle in other._elements:
+            self.__check_new(handle)
+        for handle in other._elements:
+            self._positions[handle] = len(self._positions)
+        super().merge(other)
+
+    def update_priority(self, handle, priority):
+        idx = self._positions[handle]
+        old_priority = self._keys[idx]
+        self._keys[idx] = priority
+        if self._higher(priority, old_priority):
+            self._heapify_up(idx)
+        else:
+            self._heapify_down(idx)
+
+    def remove(self, handle):
+        """ Moves the last handle in the removed one's place and heapifies it up or down, whichever it needs """
+        idx = self._positions.pop(handle)
+        last_priority, last_handle = self._keys.pop(), self._elements.pop()
+        self.count -= 1
+        if idx == len(self._elements):
+            return  # the last one was removed
+        self._keys[idx], self._elements[idx] = last_priority, last_handle
+        self._positions[last_handle] = idx
+        if idx > 0 and self._higher(last_priority, self._keys[(idx - 1) // self.arity]):
+            self._heapify_up(idx)
+        else:
+            self._heapify_down(idx)
+
+    def _replace_top(self, handle, priority):
+        del self._positions[self._elements[0]]
+        self._positions[handle] = 0
+        return super()._replace_top(handle, priority)
+
+    def _heapify_up(self, idx):
+        keys, handles, positions, higher, arity = self._keys, self._elements, self._positions, self._higher, self.arity
+        priority, handle = keys[idx], handles[idx]
+        while idx > 0:
+            parent_idx = (idx - 1) // arity
+            if not higher(priority, keys[parent_idx]):
+                break
+            keys[idx] = keys[parent_idx]
+            handles[idx] = handles[parent_idx]
+            positions[handles[idx]] = idx
+            idx = parent_idx
+        keys[idx], handles[idx] = priority, handle
+        positions[handle] = idx
+
+    def _heapify_down(self, idx):
+        keys, handles, positions, higher, arity = self._keys, self._elements, self._positions, self._higher, self.arity
+        size = len(keys)
+        priority, handle = keys[idx], handles[idx]
+        first_child_idx = (idx*arity) + 1
+        while first_child_idx < size:
+            top_idx = first_child_idx
+            if arity == 2:
+                if first_child_idx + 1 < size and higher(keys[first_child_idx + 1], keys[first_child_idx]):
+                    top_idx = first_child_idx + 1
             else:
-                max_idx = l_child_idx
-            # check if the child is bigger than the value, if not, stop
-            if self._elements[max_idx] <= self._elements[idx]:
-                return
-
-            # swap
-            self._elements[idx], self._elements[max_idx] = self._elements[max_idx], self._elements[idx]
-            self._heapify_down(max_idx)
+                for child_idx in range(first_child_idx + 1, min(first_child_idx + arity, size)):
+                    if higher(keys[child_idx], keys[top_idx]):
+                        top_idx = child_idx
+            if not higher(keys[top_idx], priority):
+                break
+            keys[idx] = keys[top_idx]
+            handles[idx] = handles[top_idx]
+            positions[handles[idx]] = idx
+            idx = top_idx
+            first_child_idx = (idx*arity) + 1
+        keys[idx], handles[idx] = priority, handle
+        positions[handle] = idx
+
+    def __check_new(self, handle):
+        if handle in self._positions:
+            raise Exception('Handle {handle} is already in the heap!'.format(handle=handle))
@@ -0,0 +1,112 @@
+import heapq
+import random
+import sys
+from datetime import datetime
+from binary_heap import BinaryHeap
+
+
+# python binary_heap_benchmark.py 10000000
+
+
+def timed(function):
+    start = datetime.now()
+    function()
+    return datetime.now() - start
+
+
+def heapq_benchmark(nums, new_nums):
+    heap = [-num for num in nums]  # heapq is a min-heap
+    times = {'heapify': timed(lambda: heapq.heapify(heap))}
+
+    def push():
+        for num in new_nums:
+            heapq.heappush(heap, -num)
+
+    def pop():
+        for _ in range(len(new_nums)):
+            heapq.heappop(heap)
+
+    def pushpop():
+        for num in new_nums:
+            heapq.heappushpop(heap, -num)
+
+    def replace():
+        for num in new_nums:
+            heapq.heapreplace(heap, -num)
+
+    times['push'] = timed(push)
+    times['pop'] = timed(pop)
+    times['pushpop'] = timed(pushpop)
+    times['replace'] = timed(replace)
+    times['nlargest(100)'] = timed(lambda: heapq.nsmallest(100, heap))
+    return times
+
+
+def binary_heap_benchmark(nums, new_nums):
+    heap = None
+
+    def heapify():
+        nonlocal heap
+        heap = BinaryHeap(nums)
+
+    times = {'heapify': timed(heapify)}
+
+    def push():
+        for num in new_nums:
+            heap.insert(num)
+
+    def pop():
+        for _ in range(len(new_nums)):
+            heap.extract_max()
+
+    def pushpop():
+        for num in new_nums:
+            heap.pushpop(num)
+
+    def replace():
+        for num in new_nums:
+            heap.replace(num)
+
+    times['push'] = timed(push)
+    times['pop'] = timed(pop)
+    times['pushpop'] = timed(pushpop)
+    times['replace'] = timed(replace)
+    times['nlargest(100)'] = timed(lambda: heap.nlargest(100))
+    return times
+
+
+def main():
+    test_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    operation_count = min(test_count, 1000000)
+    nums = [random.random() for _ in range(test_count)]
+    new_nums = [random.random() for _ in range(operation_count)]
+    heapq_times = heapq_benchmark(nums, new_nums)
+    binary_heap_times = binary_heap_benchmark(nums, new_nums)
+    print("Elements: {}, operations: {}".format(test_count, operation_count))
+    print("{:<15}{:<18}{}".format('', 'heapq', 'BinaryHeap'))
+    for operation in heapq_times:
+        print("{:<15}{:<18}{}".format(operation, str(heapq_times[operation]), binary_heap_times[operation]))
+
+
+if __name__ == '__main__':
+    main()
+"""
+Elements: 10000000, operations: 1000000
+               heapq             BinaryHeap
+heapify        0:00:00.661793    0:00:03.185845
+push           0:00:00.201323    0:00:00.627571
+pop            0:00:03.475815    0:00:10.797631
+pushpop        0:00:02.674449    0:00:07.002907
+replace        0:00:02.772469    0:00:07.362533
+nlargest(100)  0:00:00.828294    0:00:00.000398
+
+heapq is written in C, so it stays 3-5 times faster. nlargest walks only the top of the heap,
+while heapq.nsmallest has to scan the whole list.
+
+The old BinaryHeap (an insert per element, extract_max copying the list) at 100 000 elements:
+    build              0:00:00.072597
+    extract all        0:00:32.787971
+vs Floyd's heapify and extract_max popping the last element:
+    build              0:00:00.034239
+    extract all        0:00:00.476202
+"""
@@ -1,5 +1,6 @@
 import unittest
-from binary_heap import BinaryHeap
+import random
+from binary_heap import BinaryHeap, IndexedBinaryHeap
 
 
 class BinaryHeapTests(unittest.TestCase):
@@ -24,6 +25,165 @@ class BinaryHeapTests(unittest.TestCase):
             result.append(heap.extract_max())
 
         self.assertEqual(result, expected)
+    def test_build_heap_from_any_iterable(self):
+        heap = BinaryHeap(range(10))
+        self.assertEqual(len(heap), 10)
+        self.assertEqual(heap.extract_max(), 9)
+
+    def test_build_big_heap_should_extract_sorted_elements(self):
+        nums = [random.randint(-1000, 1000) for _ in range(1000)]
+        heap = BinaryHeap(nums)
+        result = [heap.extract_max() for _ in range(len(nums))]
+        self.assertEqual(result, sorted(nums, reverse=True))
+        self.assertEqual(len(heap), 0)
+
+    def test_peek_should_not_remove_max(self):
+        heap = BinaryHeap([1, 5, 3])
+        self.assertEqual(heap.peek(), 5)
+        self.assertEqual(len(heap), 3)
+
+    def test_pushpop(self):
+        heap = BinaryHeap([1, 5, 3])
+        self.assertEqual(heap.pushpop(10), 10)
+        self.assertEqual(heap.pushpop(4), 5)
+        self.assertEqual(heap.pushpop(0), 4)
+        self.assertEqual(BinaryHeap().pushpop(2), 2)
+        self.assertEqual([heap.extract_max() for _ in range(len(heap))], [3, 1, 0])
+
+    def test_replace_should_return_max_even_if_value_is_bigger(self):
+        heap = BinaryHeap([1, 5, 3])
+        self.assertEqual(heap.replace(10), 5)
+        self.assertEqual(heap.replace(2), 10)
+        self.assertEqual([heap.extract_max() for _ in range(len(heap))], [3, 2, 1])
+
+    def test_nlargest_should_not_modify_heap(self):
+        nums = [random.randint(-1000, 1000) for _ in range(500)]
+        heap = BinaryHeap(nums)
+        for k in [0, 1, 10, 500, 600]:
+            self.assertEqual(heap.nlargest(k), sorted(nums, reverse=True)[:k])
+        self.assertEqual(len(heap), 500)
+        self.assertEqual(BinaryHeap().nlargest(3), [])
+
+    def test_merge_should_contain_both_heaps(self):
+        for first_count, second_count in [(100, 3), (3, 100), (0, 10), (10, 0)]:
+            first = [random.randint(0, 100) for _ in range(first_count)]
+            second = [random.randint(0, 100) for _ in range(second_count)]
+            heap, other = BinaryHeap(first), BinaryHeap(second)
+            heap.merge(other)
+            self.assertEqual(len(heap), first_count + second_count)
+            self.assertEqual(len(other), second_count)
+            self.assertEqual([heap.extract_max() for _ in range(len(heap))], sorted(first + second, reverse=True))
+    def test_min_heap_with_different_arities(self):
+        nums = [random.randint(-1000, 1000) for _ in range(500)]
+        for arity in [2, 3, 4, 8]:
+            heap = BinaryHeap(nums[:250], arity=arity, order='min')
+            for num in nums[250:]:
+                heap.insert(num)
+            self.assertEqual(heap.peek(), min(nums))
+            self.assertEqual(heap.nlargest(10), sorted(nums)[:10])
+            self.assertEqual([heap.extract_max() for _ in range(len(heap))], sorted(nums))
+
+    def test_max_heap_with_different_arities(self):
+        nums = [random.randint(-1000, 1000) for _ in range(500)]
+        for arity in [3, 4, 8]:
+            heap = BinaryHeap(nums, arity=arity)
+            self.assertEqual(heap.pushpop(5000), 5000)
+            self.assertEqual(heap.replace(-5000), max(nums))
+            self.assertEqual([heap.extract_max() for _ in range(len(heap))], sorted(nums, reverse=True)[1:] + [-5000])
+
+    def test_key_should_be_called_once_per_element(self):
+        calls = []
+
+        def key(word):
+            calls.append(word)
+            return len(word)
+        words = ['ccc', 'a', 'dddd', 'bb']
+        heap = BinaryHeap(words[:2], key=key, order='min')
+        heap.insert(words[2])
+        heap.insert(words[3])
+        self.assertEqual([heap.extract_max() for _ in range(len(heap))], ['a', 'bb', 'ccc', 'dddd'])
+        self.assertEqual(calls, words)
+
+    def test_merge_heaps_with_keys(self):
+        heap = BinaryHeap(['aaa', 'b'], key=len)
+        heap.merge(BinaryHeap(['cc', 'dddd']))
+        self.assertEqual([heap.extract_max() for _ in range(len(heap))], ['dddd', 'aaa', 'cc', 'b'])
+        self.assertRaises(Exception, heap.merge, BinaryHeap(order='min'))
+
+    def test_invalid_arity_or_order_should_raise(self):
+        self.assertRaises(Exception, BinaryHeap, arity=1)
+        self.assertRaises(Exception, BinaryHeap, order='biggest')
+
+
+class IndexedBinaryHeapTests(unittest.TestCase):
+    def assertValidHeap(self, heap):
+        for idx, handle in enumerate(heap._elements):
+            self.assertEqual(heap._positions[handle], idx)
+            if idx > 0:
+                self.assertLessEqual(heap._keys[idx], heap._keys[(idx - 1) // 2])
+        self.assertEqual(len(heap._positions), len(heap))
+
+    def test_extract_max_should_return_handles_by_priority(self):
+        priorities = {'a': 3, 'b': 10, 'c': -1, 'd': 7}
+        heap = IndexedBinaryHeap(priorities.items())
+        self.assertEqual(heap.peek(), 'b')
+        self.assertEqual(heap.priority('d'), 7)
+        self.assertEqual([heap.extract_max() for _ in range(len(heap))], ['b', 'd', 'a', 'c'])
+
+    def test_contains(self):
+        heap = IndexedBinaryHeap()
+        heap.insert('job', 5)
+        self.assertIn('job', heap)
+        heap.extract_max()
+        self.assertNotIn('job', heap)
+
+    def test_insert_existing_handle_should_raise(self):
+        heap = IndexedBinaryHeap([('a', 1)])
+        self.assertRaises(Exception, heap.insert, 'a', 2)
+
+    def test_update_priority_and_remove(self):
+        priorities = {handle: random.randint(0, 1000) for handle in range(500)}
+        heap = IndexedBinaryHeap(priorities.items())
+        for _ in range(1000):
+            handle = random.choice(list(priorities))
+            if random.random() < 0.2:
+                heap.remove(handle)
+                del priorities[handle]
+            else:
+                priorities[handle] = random.randint(0, 1000)
+                heap.update_priority(handle, priorities[handle])
+            if not priorities:
+                break
+        self.assertValidHeap(heap)
+        result = []
+        while len(heap) > 0:
+            handle = heap.extract_max()
+            result.append(priorities[handle])
+            self.assertNotIn(handle, heap)
+        self.assertEqual(result, sorted(priorities.values(), reverse=True))
+
+    def test_pushpop_replace_nlargest_and_merge(self):
+        heap = IndexedBinaryHeap([('a', 1), ('b', 5), ('c', 3)])
+        self.assertEqual(heap.pushpop('d', 10), 'd')
+        self.assertEqual(heap.pushpop('d', 4), 'b')
+        self.assertEqual(heap.replace('e', 0), 'd')
+        self.assertEqual(heap.nlargest(2), ['c', 'a'])
+        heap.merge(IndexedBinaryHeap([('f', 2), ('g', 8)]))
+        self.assertValidHeap(heap)
+        self.assertEqual([heap.extract_max() for _ in range(len(heap))], ['g', 'c', 'f', 'a', 'e'])
+    def test_min_heap_with_arity(self):
+        priorities = {handle: random.randint(0, 1000) for handle in range(300)}
+        heap = IndexedBinaryHeap(priorities.items(), arity=4, order='min')
+        for handle in range(0, 300, 3):
+            priorities[handle] = random.randint(0, 1000)
+            heap.update_priority(handle, priorities[handle])
+        for handle in range(1, 300, 7):
+            heap.remove(handle)
+            del priorities[handle]
+        result = [heap.priority(heap.peek())]
+        result += [priorities[heap.extract_max()] for _ in range(len(heap))]
+        self.assertEqual(result[1:], sorted(priorities.values()))
+        self.assertEqual(result[0], min(priorities.values()))
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
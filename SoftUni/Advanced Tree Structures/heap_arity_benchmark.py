@@ -0,0 +1,52 @@
+import random
+import sys
+from datetime import datetime
+from binary_heap import BinaryHeap
+
+
+# python heap_arity_benchmark.py 1000000
+
+
+def push_heavy(nums, arity):
+    """ Insert all the elements, pop a tenth of them """
+    heap = BinaryHeap(arity=arity)
+    start = datetime.now()
+    for num in nums:
+        heap.insert(num)
+    for _ in range(len(nums) // 10):
+        heap.extract_max()
+    return datetime.now() - start
+
+
+def pop_heavy(nums, arity):
+    """ Build the heap at once and pop all of it """
+    start = datetime.now()
+    heap = BinaryHeap(nums, arity=arity)
+    for _ in range(len(nums)):
+        heap.extract_max()
+    return datetime.now() - start
+
+
+def main():
+    test_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    nums = [random.random() for _ in range(test_count)]
+    print("Elements: {}".format(test_count))
+    print("{:<8}{:<18}{}".format('arity', 'push-heavy', 'pop-heavy'))
+    for arity in [2, 4, 8]:
+        print("{:<8}{:<18}{}".format(arity, str(push_heavy(nums, arity)), pop_heavy(nums, arity)))
+
+
+if __name__ == '__main__':
+    main()
+"""
+Elements: 1000000
+arity   push-heavy        pop-heavy
+2       0:00:02.152009    0:00:07.896533
+4       0:00:02.167143    0:00:14.499880
+8       0:00:01.982532    0:00:14.085946
+
+A wider heap is lower, so inserts get a little faster with the arity.
+Popping checks every child on the way down though, which is more comparisons in total (d * log_d(n))
+and each one is a Python-level step. The list only holds pointers to the elements,
+so the cache locality a d-ary layout gives in C doesn't show up here. Binary stays the default.
+"""
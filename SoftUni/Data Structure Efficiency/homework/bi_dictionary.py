@@ -53,20 +53,25 @@ class BiDictionary:
 
         return True
 
-distances = BiDictionary()
-distances.add("Sofia", "Varna", 443)
-distances.add("Sofia", "Varna", 468)
-distances.add("Sofia", "Varna", 490)
-distances.add("Sofia", "Plovdiv", 145)
-distances.add("Sofia", "Bourgas", 383)
-distances.add("Plovdiv", "Bourgas", 253)
-distances.add("Plovdiv", "Bourgas", 292)
-
-print(distances.find_by_key1("Sofia"))  # 443, 468, 490, 145, 383
-print(distances.find_by_key2("Bourgas"))  # 383, 253, 292
-print(distances.find(("Rousse", "Varna")))  # []
-print(distances.find(("Sofia", "Varna")))  # 443, 468, 490
-print(distances.remove("Sofia", "Varna"))  # true
-print(distances.find_by_key1("Sofia"))  # 145, 383
-print(distances.find_by_key2("Varna"))  # []
-print(distances.find(("Sofia", "Varna")))  # []
\ No newline at end of file
+
+def main():
+    distances = BiDictionary()
+    distances.add("Sofia", "Varna", 443)
+    distances.add("Sofia", "Varna", 468)
+    distances.add("Sofia", "Varna", 490)
+    distances.add("Sofia", "Plovdiv", 145)
+    distances.add("Sofia", "Bourgas", 383)
+    distances.add("Plovdiv", "Bourgas", 253)
+    distances.add("Plovdiv", "Bourgas", 292)
+    print(distances.find_by_key1("Sofia"))  # 443, 468, 490, 145, 383
+    print(distances.find_by_key2("Bourgas"))  # 383, 253, 292
+    print(distances.find(("Rousse", "Varna")))  # []
+    print(distances.find(("Sofia", "Varna")))  # 443, 468, 490
+    print(distances.remove("Sofia", "Varna"))  # true
+    print(distances.find_by_key1("Sofia"))  # 145, 383
+    print(distances.find_by_key2("Varna"))  # []
+    print(distances.find(("Sofia", "Varna")))  # []
+
+
+if __name__ == '__main__':
+    main()
@@ -250,7 +250,10 @@ try:  # sizeof(unicode_char) in Python < 3.3
     u = unicode('\0')
 except NameError:  # no unicode() in Python 3.0
     u = '\0'
-u = u.encode('unicode-internal')  # see .../Lib/test/test_sys.py
+try:
+    u = u.encode('unicode-internal')  # see .../Lib/test/test_sys.py
+except LookupError:  # removed in Python 3.8, PEP 393 strings
+    u = u.encode('utf-32-le')
 _sizeof_Cunicode = len(u)
 del u
 if (1 << (_sizeof_Cunicode << 3)) <= sys.maxunicode:
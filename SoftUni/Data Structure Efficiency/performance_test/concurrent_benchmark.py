@@ -0,0 +1,107 @@
+import random
+import sys
+import threading
+from time import perf_counter
+from red_black_tree import OrderedSet, ConcurrentOrderedSet
+
+
+# python -m performance_test.concurrent_benchmark 100000
+reader_count = 4
+
+
+class GlobalLockSet:
+    """ The naive approach - one lock around every operation """
+    def __init__(self, elements):
+        self.set = OrderedSet(elements, presorted=True)
+        self.lock = threading.Lock()
+
+    def add(self, element):
+        with self.lock:
+            self.set.add(element)
+
+    def remove(self, element):
+        with self.lock:
+            self.set.remove(element)
+
+    def contains(self, element):
+        with self.lock:
+            return self.set.contains(element)
+
+
+def stress(or_set, test_count):
+    """
+    Runs the readers while a writer keeps writing, for as long as the writer runs.
+    Returns the reads per second of each reader and the latencies of all the reads, both measured only while
+    the writer is active, which is when readers can get starved
+    """
+    writes = test_count // 2
+    writing = threading.Event()
+    done = threading.Event()
+    reader_stats = []
+
+    def read():
+        reads, latencies = 0, []
+        writing.wait()
+        start = perf_counter()
+        while not done.is_set():
+            element = random.randint(0, 2 * test_count)
+            read_start = perf_counter()
+            or_set.contains(element)
+            latencies.append(perf_counter() - read_start)
+            reads += 1
+        reader_stats.append((reads / (perf_counter() - start), latencies))
+
+    def write():
+        writing.set()
+        for _ in range(writes):
+            or_set.add(random.randint(test_count, 2 * test_count))
+            or_set.remove(random.randint(0, test_count))
+        done.set()
+
+    threads = [threading.Thread(target=read) for _ in range(reader_count)]
+    threads.append(threading.Thread(target=write))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    latencies = sorted(latency for _, reader_latencies in reader_stats for latency in reader_latencies)
+    return [reads_per_sec for reads_per_sec, _ in reader_stats], latencies
+
+
+def report(name, reads_per_sec, latencies):
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 10 ** 6
+
+    print("{:<22}{:<34}{:<10.1f}{:<10.1f}{:.1f}".format(
+        name, ' '.join('{:.0f}'.format(reader) for reader in reads_per_sec), percentile(0.5), percentile(0.99),
+        latencies[-1] * 10 ** 6))
+
+
+def main():
+    test_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    print("Keys: {}, {} readers reading while a writer does {} writes".format(test_count, reader_count, test_count // 2 * 2))
+    print("{:<22}{:<34}{:<10}{:<10}{}".format('', 'reads/sec of each reader', 'p50 us', 'p99 us', 'max us'))
+    report('global lock', *stress(GlobalLockSet(range(test_count)), test_count))
+    report('concurrent set', *stress(ConcurrentOrderedSet(range(test_count)), test_count))
+
+
+if __name__ == '__main__':
+    main()
+"""
+Single core, CPython with the GIL, measured only while the writer runs:
+Keys: 10000, 4 readers reading while a writer does 10000 writes
+                      reads/sec of each reader          p50 us    p99 us    max us
+global lock           23275 22892 23382 20814           2.8       4.5       68049.0
+concurrent set        31256 26975 24746 22911           2.8       4.5       80097.9
+Keys: 100000, 4 readers reading while a writer does 100000 writes
+                      reads/sec of each reader          p50 us    p99 us    max us
+global lock           22258 21631 21494 21852           3.2       5.9       112017.6
+concurrent set        25113 24429 24468 25634           2.8       5.3       112069.9
+
+With a readers-writer lock the concurrent set was 15-30% slower than the global lock (17290-24865 reads/sec per
+reader for 100 000 keys) and its slowest read took 0.9s: the GIL runs one thread at a time anyway, so readers sharing
+the lock didn't read in parallel, they only paid for the extra bookkeeping and waited behind every waiting writer.
+It now takes a single Lock, and batching is what's left of the difference - the writer takes the lock once per 256
+writes, and reads of pending writes don't take it at all, so the readers get 5-15% more reads through.
+The max latency of both is a reader waiting out the GIL switch interval behind the other threads, not the lock.
+"""
@@ -1,11 +1,12 @@
 from datetime import datetime
 import sys
 from performance_test.asizeof import asizeof
-from performance_test.ordered_set import OrderedSet
+from red_black_tree import OrderedSet
 from sortedcontainers import SortedSet
 
 
-test_count = 10000
+# python -m performance_test.test 1000000
+test_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
 
 # test with different elements, add, remove and search
 sset_start = datetime.now()
@@ -15,6 +16,10 @@ for i in range(test_count):
     sset.add(i)
     assert i in sset
 sset_memory = asizeof(sset)
+sset_contains_start = datetime.now()
+for i in range(test_count):
+    assert i in sset
+sset_contains_end = datetime.now()
 for i in range(test_count):
     sset.remove(i)
     assert i not in sset
@@ -30,19 +35,49 @@ for i in range(test_count):
     ordered_set.add(i)
     assert ordered_set.contains(i)
 ordered_set_memory = asizeof(ordered_set)
+ordered_set_contains_start = datetime.now()
+for i in range(test_count):
+    assert ordered_set.contains(i)
+ordered_set_contains_end = datetime.now()
 for i in range(test_count):
     ordered_set.remove(i)
     assert not ordered_set.contains(i)
 
 ordered_set_end = datetime.now()
 
+bulk_load_start = datetime.now()
+bulk_loaded_set = OrderedSet(range(test_count), presorted=True)
+bulk_load_end = datetime.now()
 
-print("Sorted Set elapsed time: {}".format(sset_end-sset_start))
+print("Keys: {}".format(test_count))
+print("Sorted Set elapsed time: {}".format(sset_end-sset_start - (sset_contains_end-sset_contains_start)))
+print("Sorted Set contains time: {}".format(sset_contains_end-sset_contains_start))
 print("Sorted Set memory: {}".format(sset_memory))
-print("Ordered Set elapsed time: {}".format(ordered_set_end-ordered_set_start))
+print("Ordered Set elapsed time: {}".format(
+    ordered_set_end-ordered_set_start - (ordered_set_contains_end-ordered_set_contains_start)))
+print("Ordered Set contains time: {}".format(ordered_set_contains_end-ordered_set_contains_start))
 print("Ordered Set memory: {}".format(ordered_set_memory))
+print("Ordered Set bulk load time: {}".format(bulk_load_end-bulk_load_start))
 """
 Sorted Set elapsed time: 0:00:00.380138
 Ordered Set elapsed time: 0:00:06.590211
 Hell, mine is quite slower.
-"""
\ No newline at end of file
+
+Recursive find/iteration (before) vs loops and identity checks (after):
+    10 000 keys        elapsed          contains
+        before         0:00:00.564193   0:00:00.110226
+        after          0:00:00.340151   0:00:00.031612
+    1 000 000 keys
+        before         0:01:32.861870   0:00:14.997331
+        after          0:00:42.732329   0:00:05.053516
+        Sorted Set     0:00:06.951843   0:00:00.323434
+
+Building from 1 000 000 sorted keys:
+    add one by one     0:00:10.677643
+    bulk load          0:00:03.053097
+
+Memory (asizeof) of 1 000 000 integer keys:
+    Sorted Set             74 652 872
+    Node with __dict__    184 084 640
+    Node with __slots__   112 126 648
+"""
@@ -48,9 +48,15 @@ class ArrayStack:
     def count(self, value):
         self.__count = value
 
-stack = ArrayStack()
-stack.push(5)
-stack.push(5)
-stack.push(5)
-stack.pop()
-print(stack)
\ No newline at end of file
+
+def main():
+    stack = ArrayStack()
+    stack.push(5)
+    stack.push(5)
+    stack.push(5)
+    stack.pop()
+    print(stack)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,4 @@
+from red_black_tree.rb_tree import RedBlackTree, Node, RED, BLACK, NIL
+from red_black_tree.ordered_set import OrderedSet
+from red_black_tree.persistent_rb_tree import PersistentRedBlackTree, SnapshotRedBlackTree
+from red_black_tree.concurrent_ordered_set import ConcurrentOrderedSet
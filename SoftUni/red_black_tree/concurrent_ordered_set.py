@@ -0,0 +1,99 @@
+"""
+A thread-safe Ordered Set.
+
+Writes don't touch the tree right away, they are queued in a buffer and applied in sorted batches,
+which means the writer takes the lock once per batch instead of once per element.
+Reads and batches share a single lock - under the GIL only one thread runs Python code at a time, so a readers-writer
+lock doesn't let reads run alongside each other and only adds its own bookkeeping to every read.
+Elements must be hashable, since the buffer keeps the latest pending operation for each one.
+"""
+import threading
+from red_black_tree.ordered_set import OrderedSet
+
+
+class ConcurrentOrderedSet:
+    def __init__(self, elements=None, batch_size=256):
+        self.batch_size = batch_size
+        self.__set = OrderedSet(elements)
+        self.__lock = threading.Lock()
+        self.__pending = {}  # element: True if it should be added, False if it should be removed
+        self.__applying = {}  # the batch which is being applied at the moment
+        self.__pending_lock = threading.Lock()
+        self.__flush_lock = threading.Lock()
+
+    def __len__(self):
+        self.flush()
+        with self.__lock:
+            return len(self.__set)
+
+    def __iter__(self):
+        """ Iterates over a copy of the elements, so the lock isn't held while the caller consumes them """
+        self.flush()
+        with self.__lock:
+            elements = list(self.__set)
+        return elements.__iter__()
+
+    def add(self, element):
+        self.__queue(element, True)
+
+    def remove(self, element):
+        self.__queue(element, False)
+
+    def contains(self, element) -> bool:
+        # no lock needed for the buffers, a single dict lookup is atomic and
+        # flush() publishes a batch as __applying before it empties __pending
+        pending = self.__pending.get(element)
+        if pending is None:
+            pending = self.__applying.get(element)
+        if pending is not None:
+            return pending  # the latest write wins, even if it's not applied yet
+        with self.__lock:
+            return self.__set.contains(element)
+
+    def flush(self):
+        """
+        Applies all the queued writes to the set.
+        If the batch fails, it's queued again under the writes that came after it and the error is raised
+        """
+        with self.__flush_lock:
+            with self.__pending_lock:
+                if not self.__pending:
+                    return
+                pending = self.__applying = self.__pending
+                self.__pending = {}
+            try:
+                to_add = sorted(element for element, is_added in pending.items() if is_added)
+                to_remove = sorted(element for element, is_added in pending.items() if not is_added)
+                with self.__lock:
+                    if len(pending) * 16 > len(self.__set):
+                        # a big batch relative to the set, merging both in O(n+m) beats a descent per element
+                        self.__set.update(OrderedSet(to_add, presorted=True))
+                        self.__set = self.__set.difference(OrderedSet(to_remove, presorted=True))
+                    else:
+                        # sorted elements follow nearly the same path down the tree one after the other
+                        for element in to_add:
+                            self.__set.add(element)
+                        for element in to_remove:
+                            self.__set.remove(element)
+            except Exception:
+                with self.__pending_lock:
+                    pending.update(self.__pending)
+                    self.__pending = pending
+                raise
+            finally:
+                with self.__pending_lock:
+                    self.__applying = {}
+
+    def __queue(self, element, is_added):
+        with self.__pending_lock:
+            reference = next(iter(self.__pending), None)
+        if reference is None:
+            with self.__lock:
+                reference = next(iter(self.__set), None)
+        if reference is not None:
+            element < reference  # an element that can't be compared raises here instead of breaking its whole batch
+        with self.__pending_lock:
+            self.__pending[element] = is_added
+            is_full = len(self.__pending) >= self.batch_size
+        if is_full:
+            self.flush()
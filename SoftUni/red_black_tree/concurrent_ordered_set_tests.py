@@ -0,0 +1,100 @@
+import random
+import threading
+import unittest
+
+from red_black_tree.concurrent_ordered_set import ConcurrentOrderedSet
+
+
+class ConcurrentOrderedSetTests(unittest.TestCase):
+
+    def test_add_remove_contains(self):
+        or_set = ConcurrentOrderedSet([5, 1, 3], batch_size=4)
+        or_set.add(2)
+        or_set.add(4)
+        self.assertTrue(or_set.contains(2))
+        or_set.remove(2)
+        self.assertFalse(or_set.contains(2))
+        or_set.remove(5)
+        self.assertFalse(or_set.contains(5))
+        self.assertTrue(or_set.contains(1))
+        self.assertEqual(list(or_set), [1, 3, 4])
+        self.assertEqual(len(or_set), 3)
+
+    def test_pending_writes_are_visible(self):
+        or_set = ConcurrentOrderedSet(batch_size=1000)
+        for i in range(100):
+            or_set.add(i)
+        for i in range(100):
+            self.assertTrue(or_set.contains(i))
+        or_set.remove(50)
+        self.assertFalse(or_set.contains(50))
+        self.assertEqual(list(or_set), [i for i in range(100) if i != 50])
+
+    def test_incomparable_element_raises_without_losing_the_batch(self):
+        or_set = ConcurrentOrderedSet([1, 2, 3], batch_size=2)
+        or_set.add(5)
+        with self.assertRaises(TypeError):
+            or_set.add('a')
+        or_set.add(7)
+        or_set.add(8)
+        self.assertTrue(or_set.contains(5))
+        self.assertEqual(list(or_set), [1, 2, 3, 5, 7, 8])
+
+    def test_failed_batch_is_queued_again(self):
+        or_set = ConcurrentOrderedSet(batch_size=100)
+        or_set.add(1)
+        or_set._ConcurrentOrderedSet__pending['a'] = True  # slips past the check in add
+        with self.assertRaises(TypeError):
+            or_set.flush()
+        self.assertTrue(or_set.contains(1))
+        self.assertEqual({}, or_set._ConcurrentOrderedSet__applying)
+        del or_set._ConcurrentOrderedSet__pending['a']
+        self.assertEqual(list(or_set), [1])
+
+    def test_big_and_small_batches(self):
+        or_set = ConcurrentOrderedSet(range(1000), batch_size=10)
+        expected = set(range(1000))
+        for _ in range(3000):
+            value = random.randint(0, 2000)
+            if random.random() < 0.5:
+                or_set.add(value)
+                expected.add(value)
+            else:
+                or_set.remove(value)
+                expected.discard(value)
+        self.assertEqual(list(or_set), sorted(expected))
+
+        or_set = ConcurrentOrderedSet([1, 2], batch_size=100)
+        for i in range(3, 200):
+            or_set.add(i)
+        or_set.remove(1)
+        self.assertEqual(list(or_set), list(range(2, 200)))
+
+    def test_many_threads(self):
+        or_set = ConcurrentOrderedSet(batch_size=50)
+        errors = []
+
+        def writer(start):
+            for i in range(start, start + 500):
+                or_set.add(i)
+                if not or_set.contains(i):
+                    errors.append(i)
+            for i in range(start, start + 500, 2):
+                or_set.remove(i)
+
+        def reader():
+            for _ in range(500):
+                or_set.contains(random.randint(0, 2000))
+
+        threads = [threading.Thread(target=writer, args=(start,)) for start in range(0, 2000, 500)]
+        threads += [threading.Thread(target=reader) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(list(or_set), list(range(1, 2000, 2)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+from red_black_tree.rb_tree import RedBlackTree
+
+END = object()  # marks an exhausted iterator while merging
+
+
+class OrderedSet:
+    def __init__(self, elements=None, presorted=False):
+        """ The elements are bulk-loaded, pass presorted=True to skip sorting them beforehand """
+        if elements is not None:
+            self.tree = RedBlackTree.from_sorted(elements if presorted else sorted(elements))
+        else:
+            self.tree = RedBlackTree()
+
+    def __len__(self):
+        return self.tree.count
+
+    def __iter__(self):
+        yield from self.tree.__iter__()
+
+    def add(self, element):
+        self.tree.add(element)
+
+    def remove(self, element):
+        self.tree.remove(element)
+
+    def clear(self):
+        self.tree = RedBlackTree()
+
+    def contains(self, element):
+        return self.tree.contains(element)
+
+    def irange(self, low=None, high=None, inclusive=(True, True), reverse=False):
+        """ Lazily yields the elements between low and high, see RedBlackTree.irange """
+        return self.tree.irange(low, high, inclusive, reverse)
+
+    def union(self, other_set):
+        if not isinstance(other_set, type(self)):
+            raise Exception("You cannot union a set with something that's not a set!")
+        return type(self)(self.__merge(other_set, only_self=True, only_other=True, both=True), presorted=True)
+
+    def intersection(self, other_set):
+        if not isinstance(other_set, type(self)):
+            raise Exception("You cannot intersect a set with something that's not a set!")
+        return type(self)(self.__merge(other_set, only_self=False, only_other=False, both=True), presorted=True)
+
+    def difference(self, other_set):
+        if not isinstance(other_set, type(self)):
+            raise Exception("You cannot subtract something that's not a set from a set!")
+        return type(self)(self.__merge(other_set, only_self=True, only_other=False, both=False), presorted=True)
+
+    def symmetric_difference(self, other_set):
+        if not isinstance(other_set, type(self)):
+            raise Exception("You cannot get the symmetric difference with something that's not a set!")
+        return type(self)(self.__merge(other_set, only_self=True, only_other=True, both=False), presorted=True)
+
+    def update(self, other_set):
+        """ Adds all the elements of the other set to this one """
+        self.tree = self.union(other_set).tree
+
+    def intersection_update(self, other_set):
+        """ Keeps only the elements that are also in the other set """
+        self.tree = self.intersection(other_set).tree
+
+    def __merge(self, other_set, only_self, only_other, both):
+        """
+        Walks both sets in order simultaneously, like merge sort does,
+        and yields the elements which are only in this set, only in the other one or in both, depending on the flags.
+        The output is sorted, so it can be bulk-loaded into a new tree, giving O(n+m) for every set operation
+        """
+        self_elements, other_elements = iter(self), iter(other_set)
+        self_el, other_el = next(self_elements, END), next(other_elements, END)
+        while self_el is not END and other_el is not END:
+            if self_el < other_el:
+                if only_self:
+                    yield self_el
+                self_el = next(self_elements, END)
+            elif other_el < self_el:
+                if only_other:
+                    yield other_el
+                other_el = next(other_elements, END)
+            else:
+                if both:
+                    yield self_el
+                self_el, other_el = next(self_elements, END), next(other_elements, END)
+
+        if only_self and self_el is not END:
+            yield self_el
+            yield from self_elements
+        if only_other and other_el is not END:
+            yield other_el
+            yield from other_elements
@@ -0,0 +1,138 @@
+from red_black_tree.ordered_set import OrderedSet
+import unittest
+
+
+class OrderedSetTests(unittest.TestCase):
+    def test_add_elements_on_initialization(self):
+        sorted_elements = [-4313, 1, 2, 3, 13413, 4931939]
+        # add the elements through the initialization of the set
+        or_set = OrderedSet([2, 13413, 3, -4313, 4931939, 1])
+        # assert they're equal
+        for idx, el in enumerate(or_set):
+            self.assertEqual(el, sorted_elements[idx])
+
+    def test_addition_and_order(self):
+        or_set = OrderedSet()
+        sorted_elements = [-1, 0, 1,2,3,4]
+        or_set.add(3)
+        or_set.add(0)
+        or_set.add(1)
+        or_set.add(2)
+        or_set.add(-1)
+        or_set.add(4)
+        for idx, el in enumerate(or_set):
+            self.assertEqual(el, sorted_elements[idx])
+
+    def test_remove_elements(self):
+        sorted_elements = [1, 2, 3, 13413]
+        # add the elements through the initialization of the set
+        or_set = OrderedSet([2, 13413, 3, -4313, 4931939, 1])
+        or_set.remove(-4313)
+        or_set.remove(4931939)
+        # assert they're equal
+        for idx, el in enumerate(or_set):
+            self.assertEqual(el, sorted_elements[idx])
+
+    def test_convert_to_list(self):
+        sorted_elements = [-301, 100, 200, 300, 301]
+        or_set = OrderedSet([300, -301, 100, 301, 200])
+        self.assertEqual(list(or_set), sorted_elements)
+
+    def test_contains(self):
+        elements = ['aa', 'a', 'ba']
+        or_set = OrderedSet(elements)
+        for el in elements:
+            self.assertTrue(or_set.contains(el))
+
+    def test_add_remove_100_elements_three_times(self):
+        or_set = OrderedSet()
+        for time in range(3):
+            for i in range(100):
+                or_set.add(i)
+
+        # assert elements are from 1 to 100
+        hundred_elements = list(range(100))
+        for idx, el in enumerate(or_set):
+            self.assertEqual(el, hundred_elements[idx])
+
+        for time in range(3):
+            for i in range(100):
+                or_set.remove(i)
+
+        self.assertCountEqual(list(or_set), [])
+
+    def test_presorted_elements(self):
+        or_set = OrderedSet(range(1000), presorted=True)
+        self.assertEqual(len(or_set), 1000)
+        self.assertEqual(list(or_set), list(range(1000)))
+        or_set.add(-1)
+        or_set.remove(500)
+        self.assertFalse(or_set.contains(500))
+        self.assertEqual(list(or_set), [-1] + [i for i in range(1000) if i != 500])
+
+    def test_duplicate_elements_on_initialization(self):
+        or_set = OrderedSet([3, 1, 3, 2, 1])
+        self.assertEqual(len(or_set), 3)
+        self.assertEqual(list(or_set), [1, 2, 3])
+
+    def test_irange(self):
+        or_set = OrderedSet([5, 1, 4, 2, 3, 6])
+        self.assertEqual(list(or_set.irange(2, 5)), [2, 3, 4, 5])
+        self.assertEqual(list(or_set.irange(2, 5, inclusive=(False, True))), [3, 4, 5])
+        self.assertEqual(list(or_set.irange(2, 5, reverse=True)), [5, 4, 3, 2])
+        self.assertEqual(list(or_set.irange(high=2)), [1, 2])
+
+    def test_set_operations(self):
+        first = OrderedSet([1, 3, 5, 7, 9, 10])
+        second = OrderedSet([0, 3, 4, 9, 10, 11])
+        self.assertEqual(list(first.union(second)), [0, 1, 3, 4, 5, 7, 9, 10, 11])
+        self.assertEqual(list(first.intersection(second)), [3, 9, 10])
+        self.assertEqual(list(first.difference(second)), [1, 5, 7])
+        self.assertEqual(list(second.difference(first)), [0, 4, 11])
+        self.assertEqual(list(first.symmetric_difference(second)), [0, 1, 4, 5, 7, 11])
+        # the operands stay the same
+        self.assertEqual(list(first), [1, 3, 5, 7, 9, 10])
+        self.assertEqual(list(second), [0, 3, 4, 9, 10, 11])
+
+    def test_set_operations_with_empty_set(self):
+        or_set = OrderedSet([1, 2])
+        empty = OrderedSet()
+        self.assertEqual(list(or_set.union(empty)), [1, 2])
+        self.assertEqual(list(empty.union(or_set)), [1, 2])
+        self.assertEqual(list(or_set.intersection(empty)), [])
+        self.assertEqual(list(or_set.difference(empty)), [1, 2])
+        self.assertEqual(list(empty.difference(or_set)), [])
+        self.assertEqual(list(empty.symmetric_difference(or_set)), [1, 2])
+
+    def test_set_operations_random(self):
+        import random
+        first_elements = set(random.sample(range(3000), 1000))
+        second_elements = set(random.sample(range(3000), 1000))
+        first, second = OrderedSet(first_elements), OrderedSet(second_elements)
+        union = first.union(second)
+        self.assertEqual(list(union), sorted(first_elements | second_elements))
+        self.assertEqual(len(union), len(first_elements | second_elements))
+        self.assertEqual(list(first.intersection(second)), sorted(first_elements & second_elements))
+        self.assertEqual(list(first.difference(second)), sorted(first_elements - second_elements))
+        self.assertEqual(list(first.symmetric_difference(second)), sorted(first_elements ^ second_elements))
+
+    def test_update_and_intersection_update(self):
+        or_set = OrderedSet([1, 2, 3])
+        or_set.update(OrderedSet([3, 4, 5]))
+        self.assertEqual(list(or_set), [1, 2, 3, 4, 5])
+        self.assertEqual(len(or_set), 5)
+        or_set.intersection_update(OrderedSet([0, 2, 4, 6]))
+        self.assertEqual(list(or_set), [2, 4])
+        self.assertEqual(len(or_set), 2)
+        or_set.add(3)
+        self.assertEqual(list(or_set), [2, 3, 4])
+
+    def test_set_operations_with_non_set_raise(self):
+        or_set = OrderedSet([1, 2])
+        self.assertRaises(Exception, or_set.union, [1])
+        self.assertRaises(Exception, or_set.intersection, [1])
+        self.assertRaises(Exception, or_set.difference, [1])
+        self.assertRaises(Exception, or_set.symmetric_difference, [1])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
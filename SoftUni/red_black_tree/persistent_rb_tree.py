@@ -0,0 +1,230 @@
+"""
+A persistent (immutable) Red-Black Tree.
+
+Nodes are never modified once they're in a tree. add/remove copy only the nodes on the path they walk
+(plus the ones they rotate) and return a new tree that shares every untouched subtree with the old one,
+so each update creates O(log n) nodes and every old version stays valid and readable.
+
+RedBlackTree's nodes point to their parent, which makes sharing subtrees between versions impossible,
+so this is a left-leaning red-black tree (Sedgewick) that only needs child pointers.
+"""
+from red_black_tree.rb_tree import RED, BLACK
+
+KEEP = object()  # marks an attribute that should not change when copying a node
+
+
+class PersistentNode:
+    __slots__ = ('value', 'key', 'color', 'left', 'right', 'size')
+
+    def __init__(self, value, key, color, left=None, right=None):
+        self.value = value
+        self.key = key
+        self.color = color
+        self.left = left
+        self.right = right
+        self.size = _size(left) + _size(right) + 1
+
+    def __repr__(self):
+        return '{color} {val} PersistentNode'.format(color=self.color, val=self.value)
+
+    def copy(self, color=KEEP, left=KEEP, right=KEEP):
+        """ Returns a new node with the given attributes changed """
+        return PersistentNode(self.value, self.key,
+                              self.color if color is KEEP else color,
+                              self.left if left is KEEP else left,
+                              self.right if right is KEEP else right)
+
+
+class PersistentRedBlackTree:
+    def __init__(self, key=None, root=None, count=0):
+        """ key is an optional function that returns the value to compare by, it's called once per added value """
+        self.key = key
+        self.root = root
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield node.value
+                node = node.right
+
+    def add(self, value):
+        """ Returns a new tree with the value added, this one stays the same """
+        key = self.__key_of(value)
+        if self.__find_node(key) is not None:
+            return self
+        root = _insert(self.root, key, value)
+        if root.color == RED:
+            root = root.copy(color=BLACK)
+        return PersistentRedBlackTree(self.key, root, self.count + 1)
+
+    def remove(self, value):
+        """ Returns a new tree without the value, this one stays the same """
+        key = self.__key_of(value)
+        if self.__find_node(key) is None:
+            return self
+        root = self.root
+        if not _is_red(root.left) and not _is_red(root.right):
+            root = root.copy(color=RED)
+        root = _delete(root, key)
+        if root is not None and root.color == RED:
+            root = root.copy(color=BLACK)
+        return PersistentRedBlackTree(self.key, root, self.count - 1)
+
+    def contains(self, value) -> bool:
+        """ Returns a boolean indicating if the given value is present in the tree """
+        return self.__find_node(self.__key_of(value)) is not None
+
+    def __key_of(self, value):
+        return value if self.key is None else self.key(value)
+
+    def __find_node(self, key):
+        node = self.root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                node = node.right
+            else:
+                return node
+        return None
+
+
+class SnapshotRedBlackTree:
+    """
+    A mutable tree whose snapshot() is O(1).
+    Every update swaps in a new persistent version, so a snapshot is simply the current version.
+    Readers can iterate a snapshot from other threads without locks while the writer keeps updating.
+    """
+    def __init__(self, key=None):
+        self.tree = PersistentRedBlackTree(key)
+
+    def __len__(self):
+        return self.tree.count
+
+    def __iter__(self):
+        return self.tree.__iter__()
+
+    @property
+    def count(self):
+        return self.tree.count
+
+    def add(self, value):
+        self.tree = self.tree.add(value)
+
+    def remove(self, value):
+        self.tree = self.tree.remove(value)
+
+    def contains(self, value) -> bool:
+        return self.tree.contains(value)
+
+    def snapshot(self) -> PersistentRedBlackTree:
+        """ Returns a frozen version of the tree which is not affected by further updates """
+        return self.tree
+
+
+def _size(node):
+    return 0 if node is None else node.size
+
+
+def _is_red(node):
+    return node is not None and node.color == RED
+
+
+def _flip(color):
+    return BLACK if color == RED else RED
+
+
+def _insert(node, key, value):
+    if node is None:
+        return PersistentNode(value, key, RED)
+    if key < node.key:
+        node = node.copy(left=_insert(node.left, key, value))
+    else:
+        node = node.copy(right=_insert(node.right, key, value))
+    return _balance(node)
+
+
+def _delete(node, key):
+    """ Deletes the key, which must be in the subtree, pushing a red link down the search path on the way """
+    if key < node.key:
+        if not _is_red(node.left) and not _is_red(node.left.left):
+            node = _move_red_left(node)
+        node = node.copy(left=_delete(node.left, key))
+    else:
+        if _is_red(node.left):
+            node = _rotate_right(node)
+        if not node.key < key and node.right is None:
+            return None
+        if not _is_red(node.right) and not _is_red(node.right.left):
+            node = _move_red_right(node)
+        if not node.key < key:
+            # replace it with its successor
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+            node = PersistentNode(successor.value, successor.key, node.color,
+                                  node.left, _delete_min(node.right))
+        else:
+            node = node.copy(right=_delete(node.right, key))
+    return _balance(node)
+
+
+def _delete_min(node):
+    if node.left is None:
+        return None
+    if not _is_red(node.left) and not _is_red(node.left.left):
+        node = _move_red_left(node)
+    node = node.copy(left=_delete_min(node.left))
+    return _balance(node)
+
+
+def _balance(node):
+    """ Restores the left-leaning invariants on the way up """
+    if _is_red(node.right) and not _is_red(node.left):
+        node = _rotate_left(node)
+    if _is_red(node.left) and _is_red(node.left.left):
+        node = _rotate_right(node)
+    if _is_red(node.left) and _is_red(node.right):
+        node = _flip_colors(node)
+    return node
+
+
+def _move_red_left(node):
+    node = _flip_colors(node)
+    if _is_red(node.right.left):
+        node = node.copy(right=_rotate_right(node.right))
+        node = _flip_colors(_rotate_left(node))
+    return node
+
+
+def _move_red_right(node):
+    node = _flip_colors(node)
+    if _is_red(node.left.left):
+        node = _flip_colors(_rotate_right(node))
+    return node
+
+
+def _rotate_left(node):
+    right = node.right
+    return right.copy(color=node.color, left=node.copy(color=RED, right=right.left))
+
+
+def _rotate_right(node):
+    left = node.left
+    return left.copy(color=node.color, right=node.copy(color=RED, left=left.right))
+
+
+def _flip_colors(node):
+    return node.copy(color=_flip(node.color),
+                     left=node.left.copy(color=_flip(node.left.color)),
+                     right=node.right.copy(color=_flip(node.right.color)))
@@ -0,0 +1,141 @@
+import random
+import unittest
+
+from red_black_tree.persistent_rb_tree import PersistentRedBlackTree, SnapshotRedBlackTree
+BLACK = 'BLACK'
+RED = 'RED'
+
+
+class PersistentRbTreeTests(unittest.TestCase):
+
+    def assertValidTree(self, tree):
+        """
+        Asserts that the tree is ordered, left-leaning, has no red-red links,
+        the same black height on every path and correct sizes
+        """
+        def black_height(node, low, high):
+            if node is None:
+                return 1
+            self.assertTrue(low is None or low < node.key)
+            self.assertTrue(high is None or node.key < high)
+            self.assertFalse(node.right is not None and node.right.color == RED)
+            if node.color == RED:
+                self.assertFalse(node.left is not None and node.left.color == RED)
+            left_size = 0 if node.left is None else node.left.size
+            right_size = 0 if node.right is None else node.right.size
+            self.assertEqual(node.size, left_size + right_size + 1)
+            left_height = black_height(node.left, low, node.key)
+            right_height = black_height(node.right, node.key, high)
+            self.assertEqual(left_height, right_height)
+            return left_height + int(node.color == BLACK)
+
+        if tree.root is not None:
+            self.assertEqual(tree.root.color, BLACK)
+            self.assertEqual(tree.root.size, tree.count)
+            black_height(tree.root, None, None)
+
+    def get_nodes(self, tree):
+        nodes = []
+        stack = [tree.root]
+        while stack:
+            node = stack.pop()
+            if node is not None:
+                nodes.append(node)
+                stack.append(node.left)
+                stack.append(node.right)
+        return nodes
+
+    def test_add_returns_new_tree(self):
+        empty = PersistentRedBlackTree()
+        one = empty.add(5)
+        two = one.add(3)
+        self.assertEqual(list(empty), [])
+        self.assertEqual(list(one), [5])
+        self.assertEqual(list(two), [3, 5])
+        self.assertEqual(len(two), 2)
+        self.assertTrue(two.contains(3))
+        self.assertFalse(one.contains(3))
+
+    def test_add_duplicate_returns_same_tree(self):
+        tree = PersistentRedBlackTree().add(1).add(2)
+        self.assertIs(tree.add(2), tree)
+        self.assertIs(tree.remove(3), tree)
+
+    def test_add_remove_random_keeps_every_version(self):
+        versions = [PersistentRedBlackTree()]
+        expected = [[]]
+        values = set()
+        for _ in range(1500):
+            value = random.randint(0, 400)
+            if value in values and random.random() < 0.5:
+                versions.append(versions[-1].remove(value))
+                values.remove(value)
+            else:
+                versions.append(versions[-1].add(value))
+                values.add(value)
+            expected.append(sorted(values))
+            self.assertValidTree(versions[-1])
+        for version, expected_values in zip(versions, expected):
+            self.assertEqual(list(version), expected_values)
+            self.assertEqual(version.count, len(expected_values))
+
+    def test_remove_everything(self):
+        tree = PersistentRedBlackTree()
+        for value in range(200):
+            tree = tree.add(value)
+        full_tree = tree
+        for value in random.sample(range(200), 200):
+            tree = tree.remove(value)
+            self.assertFalse(tree.contains(value))
+            self.assertValidTree(tree)
+        self.assertIsNone(tree.root)
+        self.assertEqual(list(full_tree), list(range(200)))
+
+    def test_update_shares_untouched_subtrees(self):
+        tree = PersistentRedBlackTree()
+        for value in range(0, 2048, 2):
+            tree = tree.add(value)
+        old_nodes = {id(node) for node in self.get_nodes(tree)}
+        for new_tree in [tree.add(1001), tree.remove(1000)]:
+            new_nodes = [node for node in self.get_nodes(new_tree) if id(node) not in old_nodes]
+            # a couple of copies per level, nowhere near the 1024 nodes in the tree
+            self.assertLess(len(new_nodes), 4 * 11)
+
+    def test_key(self):
+        tree = PersistentRedBlackTree(key=lambda value: -value)
+        for value in [3, 1, 2]:
+            tree = tree.add(value)
+        self.assertEqual(list(tree), [3, 2, 1])
+        self.assertEqual(list(tree.remove(2)), [3, 1])
+
+
+class SnapshotRbTreeTests(unittest.TestCase):
+
+    def test_snapshot_is_not_affected_by_updates(self):
+        tree = SnapshotRedBlackTree()
+        for value in [5, 1, 3]:
+            tree.add(value)
+        snapshot = tree.snapshot()
+        tree.add(4)
+        tree.remove(1)
+        self.assertEqual(list(snapshot), [1, 3, 5])
+        self.assertEqual(len(snapshot), 3)
+        self.assertEqual(list(tree), [3, 4, 5])
+        self.assertEqual(tree.count, 3)
+        self.assertTrue(tree.contains(4))
+        self.assertFalse(snapshot.contains(4))
+
+    def test_iterate_snapshot_while_writing(self):
+        tree = SnapshotRedBlackTree()
+        for value in range(100):
+            tree.add(value)
+        iterated = []
+        for value in tree.snapshot():
+            iterated.append(value)
+            tree.remove(value)
+            tree.add(value + 1000)
+        self.assertEqual(iterated, list(range(100)))
+        self.assertEqual(list(tree), list(range(1000, 1100)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,24 +4,33 @@ NIL = 'NIL'
 
 
 class Node:
-    def __init__(self, value, color, parent, left=None, right=None):
+    # no per-node __dict__, the colors are shared string constants so they cost a single pointer
+    __slots__ = ('value', 'key', 'color', 'parent', 'left', 'right', 'size')
+
+    def __init__(self, value, color, parent, left=None, right=None, key=None):
         self.value = value
+        self.key = value if key is None else key  # what the tree compares, computed once on insertion
         self.color = color
         self.parent = parent
         self.left = left
         self.right = right
+        self.size = 0 if color == NIL else 1  # the count of nodes in this subtree
 
     def __repr__(self):
         return '{color} {val} Node'.format(color=self.color, val=self.value)
 
     def __iter__(self):
-        if self.left.color != NIL:
-            yield from self.left.__iter__()
-
-        yield self.value
-
-        if self.right.color != NIL:
-            yield from self.right.__iter__()
+        """ In-order traversal of the subtree, using an explicit stack instead of recursion """
+        stack = []
+        node = self
+        while stack or node.color != NIL:
+            if node.color != NIL:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield node.value
+                node = node.right
 
     def __eq__(self, other):
         if self.color == NIL and self.color == other.color:
@@ -47,7 +56,9 @@ class Node:
 class RedBlackTree:
     NIL_LEAF = Node(value=None, color=NIL, parent=None)
 
-    def __init__(self):
+    def __init__(self, key=None):
+        """ key is an optional function that returns the value to compare by, it's called once per added value """
+        self.key = key
         self.count = 0
         self.root = None
         self.ROTATIONS = {
@@ -61,19 +72,84 @@ class RedBlackTree:
             return list()
         yield from self.root.__iter__()
 
+    def __getitem__(self, index):
+        if not isinstance(index, int):
+            raise TypeError('Tree indices must be integers!')
+        if index < 0:
+            index += self.count
+        return self.select(index)
+
+    @classmethod
+    def from_sorted(cls, values, key=None):
+        """
+        Builds a tree from sorted values in O(n), without a single rotation.
+        The middle value becomes the root and each half becomes its subtree, so the tree is perfectly balanced.
+        Every path has the same number of nodes, except for the ones ending at the deepest (possibly incomplete) level,
+        so coloring only that level RED keeps the black height equal everywhere.
+        Values that turn out not to be sorted get sorted first.
+        """
+        keys, values = cls.__unique_sorted(values, key)
+        tree = cls(key=key)
+        if not values:
+            return tree
+        red_depth = len(values).bit_length() - 1  # the depth of the deepest level
+
+        def build(start, end, parent, depth):
+            if start > end:
+                return cls.NIL_LEAF
+            middle = (start + end) // 2
+            color = RED if depth == red_depth and depth != 0 else BLACK
+            node = Node(values[middle], color=color, parent=parent, key=keys[middle])
+            node.left = build(start, middle - 1, node, depth + 1)
+            node.right = build(middle + 1, end, node, depth + 1)
+            node.size = node.left.size + node.right.size + 1
+            return node
+
+        tree.root = build(0, len(values) - 1, None, 0)
+        tree.count = len(values)
+        return tree
+
+    @staticmethod
+    def __unique_sorted(values, key):
+        """
+        Returns the keys and values with unique keys in ascending order,
+        only sorting them if they are not sorted already
+        """
+        values = list(values)
+        keys = values if key is None else [key(value) for value in values]
+        for idx in range(1, len(keys)):
+            if keys[idx] < keys[idx - 1]:
+                if key is None:
+                    values.sort()
+                else:
+                    order = sorted(range(len(keys)), key=keys.__getitem__)
+                    keys, values = [keys[i] for i in order], [values[i] for i in order]
+                break
+        unique_keys, unique_values = keys[:1], values[:1]
+        for idx in range(1, len(keys)):
+            if unique_keys[-1] < keys[idx]:
+                unique_keys.append(keys[idx])
+                unique_values.append(values[idx])
+        return unique_keys, unique_values
+
     def add(self, value):
+        key = self.__key_of(value)
         if not self.root:
-            self.root = Node(value, color=BLACK, parent=None, left=self.NIL_LEAF, right=self.NIL_LEAF)
+            self.root = Node(value, color=BLACK, parent=None, left=self.NIL_LEAF, right=self.NIL_LEAF, key=key)
             self.count += 1
             return
-        parent, node_dir = self.__find_parent(value)
+        parent, node_dir = self.__find_parent(key)
         if node_dir is None:
             return  # value is in the tree
-        new_node = Node(value=value, color=RED, parent=parent, left=self.NIL_LEAF, right=self.NIL_LEAF)
+        new_node = Node(value=value, color=RED, parent=parent, left=self.NIL_LEAF, right=self.NIL_LEAF, key=key)
         if node_dir == 'L':
             parent.left = new_node
         else:
             parent.right = new_node
+        ancestor = parent
+        while ancestor is not None:
+            ancestor.size += 1
+            ancestor = ancestor.parent
 
         self.__try_rebalance(new_node)
         self.count += 1
@@ -90,39 +166,131 @@ class RedBlackTree:
             # find the in-order successor and replace its value.
             # then, remove the successor
             successor = self._find_in_order_successor(node_to_remove)
-            node_to_remove.value = successor.value  # switch the value
+            node_to_remove.value, node_to_remove.key = successor.value, successor.key  # switch the value
             node_to_remove = successor
 
         # has 0 or 1 children!
-        self.__remove(node_to_remove)
+        self.__update_sizes(self.__remove(node_to_remove))
         self.count -= 1
 
     def contains(self, value) -> bool:
         """ Returns a boolean indicating if the given value is present in the tree """
-        return bool(self.find_node(value))
+        return self.find_node(value) is not None
+
+    def select(self, index):
+        """ Returns the index-th smallest value (counting from 0) in O(log n) """
+        if not 0 <= index < self.count:
+            raise IndexError('Index {} is out of range!'.format(index))
+        node = self.root
+        while True:
+            left_size = node.left.size
+            if index < left_size:
+                node = node.left
+            elif index > left_size:
+                index -= left_size + 1
+                node = node.right
+            else:
+                return node.value
+
+    def rank(self, value) -> int:
+        """ Returns the count of values in the tree that are smaller than the given one """
+        return self.__count_smaller(self.__key_of(value), or_equal=False)
+
+    def count_range(self, low, high) -> int:
+        """ Returns the count of values between low and high (inclusive) """
+        low, high = self.__key_of(low), self.__key_of(high)
+        if high < low:
+            return 0
+        return self.__count_smaller(high, or_equal=True) - self.__count_smaller(low, or_equal=False)
+
+    def irange(self, low=None, high=None, inclusive=(True, True), reverse=False):
+        """
+        Lazily yields the values between low and high, in ascending order or descending if reverse is True.
+        A None bound leaves that side of the range open.
+        Finding the first value costs O(log n) and each next one is its in-order successor/predecessor,
+        so taking the first k values of a range costs O(log n + k).
+        """
+        include_low, include_high = inclusive
+        low = None if low is None else self.__key_of(low)
+        high = None if high is None else self.__key_of(high)
+        if reverse:
+            node = self.__find_floor(high, include_high)
+            while node is not None and (low is None or low < node.key or (include_low and node.key == low)):
+                yield node.value
+                node = self._find_in_order_predecessor(node)
+        else:
+            node = self.__find_ceiling(low, include_low)
+            while node is not None and (high is None or node.key < high or (include_high and node.key == high)):
+                yield node.value
+                node = self._find_in_order_successor(node)
+
+    def __find_ceiling(self, key, inclusive):
+        """ Returns the node with the smallest key that's bigger than (or equal to, if inclusive) the given one """
+        ceiling = None
+        node = self.root
+        while node is not None and node.color != NIL:
+            if key is None or key < node.key or (inclusive and key == node.key):
+                ceiling = node
+                node = node.left
+            else:
+                node = node.right
+        return ceiling
+
+    def __find_floor(self, key, inclusive):
+        """ Returns the node with the biggest key that's smaller than (or equal to, if inclusive) the given one """
+        floor = None
+        node = self.root
+        while node is not None and node.color != NIL:
+            if key is None or node.key < key or (inclusive and key == node.key):
+                floor = node
+                node = node.right
+            else:
+                node = node.left
+        return floor
+
+    def __count_smaller(self, key, or_equal):
+        count = 0
+        node = self.root
+        while node is not None and node.color != NIL:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                count += node.left.size + 1
+                node = node.right
+            else:
+                return count + node.left.size + int(or_equal)
+        return count
+
+    def __update_sizes(self, node):
+        """ Recalculates the subtree sizes from the given node up to the root """
+        while node is not None:
+            node.size = node.left.size + node.right.size + 1
+            node = node.parent
 
     def __remove(self, node):
         """
         Receives a node with 0 or 1 children (typically some sort of successor)
         and removes it according to its color/children
         :param node: Node with 0 or 1 children
-        :return:
+        :return: the lowest node whose subtree size has changed
         """
         left_child = node.left
         right_child = node.right
-        not_nil_child = left_child if left_child != self.NIL_LEAF else right_child
-        if node == self.root:
-            if not_nil_child != self.NIL_LEAF:
+        not_nil_child = left_child if left_child.color != NIL else right_child
+        if node is self.root:
+            if not_nil_child.color != NIL:
                 self.root = not_nil_child
             else:
                 self.root = None
-                return
+                return None
             self.root.parent = None
             self.root.color = BLACK
+            return None
         elif node.color == RED:
             if not node.has_children():
                 # Red node with no children, the simplest remove
                 self.__remove_leaf(node)
+                return node.parent
             else:
                 """
                 Since the node is red he cannot have a child.
@@ -136,27 +304,31 @@ class RedBlackTree:
                                 ' cannot have children, otherwise the black height of the tree becomes invalid! ')
             if not_nil_child.color == RED:
                 # swap the values with the red child and remove it  (basically un-link it)
-                node.value = not_nil_child.value
+                node.value, node.key = not_nil_child.value, not_nil_child.key
                 node.left = not_nil_child.left
                 node.right = not_nil_child.right
+                return node
             else:  # BLACK child
                 # 6 cases :o
                 self.__remove_black_node(node)
+                return node.parent
 
     def __remove_leaf(self, leaf):
         """ Simply removes a leaf node by making it's parent point to a NIL LEAF"""
-        if leaf.value >= leaf.parent.value:
-            # in those weird cases where they're equal due to the successor swap
+        if leaf.parent.right is leaf:
             leaf.parent.right = self.NIL_LEAF
         else:
             leaf.parent.left = self.NIL_LEAF
 
     def __remove_black_node(self, node):
         """
-        Loop through each case recursively until we reach a terminating case.
+        Loop through each case until we reach a terminating case.
+        Every case returns the next double black node to fix or None when it has terminated.
         What we're left with is a leaf node which is ready to be deleted without consequences
         """
-        self.__case_1(node)
+        double_black = node
+        while double_black is not None:
+            double_black = self.__case_1(double_black)
         self.__remove_leaf(node)
 
     def __case_1(self, node):
@@ -169,10 +341,10 @@ class RedBlackTree:
            /         \      ==>       /       \
           9B         20B            9B        20B
         """
-        if self.root == node:
+        if self.root is node:
             node.color = BLACK
-            return
-        self.__case_2(node)
+            return None
+        return self.__case_2(node)
 
     def __case_2(self, node):
         """
@@ -197,8 +369,8 @@ class RedBlackTree:
             self.ROTATIONS[direction](node=None, parent=sibling, grandfather=parent)
             parent.color = RED
             sibling.color = BLACK
-            return self.__case_1(node)
-        self.__case_3(node)
+            return node  # start again
+        return self.__case_3(node)
 
     def __case_3(self, node):
         """
@@ -225,9 +397,9 @@ class RedBlackTree:
             # color the sibling red and forward the double black node upwards
             # (call the cases again for the parent)
             sibling.color = RED
-            return self.__case_1(parent)  # start again
+            return parent  # start again
 
-        self.__case_4(node)
+        return self.__case_4(node)
 
     def __case_4(self, node):
         """
@@ -245,8 +417,8 @@ class RedBlackTree:
             sibling, direction = self.__get_sibling(node)
             if sibling.color == BLACK and sibling.left.color != RED and sibling.right.color != RED:
                 parent.color, sibling.color = sibling.color, parent.color  # switch colors
-                return  # Terminating
-        self.__case_5(node)
+                return None  # Terminating
+        return self.__case_5(node)
 
     def __case_5(self, node):
         """
@@ -273,7 +445,7 @@ class RedBlackTree:
             closer_node.color = BLACK
             sibling.color = RED
 
-        self.__case_6(node)
+        return self.__case_6(node)
 
     def __case_6(self, node):
         """
@@ -307,24 +479,30 @@ class RedBlackTree:
             sibling.left.color = BLACK
 
         if sibling.color == BLACK and outer_node.color == RED:
-            return __case_6_rotation(direction)  # terminating
+            __case_6_rotation(direction)
+            return None  # terminating
 
         raise Exception('We should have ended here, something is wrong')
 
     def __try_rebalance(self, node):
+        """ Fix red-red violations going upwards, a recolor hands its grandfather to the next iteration """
+        while node is not None:
+            node = self.__rebalance_step(node)
+
+    def __rebalance_step(self, node):
+        """ Does a single rotation/recolor and returns the next node to check or None if we're done """
         parent = node.parent
-        value = node.value
         if (parent is None  # what the fuck?
             or parent.parent is None  # parent is the root
             or parent.color != RED):  # no need to rebalance
-            return
+            return None
         grandfather = parent.parent
-        node_dir = 'L' if parent.value > value else 'R'
-        parent_dir = 'L' if grandfather.value > parent.value else 'R'
+        node_dir = 'L' if parent.left is node else 'R'
+        parent_dir = 'L' if grandfather.left is parent else 'R'
         uncle = grandfather.right if parent_dir == 'L' else grandfather.left
         general_direction = node_dir + parent_dir
 
-        if uncle == self.NIL_LEAF or uncle.color == BLACK:
+        if uncle.color != RED:
             # rotate
             if general_direction == 'LL':
                 self.__right_rotation(node, parent, grandfather, to_recolor=True)
@@ -340,8 +518,9 @@ class RedBlackTree:
                 self.__right_rotation(node=parent, parent=node, grandfather=grandfather, to_recolor=True)
             else:
                 raise Exception("{} is not a valid direction!".format(general_direction))
+            return None
         else:  # uncle is RED
-            self.__recolor(grandfather)
+            return self.__recolor(grandfather)
 
     def __update_parent(self, node, parent_old_child, new_parent):
         """
@@ -352,7 +531,7 @@ class RedBlackTree:
         node.parent = new_parent
         if new_parent:
             # Determine the old child's position in order to put node there
-            if new_parent.value > parent_old_child.value:
+            if new_parent.left is parent_old_child:
                 new_parent.left = node
             else:
                 new_parent.right = node
@@ -370,6 +549,9 @@ class RedBlackTree:
         grandfather.left = old_right  # save the old right values
         old_right.parent = grandfather
 
+        grandfather.size = grandfather.left.size + grandfather.right.size + 1
+        parent.size = parent.left.size + parent.right.size + 1
+
         if to_recolor:
             parent.color = BLACK
             node.color = RED
@@ -386,60 +568,87 @@ class RedBlackTree:
         grandfather.right = old_left  # save the old left values
         old_left.parent = grandfather
 
+        grandfather.size = grandfather.left.size + grandfather.right.size + 1
+        parent.size = parent.left.size + parent.right.size + 1
+
         if to_recolor:
             parent.color = BLACK
             node.color = RED
             grandfather.color = RED
 
     def __recolor(self, grandfather):
+        """ Recolors and returns the grandfather, as he might now be in a red-red violation """
         grandfather.right.color = BLACK
         grandfather.left.color = BLACK
-        if grandfather != self.root:
+        if grandfather is not self.root:
             grandfather.color = RED
-        self.__try_rebalance(grandfather)
+        return grandfather
 
-    def __find_parent(self, value):
-        """ Finds a place for the value in our binary tree"""
-        def __find(parent):
-            if value == parent.value:
-                return None, None
-            elif parent.value < value:
-                if parent.right.color == NIL:  # no more to go
-                    return parent, 'R'
-                return __find(parent.right)
-            elif value < parent.value:
+    def __key_of(self, value):
+        return value if self.key is None else self.key(value)
+
+    def __find_parent(self, key):
+        """ Finds a place for the key in our binary tree"""
+        parent = self.root
+        while True:
+            if key < parent.key:
                 if parent.left.color == NIL:  # no more to go
                     return parent, 'L'
-                return __find(parent.left)
-
-        return __find(self.root)
+                parent = parent.left
+            elif parent.key < key:
+                if parent.right.color == NIL:  # no more to go
+                    return parent, 'R'
+                parent = parent.right
+            else:
+                return None, None
 
     def find_node(self, value):
-        def __find_node(root):
-            if root is None or root == self.NIL_LEAF:
-                return None
-            if value > root.value:
-                return __find_node(root.right)
-            elif value < root.value:
-                return __find_node(root.left)
+        node = self.root
+        if node is None:
+            return None
+        key = self.__key_of(value)
+        while node.color != NIL:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                node = node.right
             else:
-                return root
-
-        found_node = __find_node(self.root)
-        return found_node
+                return node
+        return None
 
     def _find_in_order_successor(self, node):
+        """ Returns the node with the next bigger value or None if this is the biggest one """
         right_node = node.right
+        if right_node.color == NIL:
+            # go up until we come from a left child
+            while node.parent is not None and node.parent.right is node:
+                node = node.parent
+            return node.parent
         left_node = right_node.left
-        if left_node == self.NIL_LEAF:
+        if left_node.color == NIL:
             return right_node
-        while left_node.left != self.NIL_LEAF:
+        while left_node.left.color != NIL:
             left_node = left_node.left
         return left_node
 
+    def _find_in_order_predecessor(self, node):
+        """ Returns the node with the previous smaller value or None if this is the smallest one """
+        left_node = node.left
+        if left_node.color == NIL:
+            # go up until we come from a right child
+            while node.parent is not None and node.parent.left is node:
+                node = node.parent
+            return node.parent
+        right_node = left_node.right
+        if right_node.color == NIL:
+            return left_node
+        while right_node.right.color != NIL:
+            right_node = right_node.right
+        return right_node
+
     def __get_sibling(self, node):
         parent = node.parent
-        if node.value >= parent.value:
+        if parent.right is node:
             sibling = parent.left
             direction = 'L'
         else:
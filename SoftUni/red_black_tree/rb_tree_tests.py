@@ -1,6 +1,6 @@
 import unittest
 
-from homework.red_black_tree.rb_tree import RedBlackTree, Node
+from red_black_tree.rb_tree import RedBlackTree, Node
 BLACK = 'BLACK'
 RED = 'RED'
 NIL = 'NIL'
@@ -9,6 +9,35 @@ NIL_LEAF = RedBlackTree.NIL_LEAF
 
 class RbTreeTests(unittest.TestCase):
 
+    def assertValidRedBlackTree(self, rb_tree):
+        """
+        Asserts that the tree is ordered, has no red-red links, the same black height on every path
+        and correct subtree sizes
+        """
+        def black_height(node, low, high):
+            if node.color == NIL:
+                return 1
+            self.assertTrue(low is None or low < node.key)
+            self.assertTrue(high is None or node.key < high)
+            if node.color == RED:
+                self.assertNotEqual(node.left.color, RED)
+                self.assertNotEqual(node.right.color, RED)
+            if node.left.color != NIL:
+                self.assertIs(node.left.parent, node)
+            if node.right.color != NIL:
+                self.assertIs(node.right.parent, node)
+            self.assertEqual(node.size, node.left.size + node.right.size + 1)
+            left_height = black_height(node.left, low, node.key)
+            right_height = black_height(node.right, node.key, high)
+            self.assertEqual(left_height, right_height)
+            return left_height + int(node.color == BLACK)
+
+        if rb_tree.root is not None:
+            self.assertEqual(rb_tree.root.color, BLACK)
+            self.assertIsNone(rb_tree.root.parent)
+            black_height(rb_tree.root, None, None)
+            self.assertEqual(rb_tree.root.size, rb_tree.count)
+
     def test_find_node(self):
         """ Use the tree we get from the test_build function
             and test the find function on each node"""
@@ -2095,5 +2124,233 @@ class RbTreeTests(unittest.TestCase):
             self.assertEqual(rb_tree.count, 99-i)
         self.assertIsNone(rb_tree.root)
 
+    def test_add_contains_remove_many_random_values(self):
+        import random
+        values = [random.randint(-10000, 10000) for _ in range(3000)]
+        rb_tree = RedBlackTree()
+        for value in values:
+            rb_tree.add(value)
+        expected_values = sorted(set(values))
+        self.assertValidRedBlackTree(rb_tree)
+        self.assertEqual(list(rb_tree), expected_values)
+        self.assertEqual(rb_tree.count, len(expected_values))
+        for value in expected_values:
+            self.assertTrue(rb_tree.contains(value))
+        self.assertFalse(rb_tree.contains(10001))
+        random.shuffle(expected_values)
+        for value in expected_values:
+            rb_tree.remove(value)
+            self.assertFalse(rb_tree.contains(value))
+        self.assertIsNone(rb_tree.root)
+        self.assertEqual(list(rb_tree), [])
+
+    # ***************TEST BULK LOADING***************
+
+    def test_from_sorted_builds_valid_tree(self):
+        for count in list(range(20)) + [31, 32, 33, 1000, 1023, 1024]:
+            rb_tree = RedBlackTree.from_sorted(range(count))
+            self.assertValidRedBlackTree(rb_tree)
+            self.assertEqual(list(rb_tree), list(range(count)))
+            self.assertEqual(rb_tree.count, count)
+
+    def test_from_sorted_perfectly_balanced(self):
+        """
+                    ___3B___
+                  1B        5B
+                0R  2R    4R  6R
+        """
+        rb_tree = RedBlackTree.from_sorted([0, 1, 2, 3, 4, 5, 6])
+        root = rb_tree.root
+        self.assertEqual(root.value, 3)
+        self.assertEqual(root.color, BLACK)
+        self.assertEqual(root.left.value, 1)
+        self.assertEqual(root.left.color, BLACK)
+        self.assertEqual(root.right.value, 5)
+        self.assertEqual(root.right.color, BLACK)
+        for leaf in [root.left.left, root.left.right, root.right.left, root.right.right]:
+            self.assertEqual(leaf.color, RED)
+            self.assertEqual(leaf.left, NIL_LEAF)
+            self.assertEqual(leaf.right, NIL_LEAF)
+
+    def test_from_sorted_skips_duplicates_and_sorts_unsorted_values(self):
+        rb_tree = RedBlackTree.from_sorted([1, 1, 2, 3, 3, 3, 4])
+        self.assertValidRedBlackTree(rb_tree)
+        self.assertEqual(list(rb_tree), [1, 2, 3, 4])
+        self.assertEqual(rb_tree.count, 4)
+
+        rb_tree = RedBlackTree.from_sorted([5, -1, 3, 3, 10, 0])
+        self.assertValidRedBlackTree(rb_tree)
+        self.assertEqual(list(rb_tree), [-1, 0, 3, 5, 10])
+        self.assertEqual(rb_tree.count, 5)
+
+    def test_from_sorted_empty(self):
+        rb_tree = RedBlackTree.from_sorted([])
+        self.assertIsNone(rb_tree.root)
+        self.assertEqual(rb_tree.count, 0)
+        self.assertEqual(list(rb_tree), [])
+
+    def test_from_sorted_add_remove_keeps_tree_valid(self):
+        rb_tree = RedBlackTree.from_sorted(range(0, 200, 2))
+        for i in range(1, 200, 2):
+            rb_tree.add(i)
+        self.assertValidRedBlackTree(rb_tree)
+        self.assertEqual(list(rb_tree), list(range(200)))
+        for i in range(0, 200, 3):
+            rb_tree.remove(i)
+            self.assertFalse(rb_tree.contains(i))
+        self.assertValidRedBlackTree(rb_tree)
+        self.assertEqual(list(rb_tree), [i for i in range(200) if i % 3 != 0])
+
+    # ***************TEST ORDER STATISTICS***************
+
+    def test_select_rank_after_random_adds_and_removes(self):
+        import random
+        rb_tree = RedBlackTree()
+        values = set()
+        for _ in range(2000):
+            value = random.randint(0, 500)
+            if value in values and random.random() < 0.5:
+                rb_tree.remove(value)
+                values.remove(value)
+            else:
+                rb_tree.add(value)
+                values.add(value)
+        self.assertValidRedBlackTree(rb_tree)
+        sorted_values = sorted(values)
+        for idx, value in enumerate(sorted_values):
+            self.assertEqual(rb_tree.select(idx), value)
+            self.assertEqual(rb_tree[idx], value)
+            self.assertEqual(rb_tree[idx - len(sorted_values)], value)
+            self.assertEqual(rb_tree.rank(value), idx)
+
+    def test_select_out_of_range_raises(self):
+        rb_tree = RedBlackTree.from_sorted([1, 2, 3])
+        self.assertRaises(IndexError, rb_tree.select, 3)
+        self.assertRaises(IndexError, rb_tree.select, -1)
+        self.assertRaises(IndexError, lambda: rb_tree[3])
+        self.assertRaises(IndexError, lambda: rb_tree[-4])
+        self.assertRaises(IndexError, RedBlackTree().select, 0)
+        self.assertEqual(rb_tree[-1], 3)
+
+    def test_rank_of_missing_values(self):
+        rb_tree = RedBlackTree.from_sorted([10, 20, 30, 40])
+        self.assertEqual(rb_tree.rank(5), 0)
+        self.assertEqual(rb_tree.rank(10), 0)
+        self.assertEqual(rb_tree.rank(15), 1)
+        self.assertEqual(rb_tree.rank(40), 3)
+        self.assertEqual(rb_tree.rank(45), 4)
+        self.assertEqual(RedBlackTree().rank(1), 0)
+
+    def test_count_range(self):
+        rb_tree = RedBlackTree()
+        for value in range(0, 100, 5):
+            rb_tree.add(value)
+        self.assertEqual(rb_tree.count_range(0, 95), 20)
+        self.assertEqual(rb_tree.count_range(10, 20), 3)
+        self.assertEqual(rb_tree.count_range(11, 19), 1)
+        self.assertEqual(rb_tree.count_range(11, 14), 0)
+        self.assertEqual(rb_tree.count_range(-100, 7), 2)
+        self.assertEqual(rb_tree.count_range(96, 1000), 0)
+        self.assertEqual(rb_tree.count_range(20, 10), 0)
+        rb_tree.remove(15)
+        self.assertEqual(rb_tree.count_range(10, 20), 2)
+
+    # ***************TEST RANGES***************
+
+    def test_irange(self):
+        rb_tree = RedBlackTree()
+        for value in [50, 10, 40, 20, 30, 0, 60]:
+            rb_tree.add(value)
+        self.assertEqual(list(rb_tree.irange()), [0, 10, 20, 30, 40, 50, 60])
+        self.assertEqual(list(rb_tree.irange(10, 40)), [10, 20, 30, 40])
+        self.assertEqual(list(rb_tree.irange(10, 40, inclusive=(False, False))), [20, 30])
+        self.assertEqual(list(rb_tree.irange(10, 40, inclusive=(True, False))), [10, 20, 30])
+        self.assertEqual(list(rb_tree.irange(5, 45)), [10, 20, 30, 40])
+        self.assertEqual(list(rb_tree.irange(low=35)), [40, 50, 60])
+        self.assertEqual(list(rb_tree.irange(high=35)), [0, 10, 20, 30])
+        self.assertEqual(list(rb_tree.irange(41, 49)), [])
+        self.assertEqual(list(rb_tree.irange(40, 10)), [])
+        self.assertEqual(list(rb_tree.irange(61)), [])
+        self.assertEqual(list(RedBlackTree().irange(1, 2)), [])
+
+    def test_irange_reverse(self):
+        rb_tree = RedBlackTree.from_sorted([0, 10, 20, 30, 40, 50, 60])
+        self.assertEqual(list(rb_tree.irange(reverse=True)), [60, 50, 40, 30, 20, 10, 0])
+        self.assertEqual(list(rb_tree.irange(10, 40, reverse=True)), [40, 30, 20, 10])
+        self.assertEqual(list(rb_tree.irange(10, 40, inclusive=(False, False), reverse=True)), [30, 20])
+        self.assertEqual(list(rb_tree.irange(15, 55, reverse=True)), [50, 40, 30, 20])
+        self.assertEqual(list(rb_tree.irange(-5, -1, reverse=True)), [])
+
+    def test_irange_random_tree(self):
+        import random
+        from itertools import islice
+        values = random.sample(range(10000), 1500)
+        rb_tree = RedBlackTree()
+        for value in values:
+            rb_tree.add(value)
+        sorted_values = sorted(values)
+        for _ in range(50):
+            low, high = sorted(random.sample(range(10000), 2))
+            expected = [value for value in sorted_values if low <= value <= high]
+            self.assertEqual(list(rb_tree.irange(low, high)), expected)
+            self.assertEqual(list(rb_tree.irange(low, high, reverse=True)), expected[::-1])
+            self.assertEqual(list(islice(rb_tree.irange(low), 20)),
+                             [value for value in sorted_values if value >= low][:20])
+
+    # ***************TEST KEY FUNCTION***************
+
+    def test_key_orders_by_computed_key(self):
+        rb_tree = RedBlackTree(key=lambda value: -value)
+        for value in [5, 1, 4, 2, 3]:
+            rb_tree.add(value)
+        self.assertValidRedBlackTree(rb_tree)
+        self.assertEqual(list(rb_tree), [5, 4, 3, 2, 1])
+        self.assertTrue(rb_tree.contains(4))
+        self.assertFalse(rb_tree.contains(6))
+        self.assertEqual(rb_tree.rank(2), 3)
+        self.assertEqual(rb_tree[0], 5)
+        self.assertEqual(list(rb_tree.irange(4, 2)), [4, 3, 2])
+        self.assertEqual(rb_tree.count_range(4, 2), 3)
+        rb_tree.remove(4)
+        self.assertEqual(list(rb_tree), [5, 3, 2, 1])
+
+    def test_key_is_computed_once_per_value(self):
+        calls = []
+
+        def key(value):
+            calls.append(value)
+            return value[1]
+
+        rb_tree = RedBlackTree(key=key)
+        values = [('a', 3), ('b', 1), ('c', 2), ('d', 5), ('e', 4), ('f', 0)]
+        for value in values:
+            rb_tree.add(value)
+        self.assertEqual(calls, values)
+        self.assertEqual(list(rb_tree), sorted(values, key=lambda value: value[1]))
+        self.assertEqual(rb_tree.find_node(('x', 5)).value, ('d', 5))
+        # values with an equal key are duplicates
+        rb_tree.add(('z', 2))
+        self.assertEqual(rb_tree.count, len(values))
+
+    def test_key_remove_many(self):
+        import random
+        values = [str(i) for i in random.sample(range(5000), 1000)]
+        rb_tree = RedBlackTree(key=int)
+        for value in values:
+            rb_tree.add(value)
+        random.shuffle(values)
+        for value in values[:500]:
+            rb_tree.remove(value)
+        self.assertValidRedBlackTree(rb_tree)
+        self.assertEqual(list(rb_tree), sorted(values[500:], key=int))
+
+    def test_from_sorted_with_key(self):
+        rb_tree = RedBlackTree.from_sorted(['10', '9', '100', '9', '1'], key=int)
+        self.assertValidRedBlackTree(rb_tree)
+        self.assertEqual(list(rb_tree), ['1', '9', '10', '100'])
+        self.assertIsNotNone(rb_tree.key)
+        rb_tree.add('50')
+        self.assertEqual(list(rb_tree), ['1', '9', '10', '50', '100'])
+
 if __name__ == '__main__':
     unittest.main()
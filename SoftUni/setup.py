@@ -0,0 +1,8 @@
+from setuptools import setup
+
+setup(
+    name='red_black_tree',
+    version='1.0.0',
+    description='Red-Black Tree and the balanced Ordered Set built on top of it',
+    packages=['red_black_tree'],
+)
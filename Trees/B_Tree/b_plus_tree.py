@@ -0,0 +1,145 @@
+"""
+A B+Tree - every value lives in a leaf and the interior nodes hold only separator keys to route by.
+The leaves are chained with next/prev pointers in sorted order, so a range scan is a single descent to the first leaf
+followed by a sequential walk along the chain, instead of an in-order recursion through the interior nodes.
+
+A separator is a copy of the first value of its right child, so a value equal to a separator is found to its right.
+"""
+from bisect import bisect_left, bisect_right
+
+
+class BPlusLeaf:
+    __slots__ = ('values', 'next', 'prev')
+
+    def __init__(self, values=None):
+        self.values = values if values is not None else []
+        self.next = None
+        self.prev = None
+
+    def __repr__(self):
+        return 'BPlusLeaf {values}'.format(values=self.values)
+
+
+class BPlusInterior:
+    __slots__ = ('keys', 'children')
+
+    def __init__(self, keys=None, children=None):
+        self.keys = keys if keys is not None else []  # separators, children[i] holds the values below keys[i]
+        self.children = children if children is not None else []
+
+    def __repr__(self):
+        return 'BPlusInterior {keys}'.format(keys=self.keys)
+
+
+class BPlusTree:
+    def __init__(self, order=64):
+        """ order is the max count of children of an interior node and the max count of values in a leaf """
+        if order < 3:
+            raise Exception('The order must be at least 3!')
+        self.order = order
+        self.root = BPlusLeaf()
+        self.first = self.last = self.root  # the ends of the leaf chain
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, value):
+        leaf = self.__find_leaf(value)
+        value_idx = bisect_left(leaf.values, value)
+        return value_idx < len(leaf.values) and leaf.values[value_idx] == value
+
+    def __iter__(self):
+        leaf = self.first
+        while leaf is not None:
+            yield from leaf.values
+            leaf = leaf.next
+
+    def add(self, value) -> bool:
+        """ Adds the value, returns False if it was already in the tree """
+        path = []  # the interior nodes on the way down and the index of the child taken in each
+        node = self.root
+        while isinstance(node, BPlusInterior):
+            child_idx = bisect_right(node.keys, value)
+            path.append((node, child_idx))
+            node = node.children[child_idx]
+        value_idx = bisect_left(node.values, value)
+        if value_idx < len(node.values) and node.values[value_idx] == value:
+            return False
+        node.values.insert(value_idx, value)
+        self.count += 1
+        if len(node.values) > self.order:
+            self.__split(node, path)
+        return True
+
+    def range(self, lo=None, hi=None):
+        """ Returns a list of the values between lo and hi (inclusive, None means unbounded) """
+        values = []
+        for chunk in self.__chunks(lo, hi):
+            values.extend(chunk)
+        return values
+
+    def irange(self, lo=None, hi=None, reverse=False):
+        """ Lazily yields the values between lo and hi (inclusive, None means unbounded) """
+        if not reverse:
+            for chunk in self.__chunks(lo, hi):
+                yield from chunk
+            return
+        leaf = self.last if hi is None else self.__find_leaf(hi)
+        value_idx = len(leaf.values) if hi is None else bisect_right(leaf.values, hi)
+        while leaf is not None:
+            for idx in range(value_idx - 1, -1, -1):
+                value = leaf.values[idx]
+                if lo is not None and value < lo:
+                    return
+                yield value
+            leaf = leaf.prev
+            if leaf is not None:
+                value_idx = len(leaf.values)
+
+    def __chunks(self, lo, hi):
+        """ Goes down to the leaf of lo once and then walks the leaf chain, yielding the part of each leaf in range """
+        leaf = self.first if lo is None else self.__find_leaf(lo)
+        start = 0 if lo is None else bisect_left(leaf.values, lo)
+        while leaf is not None:
+            values = leaf.values
+            if hi is not None and values and values[-1] > hi:
+                # the last leaf of the range
+                yield values[start:bisect_right(values, hi)]
+                return
+            yield values[start:] if start else values
+            leaf = leaf.next
+            start = 0
+
+    def __find_leaf(self, value) -> BPlusLeaf:
+        node = self.root
+        while isinstance(node, BPlusInterior):
+            node = node.children[bisect_right(node.keys, value)]
+        return node
+
+    def __split(self, leaf, path):
+        """ Splits the overflowing leaf and then every interior node on the path that overflows as a result """
+        middle = len(leaf.values) // 2
+        new_leaf = BPlusLeaf(leaf.values[middle:])
+        del leaf.values[middle:]
+        new_leaf.prev, new_leaf.next = leaf, leaf.next
+        if leaf.next is not None:
+            leaf.next.prev = new_leaf
+        else:
+            self.last = new_leaf
+        leaf.next = new_leaf
+        separator, new_node = new_leaf.values[0], new_leaf
+
+        while path:
+            parent, child_idx = path.pop()
+            parent.keys.insert(child_idx, separator)
+            parent.children.insert(child_idx + 1, new_node)
+            if len(parent.children) <= self.order:
+                return
+            # the middle separator moves up, it isn't kept in either half
+            middle = len(parent.keys) // 2
+            separator = parent.keys[middle]
+            new_node = BPlusInterior(parent.keys[middle + 1:], parent.children[middle + 1:])
+            del parent.keys[middle:]
+            del parent.children[middle + 1:]
+        self.root = BPlusInterior([separator], [self.root, new_node])
@@ -0,0 +1,77 @@
+import random
+import sys
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from b_tree import BNode
+from b_plus_tree import BPlusTree
+
+
+# python b_plus_tree_benchmark.py 1000000
+
+
+def classic_range(node, lo, hi, result):
+    """ The in-order recursion a range scan needs on BNode, skipping the children outside [lo, hi] """
+    values, children = node.values, node.children
+    start, end = bisect_left(values, lo), bisect_right(values, hi)
+    if not children or children[0] is None:
+        result.extend(values[start:end])
+        return
+    for value_idx in range(start, end):
+        classic_range(children[value_idx], lo, hi, result)
+        result.append(values[value_idx])
+    classic_range(children[end] if end < len(values) else children[-1], lo, hi, result)
+
+
+def main():
+    test_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    order = 64
+    random.seed(2016)
+    keys = random.sample(range(test_count * 10), test_count)
+
+    b_tree = BNode(order=order)
+    b_plus_tree = BPlusTree(order=order)
+    for key in keys:
+        b_tree.add(key)
+        b_plus_tree.add(key)
+
+    print("Keys: {}, order: {}".format(test_count, order))
+    print("{:<10}{:<8}{:<18}{:<18}{}".format('width', 'scans', 'BNode', 'BPlusTree', 'values per second (B+Tree)'))
+    for width in [10, 100, 1000, 10000, 100000, 1000000]:
+        scans = max(1, 20000000 // width)  # the keys are a tenth of the key space, so ~2M values are scanned per width
+        starts = [random.randrange(test_count * 10) for _ in range(scans)]
+
+        start = datetime.now()
+        classic_total = 0
+        for lo in starts:
+            result = []
+            classic_range(b_tree, lo, lo + width, result)
+            classic_total += len(result)
+        classic_time = datetime.now() - start
+
+        start = datetime.now()
+        total = 0
+        for lo in starts:
+            total += len(b_plus_tree.range(lo, lo + width))
+        b_plus_time = datetime.now() - start
+
+        assert total == classic_total
+        print("{:<10}{:<8}{:<18}{:<18}{:.0f}".format(width, scans, str(classic_time), str(b_plus_time),
+                                                       total / b_plus_time.total_seconds()))
+
+
+if __name__ == '__main__':
+    main()
+"""
+Keys: 1000000, order: 64
+width     scans   BNode             BPlusTree         values per second (B+Tree)
+10        2000000 0:00:10.191102    0:00:07.928526    277500
+100       200000  0:00:01.299799    0:00:01.030208    1959004
+1000      20000   0:00:00.316065    0:00:00.188931    10581720
+10000     2000    0:00:00.166282    0:00:00.080173    24957567
+100000    200     0:00:00.137417    0:00:00.084075    23778067
+1000000   20      0:00:00.148869    0:00:00.072559    23361072
+
+Short scans are dominated by the descent, which costs about the same in both trees, so the B+Tree is only 20% faster.
+From ~100 values per scan on, the leaf walk copies whole slices of the leaves and doesn't go back up into the
+interior nodes, scanning about twice as fast as the in-order recursion over BNode.
+"""
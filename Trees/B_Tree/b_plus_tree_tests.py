@@ -0,0 +1,98 @@
+import random
+from unittest import TestCase
+
+from b_plus_tree import BPlusTree, BPlusInterior
+
+
+class BPlusTreeTests(TestCase):
+    def assertValidBPlusTree(self, tree):
+        """ Every leaf is at the same depth, every separator bounds its children and the leaf chain is sorted """
+        leaf_depths = set()
+        stack = [(tree.root, None, None, 0)]
+        while stack:
+            node, low, high, depth = stack.pop()
+            if isinstance(node, BPlusInterior):
+                self.assertEqual(len(node.keys) + 1, len(node.children))
+                self.assertLessEqual(len(node.children), tree.order)
+                bounds = [low] + node.keys + [high]
+                for child_idx, child in enumerate(node.children):
+                    stack.append((child, bounds[child_idx], bounds[child_idx + 1], depth + 1))
+            else:
+                leaf_depths.add(depth)
+                self.assertLessEqual(len(node.values), tree.order)
+                for value in node.values:
+                    self.assertTrue(low is None or low <= value)
+                    self.assertTrue(high is None or value < high)
+        self.assertEqual(1, len(leaf_depths))
+
+        values, leaf = [], tree.first
+        self.assertIsNone(leaf.prev)
+        while leaf is not None:
+            values.extend(leaf.values)
+            if leaf.next is not None:
+                self.assertIs(leaf, leaf.next.prev)
+            else:
+                self.assertIs(tree.last, leaf)
+            leaf = leaf.next
+        self.assertEqual(sorted(values), values)
+        self.assertEqual(tree.count, len(values))
+
+    def test_add_and_contains(self):
+        tree = BPlusTree(order=4)
+        for value in [5, 1, 9, 3, 7]:
+            self.assertTrue(tree.add(value))
+        self.assertFalse(tree.add(9))
+        self.assertIn(3, tree)
+        self.assertNotIn(4, tree)
+        self.assertEqual(5, len(tree))
+        self.assertEqual([1, 3, 5, 7, 9], list(tree))
+        self.assertValidBPlusTree(tree)
+
+    def test_many_values_stay_valid(self):
+        random.seed(3)
+        values = random.sample(range(100000), 5000)
+        for order in [3, 4, 5, 32]:
+            tree = BPlusTree(order=order)
+            for value in values:
+                tree.add(value)
+            self.assertValidBPlusTree(tree)
+            self.assertEqual(sorted(values), list(tree))
+            for value in values[::11]:
+                self.assertIn(value, tree)
+                self.assertFalse(tree.add(value))
+
+    def test_ascending_adds(self):
+        tree = BPlusTree(order=5)
+        for value in range(1000):
+            tree.add(value)
+        self.assertValidBPlusTree(tree)
+        self.assertEqual(list(range(1000)), list(tree))
+
+    def test_range(self):
+        random.seed(4)
+        values = random.sample(range(10000), 2000)
+        tree = BPlusTree(order=6)
+        for value in values:
+            tree.add(value)
+        values.sort()
+        for lo, hi in [(0, 9999), (100, 200), (-5, 50), (9990, 20000), (500, 500), (300, 100), (None, 30), (9900, None)]:
+            expected = [value for value in values if (lo is None or lo <= value) and (hi is None or value <= hi)]
+            self.assertEqual(expected, tree.range(lo, hi))
+            self.assertEqual(expected[::-1], list(tree.irange(lo, hi, reverse=True)))
+        self.assertEqual(values, tree.range())
+
+    def test_range_of_empty_tree(self):
+        tree = BPlusTree()
+        self.assertEqual([], tree.range(1, 10))
+        self.assertEqual([], list(tree.irange(reverse=True)))
+
+    def test_irange_is_lazy(self):
+        tree = BPlusTree(order=4)
+        for value in range(100):
+            tree.add(value)
+        values = tree.irange(10)
+        self.assertEqual([10, 11, 12], [next(values) for _ in range(3)])
+
+    def test_small_order_raises(self):
+        with self.assertRaises(Exception):
+            BPlusTree(order=2)
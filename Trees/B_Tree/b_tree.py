@@ -7,6 +7,8 @@ The tests are heavily commented and illustrated and are a good source of edge ca
 
 TODO: Heavy refactor, a lot of code is repeated and some is not clear enough
 """
+from bisect import bisect_left, bisect_right, insort
+from itertools import repeat
 
 
 class BNode:
@@ -20,28 +22,27 @@ class BNode:
     def add(self, value):
         if not self.__has_children():
             # Leaf: Add here
-            self.values.append(value)
-            self.values = sorted(self.values)
+            insort(self.values, value)
             if len(self.values) == self.max_values_count+1:
                 self.split()
         else:
             # Find downwards node :)
-            # try max left and max right first
-            if value < self.values[0]:
-                # go left
-                wanted_child = self.children[0]
-                wanted_child.add(value)
-            elif value > self.values[-1]:
-                # go right
-                wanted_child = self.children[-1]
-                wanted_child.add(value)
-            else:
-                # find middle
-                for i in range(1, len(self.values)):
-                    if value > self.values[i-1] and value < self.values[i]:
-                        wanted_child = self.children[i]
-                        wanted_child.add(value)
-                        break
+            child_idx = bisect_left(self.values, value)
+            if child_idx < len(self.values) and self.values[child_idx] == value:
+                return  # the value is already in here
+            self.__child_at(child_idx).add(value)
+
+    def __child_at(self, child_idx):
+        """ Returns the child between values[child_idx-1] and values[child_idx] """
+        return self.children[child_idx] if child_idx < len(self.values) else self.children[-1]
+
+    def __index_of(self, value):
+        """ Returns the index of the value in this node or None, using a binary search """
+        value_idx = bisect_left(self.values, value)
+        if value_idx < len(self.values) and self.values[value_idx] == value:
+            return value_idx
+        return None
+
     def try_transfer(self):
         if len(self.values) == 0:
             old_ch = [ch for ch in self.children]
@@ -113,29 +114,21 @@ class BNode:
 
     def remove(self, value):
         # find the appropriate root to remove
-        if value not in self.values:
+        value_idx = self.__index_of(value)
+        if value_idx is None:
             if not self.__has_children():
                 raise Exception('Value not in tree!')
-            if value < self.values[0]:  # before first
-                self.children[0].remove(value)
-            elif value > self.values[-1]:  # after last
-                self.children[-1].remove(value)
-            else:
-                for i in range(len(self.values)-1):
-                    if self.values[i] < value < self.values[i+1]:
-                        self.children[i+1].remove(value)
-                        break
+            self.__child_at(bisect_left(self.values, value)).remove(value)
             return
 
         if not self.__has_children():  # easy, simple remove
-            self.values.remove(value)
+            del self.values[value_idx]
             if len(self.values) == 0:  # try to do a transfer
                 self.parent.remove_merge(value, self)
             return
 
         # try to find predecessor and successor
         predecessor: BNode = self.get_predecessor(value)
-        value_idx = self.values.index(value)
         # predecessor: BNode = self.children[value_idx]
         # if predecessor.__has_children():
         #     predecessor = predecessor.children[-1]
@@ -149,7 +142,7 @@ class BNode:
             # TODO: It splits itself with predecessor.add an predecessor.remove
             # predecessor.add(value)
             # TODO: Children lost
-            self.values.remove(value)
+            del self.values[value_idx]
             # re-order children
             if len(self.children) == 2:
                 self.children = [self.children[0]]
@@ -481,12 +474,371 @@ class BNode:
                165
         A.get_predecessor(200) should return 165
         """
-        if value not in self.values:
+        value_idx = self.__index_of(value)
+        if value_idx is None:
             raise Exception("Can't get the predecessor of a value that does not exist!")
-        value_idx = self.values.index(value)
         predecessor: BNode = self.children[value_idx]  # get the smaller node
         # go right as much as possible
         while predecessor is not None and len(predecessor.children) > 0 and predecessor.children[-1] is not None:
             predecessor = predecessor.children[-1]
 
         return predecessor
+
+
+class BTreeNode:
+    """
+    A node of BTree - the same layout as BNode, with the values the keys map to in payloads, parallel to values.
+    It has no methods of its own, BTree keeps both lists in sync
+    """
+    __slots__ = ('parent', 'values', 'payloads', 'children')
+
+    def __init__(self, parent=None, order=6):
+        self.parent = parent
+        self.values = []
+        self.payloads = []
+        self.children = [None for _ in range(order)]
+
+
+class BTree:
+    """
+    An ordered map on top of BTreeNodes - the keys are a node's values and what they map to is kept in a parallel list.
+    Every operation walks the tree with a loop, remembering the path down where it needs to go back up,
+    instead of recursing like BNode does.
+    """
+    def __init__(self, order=6):
+        if order < 3:
+            raise Exception('The order must be at least 3!')
+        self.order = order
+        self.max_values_count = order - 1
+        self.min_values_count = (order + 1) // 2 - 1
+        self.root = BTreeNode(order=order)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        return self.__find(key) is not None
+
+    def __iter__(self):
+        for key, _ in self.items():
+            yield key
+
+    def get(self, key, default=None):
+        found = self.__find(key)
+        if found is None:
+            return default
+        node, key_idx = found
+        return node.payloads[key_idx]
+
+    def put(self, key, value):
+        """ Maps the key to the value, replacing the value the key had if it's already in the tree """
+        self.__put(key, value, replace=True)
+
+    def add(self, key):
+        """ Adds the key with no value, a key that's already in the tree keeps its value """
+        self.__put(key, None, replace=False)
+
+    def delete(self, key):
+        """
+        Removes the key and returns its value, raises a KeyError if it's not in the tree.
+        A key in an interior node is swapped with its predecessor so that a leaf always loses the key,
+        then every node on the way back up that's left short of keys borrows from or merges with a sibling
+        """
+        path = []  # the interior nodes on the way down and the index of the child taken in each
+        node = self.root
+        while True:
+            key_idx = bisect_left(node.values, key)
+            if key_idx < len(node.values) and node.values[key_idx] == key:
+                break
+            if _is_leaf(node):
+                raise KeyError(key)
+            path.append((node, key_idx))
+            node = node.children[key_idx]
+
+        value = node.payloads[key_idx]
+        if _is_leaf(node):
+            del node.values[key_idx]
+            del node.payloads[key_idx]
+        else:
+            # take the predecessor - the rightmost key of the left subtree
+            path.append((node, key_idx))
+            leaf = node.children[key_idx]
+            while not _is_leaf(leaf):
+                path.append((leaf, len(leaf.children) - 1))
+                leaf = leaf.children[-1]
+            node.values[key_idx], node.payloads[key_idx] = leaf.values.pop(), leaf.payloads.pop()
+            node = leaf
+        self.count -= 1
+
+        while path and len(node.values) < self.min_values_count:
+            parent, child_idx = path.pop()
+            self.__rebalance(parent, child_idx)
+            node = parent
+        if not self.root.values and not _is_leaf(self.root):
+            self.root = self.root.children[0]
+            self.root.parent = None
+        return value
+
+    def remove(self, key):
+        self.delete(key)
+
+    def min(self):
+        if self.count == 0:
+            raise Exception('The tree is empty!')
+        node = self.root
+        while not _is_leaf(node):
+            node = node.children[0]
+        return node.values[0]
+
+    def max(self):
+        if self.count == 0:
+            raise Exception('The tree is empty!')
+        node = self.root
+        while not _is_leaf(node):
+            node = node.children[len(node.values)]
+        return node.values[-1]
+
+    def floor(self, key):
+        """ Returns the biggest key that's smaller than or equal to the given one, None if there's no such key """
+        floor, node = None, self.root
+        while True:
+            key_idx = bisect_right(node.values, key)
+            if key_idx > 0:
+                floor = node.values[key_idx - 1]
+                if floor == key:
+                    return floor
+            if _is_leaf(node):
+                return floor
+            node = node.children[key_idx]
+
+    def ceiling(self, key):
+        """ Returns the smallest key that's bigger than or equal to the given one, None if there's no such key """
+        ceiling, node = None, self.root
+        while True:
+            key_idx = bisect_left(node.values, key)
+            if key_idx < len(node.values):
+                ceiling = node.values[key_idx]
+                if ceiling == key:
+                    return ceiling
+            if _is_leaf(node):
+                return ceiling
+            node = node.children[key_idx]
+
+    def items(self, lo=None, hi=None):
+        """
+        Lazily yields the (key, value) pairs with keys between lo and hi (inclusive, None means unbounded).
+        The stack holds the ancestors of the current node along with the index of the next key to yield in each
+        """
+        stack = []
+        node = self.root
+        key_idx = 0 if lo is None else bisect_left(node.values, lo)
+        while not _is_leaf(node):
+            stack.append((node, key_idx))
+            node = node.children[key_idx]
+            key_idx = 0 if lo is None else bisect_left(node.values, lo)
+        while True:
+            for key, value in zip(node.values[key_idx:], node.payloads[key_idx:]):
+                if hi is not None and key > hi:
+                    return
+                yield key, value
+            # go up to the first ancestor with a key left
+            while stack:
+                node, key_idx = stack.pop()
+                if key_idx < len(node.values):
+                    break
+            else:
+                return
+            key = node.values[key_idx]
+            if hi is not None and key > hi:
+                return
+            yield key, node.payloads[key_idx]
+            # and down to the leftmost leaf of the subtree after that key
+            stack.append((node, key_idx + 1))
+            node = node.children[key_idx + 1]
+            while not _is_leaf(node):
+                stack.append((node, 0))
+                node = node.children[0]
+            key_idx = 0
+
+    def height(self):
+        levels, node = 1, self.root
+        while not _is_leaf(node):
+            node = node.children[0]
+            levels += 1
+        return levels
+
+    @classmethod
+    def bulk_load(cls, sorted_iterable, fill_factor=0.9, order=6):
+        """ Builds a tree out of sorted, unique keys which map to None, see bulk_load_items """
+        return cls.bulk_load_items(zip(sorted_iterable, repeat(None)), fill_factor, order)
+
+    @classmethod
+    def bulk_load_items(cls, sorted_items, fill_factor=0.9, order=6):
+        """
+        Builds a tree out of (key, value) pairs sorted by unique keys in a single pass, without a single split.
+        Every node is filled up to fill_factor of its capacity. Once a node is filled, the next key goes up to
+        its parent as a separator and a new node is started to its right - only the rightmost node of every level is
+        kept open, so the items are streamed and never collected in a list.
+        At the end, the rightmost nodes may be short of keys and take some from their left siblings - O(n)
+        """
+        if not 0 < fill_factor <= 1:
+            raise Exception('The fill factor must be between 0 and 1!')
+        tree = cls(order)
+        fill = min(max(int(tree.max_values_count * fill_factor), tree.min_values_count, 1), tree.max_values_count)
+        open_nodes = [tree.root]  # the rightmost node of every level, leaves first
+        leaf = tree.root
+        leaf_keys, leaf_values = leaf.values, leaf.payloads
+        last = None
+        count = 0
+        for key, value in sorted_items:
+            if count and not last < key:
+                raise Exception('The keys must be sorted and unique!')
+            last = key
+            count += 1
+            if len(leaf_keys) < fill:
+                leaf_keys.append(key)
+                leaf_values.append(value)
+                continue
+            leaf = BTreeNode(order=order)
+            leaf_keys, leaf_values = leaf.values, leaf.payloads
+            tree.__push_separator(open_nodes, key, value, leaf, fill)
+        tree.count = count
+        for level in reversed(range(len(open_nodes) - 1)):
+            node = open_nodes[level]
+            while node.parent is not None and len(node.values) < tree.min_values_count:
+                parent = node.parent
+                tree.__rebalance(parent, len(parent.children) - 1)
+                node = parent
+        if not tree.root.values and not _is_leaf(tree.root):
+            tree.root = tree.root.children[0]
+            tree.root.parent = None
+        return tree
+
+    def __find(self, key):
+        """ Returns the node with the key and the key's index in it, or None """
+        node = self.root
+        while True:
+            key_idx = bisect_left(node.values, key)
+            if key_idx < len(node.values) and node.values[key_idx] == key:
+                return node, key_idx
+            if _is_leaf(node):
+                return None
+            node = node.children[key_idx]
+
+    def __put(self, key, value, replace):
+        path = []  # the interior nodes on the way down and the index of the child taken in each
+        node = self.root
+        while True:
+            key_idx = bisect_left(node.values, key)
+            if key_idx < len(node.values) and node.values[key_idx] == key:
+                if replace:
+                    node.payloads[key_idx] = value
+                return
+            if _is_leaf(node):
+                break
+            path.append((node, key_idx))
+            node = node.children[key_idx]
+        node.values.insert(key_idx, key)
+        node.payloads.insert(key_idx, value)
+        self.count += 1
+
+        # split the nodes that overflowed, going back up
+        while len(node.values) > self.max_values_count:
+            middle = len(node.values) // 2
+            right = BTreeNode(order=self.order)
+            right.values, right.payloads = node.values[middle + 1:], node.payloads[middle + 1:]
+            middle_key, middle_value = node.values[middle], node.payloads[middle]
+            del node.values[middle:]
+            del node.payloads[middle:]
+            if not _is_leaf(node):
+                right.children = node.children[middle + 1:]
+                del node.children[middle + 1:]
+                for child in right.children:
+                    child.parent = right
+            if not path:
+                # the root is split, the tree grows a level
+                self.root = BTreeNode(order=self.order)
+                self.root.values, self.root.payloads = [middle_key], [middle_value]
+                self.root.children = [node, right]
+                node.parent = right.parent = self.root
+                return
+            parent, child_idx = path.pop()
+            parent.values.insert(child_idx, middle_key)
+            parent.payloads.insert(child_idx, middle_value)
+            parent.children.insert(child_idx + 1, right)
+            right.parent = parent
+            node = parent
+
+    def __push_separator(self, open_nodes, separator, value, new_node, fill):
+        """
+        Adds the separator and the new node after it to the parent level,
+        starting new nodes on the levels above for as long as they're filled
+        """
+        level = 1
+        while level < len(open_nodes):
+            parent = open_nodes[level]
+            open_nodes[level - 1] = new_node
+            if len(parent.values) < fill:
+                parent.values.append(separator)
+                parent.payloads.append(value)
+                parent.children.append(new_node)
+                new_node.parent = parent
+                return
+            # the parent is filled, the separator goes further up and the new node starts a new parent
+            new_parent = BTreeNode(order=self.order)
+            new_parent.children = [new_node]
+            new_node.parent = new_parent
+            new_node = new_parent
+            level += 1
+        # the root is filled, the tree grows a level
+        old_root = open_nodes[-1]
+        open_nodes[-1] = new_node
+        root = BTreeNode(order=self.order)
+        root.values, root.payloads = [separator], [value]
+        root.children = [old_root, new_node]
+        old_root.parent = new_node.parent = root
+        open_nodes.append(root)
+        self.root = root
+
+    def __rebalance(self, parent, child_idx):
+        """
+        Fixes the child of the parent that's short of keys.
+        It takes keys from a sibling through the separator between them when the two have enough for both,
+        otherwise the two are merged together with the separator - which takes a key away from the parent
+        """
+        if child_idx > 0:
+            left_idx = child_idx - 1
+        else:
+            left_idx = child_idx
+        left, right = parent.children[left_idx], parent.children[left_idx + 1]
+        keys = left.values + [parent.values[left_idx]] + right.values
+        values = left.payloads + [parent.payloads[left_idx]] + right.payloads
+        is_leaf = _is_leaf(left)
+        children = None if is_leaf else left.children + right.children
+
+        if len(keys) > 2 * self.min_values_count:
+            middle = len(keys) // 2
+            left.values, right.values = keys[:middle], keys[middle + 1:]
+            left.payloads, right.payloads = values[:middle], values[middle + 1:]
+            parent.values[left_idx], parent.payloads[left_idx] = keys[middle], values[middle]
+            if not is_leaf:
+                left.children, right.children = children[:middle + 1], children[middle + 1:]
+                for child in left.children:
+                    child.parent = left
+                for child in right.children:
+                    child.parent = right
+            return
+
+        left.values, left.payloads = keys, values
+        if not is_leaf:
+            left.children = children
+            for child in right.children:
+                child.parent = left
+        del parent.values[left_idx]
+        del parent.payloads[left_idx]
+        del parent.children[left_idx + 1]
+
+
+def _is_leaf(node: 'BTreeNode'):
+    return node.children[0] is None
@@ -0,0 +1,40 @@
+import sys
+from datetime import datetime
+from b_tree import BTree
+
+
+# python b_tree_bulk_load_benchmark.py 10000000
+
+
+def main():
+    test_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    order = 128
+
+    print("Keys: {}, order: {}".format(test_count, order))
+    tree = BTree(order=order)
+    start = datetime.now()
+    for key in range(test_count):
+        tree.add(key)
+    print("One add at a time: {}, height {}".format(datetime.now() - start, tree.height()))
+    del tree
+
+    for fill_factor in [0.5, 0.9, 1]:
+        start = datetime.now()
+        tree = BTree.bulk_load(range(test_count), fill_factor=fill_factor, order=order)
+        print("bulk_load with fill_factor={}: {}, height {}".format(fill_factor, datetime.now() - start, tree.height()))
+        del tree
+
+
+if __name__ == '__main__':
+    main()
+"""
+Keys: 10000000, order: 128
+One add at a time: 0:00:21.731835, height 4
+bulk_load with fill_factor=0.5: 0:00:05.140557, height 4
+bulk_load with fill_factor=0.9: 0:00:03.866204, height 4
+bulk_load with fill_factor=1: 0:00:03.746980, height 4
+
+bulk_load is 5-6 times faster - it appends every key once, while add goes down from the root for each key
+and splits a leaf every ~64 keys, leaving every leaf but the last half empty.
+(Before the tree kept a value for every key, bulk_load took 2.5s.)
+"""
@@ -0,0 +1,59 @@
+import random
+import sys
+import tracemalloc
+from datetime import datetime
+from b_tree import BTree
+
+
+# python b_tree_map_benchmark.py 1000000
+
+
+def main():
+    test_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    order = 128
+    random.seed(2016)
+    values = [object() for _ in range(test_count)]  # allocated up front, so only the structures are measured
+
+    tracemalloc.start()
+    keys_tree = BTree.bulk_load(range(test_count), order=order)
+    shadow = {key: values[key] for key in range(test_count)}
+    shadow_memory = tracemalloc.get_traced_memory()[0]
+    del keys_tree, shadow
+
+    tracemalloc.reset_peak()
+    start_memory = tracemalloc.get_traced_memory()[0]
+    tree = BTree.bulk_load_items(zip(range(test_count), values), order=order)
+    map_memory = tracemalloc.get_traced_memory()[0] - start_memory
+    tracemalloc.stop()
+
+    print("Keys: {}, order: {}".format(test_count, order))
+    print("BTree of keys and a shadow dict: {:.1f}MB".format(shadow_memory / 2 ** 20))
+    print("BTree mapping the keys:          {:.1f}MB".format(map_memory / 2 ** 20))
+
+    lookups = [random.randrange(test_count) for _ in range(1000000)]
+    start = datetime.now()
+    for key in lookups:
+        tree.get(key)
+    print("1000000 gets: {}".format(datetime.now() - start))
+    start = datetime.now()
+    for key in lookups[:100000]:
+        tree.put(key, None)
+    print("100000 puts: {}".format(datetime.now() - start))
+    start = datetime.now()
+    for key in set(lookups[:100000]):
+        tree.delete(key)
+    print("{} deletes: {}".format(len(set(lookups[:100000])), datetime.now() - start))
+
+
+if __name__ == '__main__':
+    main()
+"""
+Keys: 1000000, order: 128
+BTree of keys and a shadow dict: 129.2MB
+BTree mapping the keys:          58.7MB
+1000000 gets: 0:00:03.167498
+100000 puts: 0:00:00.347827
+95122 deletes: 0:00:00.246004
+
+Keeping the values in the nodes, in a list parallel to the keys, takes less than half the memory of the shadow dict.
+"""
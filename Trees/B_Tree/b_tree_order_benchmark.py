@@ -0,0 +1,73 @@
+import random
+import sys
+from bisect import bisect_left
+from datetime import datetime
+from b_tree import BNode
+
+
+# python b_tree_order_benchmark.py 10000000
+
+
+def contains(root, value):
+    """ The same routing as BNode.add, going down until the value is found or a leaf is reached """
+    node = root
+    while True:
+        value_idx = bisect_left(node.values, value)
+        if value_idx < len(node.values) and node.values[value_idx] == value:
+            return True
+        if node.children[0] is None:
+            return False
+        node = node.children[value_idx] if value_idx < len(node.values) else node.children[-1]
+
+
+def height(root):
+    levels = 1
+    while root.children[0] is not None:
+        root = root.children[0]
+        levels += 1
+    return levels
+
+
+def main():
+    test_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    lookup_count = min(test_count, 1000000)
+    random.seed(2016)
+    keys = random.sample(range(test_count * 10), test_count)
+    lookups = random.sample(keys, lookup_count)
+    print("Keys: {}, lookups: {}".format(test_count, lookup_count))
+    print("{:<8}{:<8}{:<18}{}".format('order', 'height', 'insert', 'lookup'))
+    for order in [4, 8, 16, 32, 64, 128, 256, 512]:
+        root = BNode(order=order)
+        start = datetime.now()
+        for key in keys:
+            root.add(key)
+        insert_time = datetime.now() - start
+        start = datetime.now()
+        for key in lookups:
+            assert contains(root, key)
+        lookup_time = datetime.now() - start
+        print("{:<8}{:<8}{:<18}{}".format(order, height(root), str(insert_time), lookup_time))
+
+
+if __name__ == '__main__':
+    main()
+"""
+Keys: 10000000, lookups: 1000000
+order   height  insert            lookup
+4       15      0:07:57.423021    0:00:16.384281
+8       10      0:04:14.132946    0:00:11.512452
+16      7       0:02:31.526580    0:00:08.306368
+32      6       0:01:32.688725    0:00:07.051203
+64      5       0:01:20.909177    0:00:06.239819
+128     4       0:01:04.721765    0:00:03.679893
+256     4       0:00:45.919751    0:00:03.866509
+512     3       0:00:53.592072    0:00:05.162581
+
+Before the binary search routing, a node was scanned value by value and a leaf was sorted after every add,
+so a bigger order only made each node slower. With 100000 keys, the inserts took:
+order 4: 1.30s, order 64: 0.64s, order 512: 1.14s - against 1.28s, 0.45s and 0.22s now.
+Now the work per node is O(log order), so the tree should be as wide as possible:
+the best fan-out is in the 128-256 range, where the tree is 4 levels high for 10 million keys.
+Past that, the list insert of a leaf (a memmove of order/2 pointers) and the split copies start to cost more than
+the saved level, order 512 is slower than 256 for both inserting and looking up.
+"""
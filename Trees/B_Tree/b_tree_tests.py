@@ -1,6 +1,7 @@
+import random
 from unittest import TestCase
 
-from b_tree import BNode
+from b_tree import BNode, BTree, BTreeNode
 
 
 # TODO: get_predecessor/get_successor tests
@@ -1412,3 +1413,184 @@ class BNodeTests(TestCase):
         self.assertElementsInExpectedOrder([250, 350], H.values)
         self.assertEqual(G.parent, C)
         self.assertEqual(H.parent, C)
+
+
+class BTreeTestCase(TestCase):
+    def assertValidBTree(self, tree):
+        """ Every leaf is at the same depth, every node but the root is at least half full and the parents match """
+        min_values_count = (tree.order + 1) // 2 - 1
+        leaf_depths = set()
+        stack = [(tree.root, None, None, 0)]
+        self.assertIsNone(tree.root.parent)
+        while stack:
+            node, low, high, depth = stack.pop()
+            self.assertIsInstance(node, BTreeNode)
+            self.assertLessEqual(len(node.values), tree.order - 1)
+            if node is not tree.root:
+                self.assertGreaterEqual(len(node.values), min_values_count)
+            self.assertEqual(sorted(node.values), node.values)
+            self.assertEqual(len(node.values), len(node.payloads))
+            for value in node.values:
+                self.assertTrue(low is None or low < value)
+                self.assertTrue(high is None or value < high)
+            if not any(node.children):
+                leaf_depths.add(depth)
+                continue
+            self.assertEqual(len(node.values) + 1, len(node.children))
+            bounds = [low] + node.values + [high]
+            for child_idx, child in enumerate(node.children):
+                self.assertIs(node, child.parent)
+                stack.append((child, bounds[child_idx], bounds[child_idx + 1], depth + 1))
+        self.assertEqual(1, len(leaf_depths))
+
+
+class BTreeBulkLoadTests(BTreeTestCase):
+    def test_bulk_load_keeps_every_value(self):
+        for order in [3, 4, 5, 6, 11, 64]:
+            for count in [0, 1, 2, 5, 17, 100, 1001, 5000]:
+                for fill_factor in [0.5, 0.9, 1]:
+                    tree = BTree.bulk_load(range(count), fill_factor=fill_factor, order=order)
+                    self.assertEqual(list(range(count)), list(tree))
+                    self.assertValidBTree(tree)
+
+    def test_bulk_load_packs_leaves(self):
+        tree = BTree.bulk_load(range(10000), fill_factor=0.9, order=101)
+        leaf = tree.root
+        while any(leaf.children):
+            leaf = leaf.children[0]
+        self.assertEqual(90, len(leaf.values))
+        self.assertEqual(3, tree.height())
+
+    def test_bulk_load_streams(self):
+        def values():
+            yield from range(0, 3000, 3)
+
+        tree = BTree.bulk_load(values(), order=6)
+        self.assertEqual(list(range(0, 3000, 3)), list(tree))
+
+    def test_add_after_bulk_load(self):
+        tree = BTree.bulk_load(range(0, 2000, 2), fill_factor=1, order=6)
+        for value in range(1, 2000, 2):
+            tree.add(value)
+        self.assertEqual(list(range(2000)), list(tree))
+
+    def test_bulk_load_unsorted_raises(self):
+        with self.assertRaises(Exception):
+            BTree.bulk_load([1, 3, 2])
+        with self.assertRaises(Exception):
+            BTree.bulk_load([1, 2, 2])
+
+    def test_invalid_fill_factor_raises(self):
+        with self.assertRaises(Exception):
+            BTree.bulk_load(range(10), fill_factor=0)
+        with self.assertRaises(Exception):
+            BTree.bulk_load(range(10), fill_factor=1.5)
+
+    def test_bulk_load_items(self):
+        tree = BTree.bulk_load_items(((key, str(key)) for key in range(500)), order=5)
+        self.assertValidBTree(tree)
+        self.assertEqual(500, len(tree))
+        self.assertEqual([(key, str(key)) for key in range(500)], list(tree.items()))
+
+
+class BTreeMapTests(BTreeTestCase):
+    def test_put_and_get(self):
+        tree = BTree(order=4)
+        tree.put(5, 'five')
+        tree.put(1, 'one')
+        tree.put(5, 'FIVE')
+        self.assertEqual('FIVE', tree.get(5))
+        self.assertEqual('one', tree.get(1))
+        self.assertIsNone(tree.get(2))
+        self.assertEqual('none', tree.get(2, 'none'))
+        self.assertIn(1, tree)
+        self.assertNotIn(2, tree)
+        self.assertEqual(2, len(tree))
+
+    def test_add_keeps_the_value(self):
+        tree = BTree()
+        tree.put(1, 'one')
+        tree.add(1)
+        tree.add(2)
+        self.assertEqual([(1, 'one'), (2, None)], list(tree.items()))
+
+    def test_random_puts_and_deletes_match_a_dict(self):
+        random.seed(5)
+        for order in [3, 4, 5, 6, 16]:
+            tree, expected = BTree(order=order), {}
+            for _ in range(3000):
+                key = random.randrange(500)
+                if random.random() < 0.6:
+                    tree.put(key, key * 2)
+                    expected[key] = key * 2
+                elif key in expected:
+                    self.assertEqual(expected.pop(key), tree.delete(key))
+                else:
+                    with self.assertRaises(KeyError):
+                        tree.delete(key)
+            self.assertValidBTree(tree)
+            self.assertEqual(len(expected), len(tree))
+            self.assertEqual(sorted(expected.items()), list(tree.items()))
+            for key in list(expected):
+                tree.delete(key)
+                self.assertNotIn(key, tree)
+            self.assertValidBTree(tree)
+            self.assertEqual(0, len(tree))
+            self.assertEqual([], list(tree))
+
+    def test_delete_after_bulk_load(self):
+        tree = BTree.bulk_load(range(1000), order=5)
+        for key in range(0, 1000, 2):
+            tree.delete(key)
+        self.assertValidBTree(tree)
+        self.assertEqual(list(range(1, 1000, 2)), list(tree))
+
+    def test_min_and_max(self):
+        tree = BTree(order=3)
+        with self.assertRaises(Exception):
+            tree.min()
+        with self.assertRaises(Exception):
+            tree.max()
+        for key in [50, 20, 80, 10, 90, 30]:
+            tree.put(key, None)
+        self.assertEqual(10, tree.min())
+        self.assertEqual(90, tree.max())
+
+    def test_floor_and_ceiling(self):
+        tree = BTree.bulk_load(range(0, 1000, 10), order=4)
+        self.assertEqual(500, tree.floor(500))
+        self.assertEqual(500, tree.floor(509))
+        self.assertEqual(990, tree.floor(5000))
+        self.assertIsNone(tree.floor(-1))
+        self.assertEqual(500, tree.ceiling(500))
+        self.assertEqual(510, tree.ceiling(501))
+        self.assertEqual(0, tree.ceiling(-100))
+        self.assertIsNone(tree.ceiling(991))
+        for key in range(-5, 1000):
+            self.assertEqual(key // 10 * 10 if key >= 0 else None, tree.floor(key))
+
+    def test_items_range(self):
+        random.seed(6)
+        keys = sorted(random.sample(range(10000), 1000))
+        tree = BTree(order=5)
+        for key in keys:
+            tree.put(key, -key)
+        for lo, hi in [(None, None), (100, 200), (-5, 50), (9990, 20000), (500, 500), (300, 100), (None, 30), (9900, None)]:
+            expected = [(key, -key) for key in keys if (lo is None or lo <= key) and (hi is None or key <= hi)]
+            self.assertEqual(expected, list(tree.items(lo, hi)))
+
+    def test_items_is_lazy(self):
+        tree = BTree.bulk_load(range(100), order=4)
+        items = tree.items(10)
+        self.assertEqual([10, 11, 12], [next(items)[0] for _ in range(3)])
+
+    def test_tall_tree(self):
+        tree = BTree(order=3)
+        for key in range(20000):
+            tree.put(key, key)
+        self.assertGreater(tree.height(), 10)
+        self.assertValidBTree(tree)
+        self.assertEqual(19999, tree.floor(10 ** 6))
+        for key in range(20000):
+            tree.delete(key)
+        self.assertEqual(0, len(tree))
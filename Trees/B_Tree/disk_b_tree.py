@@ -0,0 +1,282 @@
+"""
+A B-Tree of 64-bit integer keys which lives in a file instead of memory.
+
+Every node is a fixed-size page of the file, which is accessed through mmap.
+The pages are read through a buffer pool that keeps the most recently used ones deserialized in memory,
+evicting the least recently used page when it's full and writing it back only if it was changed.
+A node holds hundreds of keys, so a point lookup reads O(log_B n) pages - 3 or 4 pages for tens of millions of keys.
+
+Page layout (little-endian):
+    is_leaf (1 byte), padding (1 byte), key count (2 bytes), the keys (8 bytes each), the child page ids (4 bytes each)
+Page 0 holds the file header - a magic string, the page size, the root page id, the page count and the key count.
+"""
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from collections import OrderedDict
+
+PAGE_SIZE = 4096
+MAGIC = b'BTRE'
+FILE_HEADER = struct.Struct('<4sIIIQ')  # magic, page size, root page id, page count, key count
+PAGE_HEADER = struct.Struct('<?xH')  # is_leaf, key count
+KEY_SIZE, CHILD_SIZE = 8, 4
+MIN_KEY, MAX_KEY = -2 ** 63, 2 ** 63 - 1
+
+
+class Page:
+    """ A deserialized node """
+    __slots__ = ('page_id', 'is_leaf', 'keys', 'children', 'dirty')
+
+    def __init__(self, page_id, is_leaf, keys=None, children=None):
+        self.page_id = page_id
+        self.is_leaf = is_leaf
+        self.keys = keys if keys is not None else []
+        self.children = children if children is not None else []  # page ids
+        self.dirty = False
+
+    def __repr__(self):
+        return 'Page {id} with {count} keys'.format(id=self.page_id, count=len(self.keys))
+
+
+class Pager:
+    """ Reads and writes whole pages of the file through mmap, growing the file when a new page is needed """
+    def __init__(self, path, page_size=PAGE_SIZE):
+        self.page_size = page_size
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, 'r+b' if not is_new else 'w+b')
+        if is_new:
+            self.file.truncate(page_size * 16)
+        self.mm = mmap.mmap(self.file.fileno(), 0)
+        self.is_new = is_new
+
+    def read_header(self):
+        return FILE_HEADER.unpack_from(self.mm, 0)
+
+    def write_header(self, root_page_id, page_count, key_count):
+        FILE_HEADER.pack_into(self.mm, 0, MAGIC, self.page_size, root_page_id, page_count, key_count)
+
+    def read(self, page_id) -> Page:
+        offset = page_id * self.page_size
+        is_leaf, key_count = PAGE_HEADER.unpack_from(self.mm, offset)
+        offset += PAGE_HEADER.size
+        keys = list(struct.unpack_from('<{}q'.format(key_count), self.mm, offset))
+        children = []
+        if not is_leaf:
+            offset += key_count * KEY_SIZE
+            children = list(struct.unpack_from('<{}I'.format(key_count + 1), self.mm, offset))
+        return Page(page_id, is_leaf, keys, children)
+
+    def write(self, page: Page):
+        offset = page.page_id * self.page_size
+        self.ensure_size(page.page_id + 1)
+        PAGE_HEADER.pack_into(self.mm, offset, page.is_leaf, len(page.keys))
+        offset += PAGE_HEADER.size
+        struct.pack_into('<{}q'.format(len(page.keys)), self.mm, offset, *page.keys)
+        if not page.is_leaf:
+            offset += len(page.keys) * KEY_SIZE
+            struct.pack_into('<{}I'.format(len(page.children)), self.mm, offset, *page.children)
+
+    def ensure_size(self, page_count):
+        """ Doubles the file until it fits page_count pages, mmap can't grow so it's mapped again """
+        size = len(self.mm)
+        if page_count * self.page_size <= size:
+            return
+        while size < page_count * self.page_size:
+            size *= 2
+        self.mm.close()
+        self.file.truncate(size)
+        self.mm = mmap.mmap(self.file.fileno(), 0)
+
+    def flush(self):
+        self.mm.flush()
+
+    def close(self):
+        self.mm.close()
+        self.file.close()
+
+
+class BufferPool:
+    """
+    Keeps up to capacity deserialized pages, in least recently used order.
+    A page is written back to the file only when it is evicted or flushed, and only if it's dirty.
+    The pages an operation holds are always the most recently used ones, so they are never evicted under it.
+    """
+    def __init__(self, pager: Pager, capacity=1024):
+        if capacity < 8:
+            raise Exception('The buffer pool needs at least 8 pages!')
+        self.pager = pager
+        self.capacity = capacity
+        self.pages = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def fetch(self, page_id) -> Page:
+        page = self.pages.get(page_id)
+        if page is not None:
+            self.pages.move_to_end(page_id)
+            self.hits += 1
+            return page
+        self.misses += 1
+        page = self.pager.read(page_id)
+        self.__cache(page)
+        return page
+
+    def add(self, page: Page):
+        """ Caches a newly created page """
+        page.dirty = True
+        self.__cache(page)
+
+    def flush(self):
+        for page in self.pages.values():
+            if page.dirty:
+                self.pager.write(page)
+                page.dirty = False
+
+    def __cache(self, page):
+        self.pages[page.page_id] = page
+        if len(self.pages) > self.capacity:
+            # written back before it's dropped, so a failed write doesn't lose the page
+            evicted = next(iter(self.pages.values()))
+            if evicted.dirty:
+                self.pager.write(evicted)
+                evicted.dirty = False
+            self.pages.popitem(last=False)
+
+
+class DiskBTree:
+    def __init__(self, path, cache_pages=1024, page_size=PAGE_SIZE):
+        self.pager = Pager(path, page_size)
+        self.pool = BufferPool(self.pager, cache_pages)
+        # the header and the keys need to fit: a node with max_keys keys has max_keys+1 children
+        self.max_keys = (page_size - PAGE_HEADER.size - CHILD_SIZE) // (KEY_SIZE + CHILD_SIZE)
+        if self.max_keys % 2 == 0:
+            self.max_keys -= 1  # an odd count splits into two halves around the middle key
+        if self.pager.is_new:
+            self.root_page_id, self.page_count, self.count = 1, 2, 0
+            self.pool.add(Page(1, is_leaf=True))
+        else:
+            magic, stored_page_size, self.root_page_id, self.page_count, self.count = self.pager.read_header()
+            if magic != MAGIC or stored_page_size != page_size:
+                raise Exception('{path} is not a B-Tree file with {size}-byte pages!'.format(path=path, size=page_size))
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        if not _is_valid_key(key):
+            return False
+        page = self.pool.fetch(self.root_page_id)
+        while True:
+            key_idx = bisect_left(page.keys, key)
+            if key_idx < len(page.keys) and page.keys[key_idx] == key:
+                return True
+            if page.is_leaf:
+                return False
+            page = self.pool.fetch(page.children[key_idx])
+
+    def __iter__(self):
+        """ In-order traversal, the stack holds (page id, index of the next child to visit) """
+        stack = [(self.root_page_id, 0)]
+        while stack:
+            page_id, child_idx = stack.pop()
+            page = self.pool.fetch(page_id)
+            if page.is_leaf:
+                yield from page.keys
+                continue
+            if child_idx > 0:
+                yield page.keys[child_idx - 1]
+            if child_idx + 1 < len(page.children):
+                stack.append((page_id, child_idx + 1))
+            stack.append((page.children[child_idx], 0))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def add(self, key) -> bool:
+        """
+        Adds the key, returns False if it was already in the tree.
+        Full nodes are split on the way down, so a split never has to go back up - one pass, no parent pointers
+        """
+        if not _is_valid_key(key):
+            raise Exception('The key {key} is not a 64-bit integer!'.format(key=key))
+        root = self.pool.fetch(self.root_page_id)
+        if len(root.keys) == self.max_keys:
+            if self.__find_in(root, key):
+                return False
+            new_root = self.__new_page(is_leaf=False)
+            new_root.children.append(root.page_id)
+            self.__split_child(new_root, 0, root)
+            self.root_page_id = new_root.page_id
+            root = new_root
+        page = root
+        while True:
+            key_idx = bisect_left(page.keys, key)
+            if key_idx < len(page.keys) and page.keys[key_idx] == key:
+                return False
+            if page.is_leaf:
+                page.keys.insert(key_idx, key)
+                page.dirty = True
+                self.count += 1
+                return True
+            child = self.pool.fetch(page.children[key_idx])
+            if len(child.keys) == self.max_keys:
+                if self.__find_in(child, key):
+                    return False
+                self.__split_child(page, key_idx, child)
+                if page.keys[key_idx] == key:
+                    return False
+                if page.keys[key_idx] < key:
+                    child = self.pool.fetch(page.children[key_idx + 1])
+            page = child
+
+    def flush(self):
+        """ Writes every dirty page and the header to the file """
+        self.pool.flush()
+        self.pager.write_header(self.root_page_id, self.page_count, self.count)
+        self.pager.flush()
+
+    def close(self):
+        self.flush()
+        self.pager.close()
+
+    def height(self):
+        levels = 1
+        page = self.pool.fetch(self.root_page_id)
+        while not page.is_leaf:
+            page = self.pool.fetch(page.children[0])
+            levels += 1
+        return levels
+
+    def __new_page(self, is_leaf) -> Page:
+        page = Page(self.page_count, is_leaf)
+        self.page_count += 1
+        self.pager.ensure_size(self.page_count)
+        self.pool.add(page)
+        return page
+
+    def __split_child(self, parent, child_idx, child):
+        """ Moves the upper half of the full child to a new sibling and its middle key up to the parent """
+        middle = len(child.keys) // 2
+        sibling = self.__new_page(child.is_leaf)
+        sibling.keys = child.keys[middle + 1:]
+        parent.keys.insert(child_idx, child.keys[middle])
+        parent.children.insert(child_idx + 1, sibling.page_id)
+        del child.keys[middle:]
+        if not child.is_leaf:
+            sibling.children = child.children[middle + 1:]
+            del child.children[middle + 1:]
+        parent.dirty = child.dirty = True
+
+    @staticmethod
+    def __find_in(page, key):
+        key_idx = bisect_left(page.keys, key)
+        return key_idx < len(page.keys) and page.keys[key_idx] == key
+
+
+def _is_valid_key(key):
+    """ Only keys that fit the page's signed 64-bit slots can be added, bools are ints but not keys """
+    return isinstance(key, int) and not isinstance(key, bool) and MIN_KEY <= key <= MAX_KEY
@@ -0,0 +1,50 @@
+import os
+import random
+import sys
+import tempfile
+from datetime import datetime
+from disk_b_tree import DiskBTree
+
+
+# python disk_b_tree_benchmark.py 10000000
+
+
+def main():
+    test_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    lookup_count = min(test_count, 100000)
+    cache_pages = 4096  # 16MB of 4KB pages
+    random.seed(2016)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'tree.db')
+        with DiskBTree(path, cache_pages=cache_pages) as tree:
+            start = datetime.now()
+            for _ in range(test_count):
+                tree.add(random.getrandbits(62))
+            tree.flush()
+            insert_time = datetime.now() - start
+            print("Inserted {} keys in {}, the file is {}MB, {} pages, height {}".format(
+                len(tree), insert_time, os.path.getsize(path) // 2 ** 20, tree.page_count, tree.height()))
+
+            lookups = [random.getrandbits(62) for _ in range(lookup_count)]
+            tree.pool.hits = tree.pool.misses = 0
+            start = datetime.now()
+            for key in lookups:
+                key in tree
+            lookup_time = datetime.now() - start
+            touched = tree.pool.hits + tree.pool.misses
+            print("{} lookups in {}, {:.2f} pages touched and {:.2f} read from the file per lookup".format(
+                lookup_count, lookup_time, touched / lookup_count, tree.pool.misses / lookup_count))
+
+
+if __name__ == '__main__':
+    main()
+"""
+Inserted 10000000 keys in 0:04:46.983783, the file is 256MB, 40965 pages, height 3
+100000 lookups in 0:00:02.349954, 3.00 pages touched and 0.90 read from the file per lookup
+
+A page holds up to 339 keys, so 10 million keys take 3 levels.
+The root and the interior pages stay in the 16MB buffer pool, only the leaf is read from the file -
+less than one page per lookup since some leaves are still cached.
+The inserts are mostly spent deserializing the missed leaves and serializing the evicted ones.
+"""
@@ -0,0 +1,142 @@
+import os
+import random
+import tempfile
+from unittest import TestCase
+
+from disk_b_tree import DiskBTree, BufferPool, Pager, Page
+
+
+class DiskBTreeTests(TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, 'tree.db')
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_add_and_contains(self):
+        with DiskBTree(self.path) as tree:
+            self.assertTrue(tree.add(5))
+            self.assertTrue(tree.add(-3))
+            self.assertFalse(tree.add(5))
+            self.assertIn(5, tree)
+            self.assertIn(-3, tree)
+            self.assertNotIn(4, tree)
+            self.assertEqual(2, len(tree))
+
+    def test_many_keys_split_and_stay_sorted(self):
+        random.seed(1)
+        keys = random.sample(range(10 ** 9), 20000)
+        # small pages make a tall tree
+        with DiskBTree(self.path, cache_pages=8, page_size=128) as tree:
+            for key in keys:
+                self.assertTrue(tree.add(key))
+            for key in keys[::7]:
+                self.assertFalse(tree.add(key))
+            self.assertEqual(len(keys), len(tree))
+            self.assertEqual(sorted(keys), list(tree))
+            self.assertGreater(tree.height(), 3)
+            for key in keys[::13]:
+                self.assertIn(key, tree)
+                self.assertNotIn(key + 10 ** 9, tree)
+
+    def test_keys_persist_after_reopening(self):
+        keys = list(range(0, 30000, 3))
+        random.seed(2)
+        random.shuffle(keys)
+        with DiskBTree(self.path, cache_pages=16) as tree:
+            for key in keys:
+                tree.add(key)
+        with DiskBTree(self.path, cache_pages=16) as tree:
+            self.assertEqual(len(keys), len(tree))
+            self.assertEqual(sorted(keys), list(tree))
+            tree.add(1)
+        with DiskBTree(self.path) as tree:
+            self.assertIn(1, tree)
+            self.assertEqual(len(keys) + 1, len(tree))
+
+    def test_lookup_reads_a_page_per_level(self):
+        with DiskBTree(self.path) as tree:
+            for key in range(200000):
+                tree.add(key)
+            tree.flush()
+            tree.pool.pages.clear()
+            tree.pool.misses = 0
+            self.assertIn(123456, tree)
+            self.assertEqual(3, tree.pool.misses)
+            self.assertEqual(3, tree.height())
+
+    def test_out_of_range_key_raises_and_keeps_the_tree_writable(self):
+        with DiskBTree(self.path, cache_pages=8, page_size=128) as tree:
+            tree.add(1)
+            for key in [2 ** 63, -2 ** 63 - 1, 1.5, '2']:
+                with self.assertRaises(Exception):
+                    tree.add(key)
+                self.assertNotIn(key, tree)
+            self.assertTrue(tree.add(2 ** 63 - 1))
+            self.assertTrue(tree.add(-2 ** 63))
+            for key in range(2, 4000):
+                tree.add(key)
+            tree.flush()
+        with DiskBTree(self.path, page_size=128) as tree:
+            self.assertEqual([-2 ** 63] + list(range(1, 4000)) + [2 ** 63 - 1], list(tree))
+
+    def test_reopening_with_another_page_size_raises(self):
+        with DiskBTree(self.path) as tree:
+            tree.add(1)
+        with self.assertRaises(Exception):
+            DiskBTree(self.path, page_size=1024)
+
+
+class BufferPoolTests(TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.pager = Pager(os.path.join(self.dir.name, 'pages.db'), page_size=256)
+
+    def tearDown(self):
+        self.pager.close()
+        self.dir.cleanup()
+
+    def test_evicts_least_recently_used(self):
+        pool = BufferPool(self.pager, capacity=8)
+        for page_id in range(1, 9):
+            pool.add(Page(page_id, is_leaf=True, keys=[page_id]))
+        pool.fetch(1)  # 2 is the least recently used now
+        pool.add(Page(9, is_leaf=True))
+        self.assertIn(1, pool.pages)
+        self.assertNotIn(2, pool.pages)
+
+    def test_dirty_page_is_written_back_on_eviction(self):
+        pool = BufferPool(self.pager, capacity=8)
+        pool.add(Page(1, is_leaf=False, keys=[10, 20], children=[2, 3, 4]))
+        for page_id in range(2, 10):
+            pool.add(Page(page_id, is_leaf=True))
+        self.assertNotIn(1, pool.pages)
+        page = pool.fetch(1)
+        self.assertFalse(page.is_leaf)
+        self.assertEqual([10, 20], page.keys)
+        self.assertEqual([2, 3, 4], page.children)
+
+    def test_clean_page_is_not_written_back(self):
+        pool = BufferPool(self.pager, capacity=8)
+        pool.add(Page(1, is_leaf=True, keys=[7]))
+        pool.flush()
+        page = pool.fetch(1)
+        page.keys.append(8)  # changed without being marked dirty
+        for page_id in range(2, 10):
+            pool.add(Page(page_id, is_leaf=True))
+        self.assertEqual([7], pool.fetch(1).keys)
+
+    def test_failed_write_back_keeps_the_page(self):
+        pool = BufferPool(self.pager, capacity=8)
+        pool.add(Page(1, is_leaf=True, keys=[2 ** 63]))  # can't be packed
+        for page_id in range(2, 9):
+            pool.add(Page(page_id, is_leaf=True))
+        with self.assertRaises(Exception):
+            pool.add(Page(9, is_leaf=True))
+        self.assertIn(1, pool.pages)
+        self.assertTrue(pool.pages[1].dirty)
+
+    def test_too_small_capacity_raises(self):
+        with self.assertRaises(Exception):
+            BufferPool(self.pager, capacity=2)
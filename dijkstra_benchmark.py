@@ -0,0 +1,92 @@
+import os
+import random
+import sys
+from datetime import datetime
+from fibonacci_heap import FibHeap
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'SoftUni', 'Advanced Tree Structures'))
+from binary_heap import BinaryHeap, IndexedBinaryHeap
+
+
+# python dijkstra_benchmark.py 1000000
+
+
+def dijkstra_fib_heap(graph):
+    distances = {0: 0}
+    heap = FibHeap()
+    nodes = {0: heap.insert(0, 0)}
+    while len(heap) > 0:
+        node = heap.delete_min()
+        del nodes[node.item]
+        for neighbour, weight in graph[node.item]:
+            distance = node.value + weight
+            if neighbour not in distances:
+                distances[neighbour] = distance
+                nodes[neighbour] = heap.insert(distance, neighbour)
+            elif distance < distances[neighbour] and neighbour in nodes:
+                distances[neighbour] = distance
+                heap.decrease_key(nodes[neighbour], distance)
+    return distances
+
+
+def dijkstra_indexed_binary_heap(graph):
+    distances = {0: 0}
+    heap = IndexedBinaryHeap([(0, 0)], order='min')
+    while len(heap) > 0:
+        vertex = heap.extract_max()
+        for neighbour, weight in graph[vertex]:
+            distance = distances[vertex] + weight
+            if neighbour not in distances:
+                distances[neighbour] = distance
+                heap.insert(neighbour, distance)
+            elif distance < distances[neighbour] and neighbour in heap:
+                distances[neighbour] = distance
+                heap.update_priority(neighbour, distance)
+    return distances
+
+
+def dijkstra_binary_heap(graph):
+    """ Without decrease-key - a vertex is pushed again with its new distance and the stale entries are skipped """
+    distances = {0: 0}
+    visited = set()
+    heap = BinaryHeap([(0, 0)], order='min')
+    while len(heap) > 0:
+        distance, vertex = heap.extract_max()
+        if vertex in visited:
+            continue
+        visited.add(vertex)
+        for neighbour, weight in graph[vertex]:
+            new_distance = distance + weight
+            if neighbour not in distances or new_distance < distances[neighbour]:
+                distances[neighbour] = new_distance
+                heap.insert((new_distance, neighbour))
+    return distances
+
+
+def main():
+    edge_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    vertex_count = edge_count // 10
+    random.seed(2016)
+    graph = [[] for _ in range(vertex_count)]
+    for _ in range(edge_count):
+        graph[random.randrange(vertex_count)].append((random.randrange(vertex_count), random.randint(1, 1000)))
+    results = []
+    for name, dijkstra in [('FibHeap', dijkstra_fib_heap), ('IndexedBinaryHeap', dijkstra_indexed_binary_heap),
+                           ('BinaryHeap, lazy deletion', dijkstra_binary_heap)]:
+        start = datetime.now()
+        results.append(dijkstra(graph))
+        print("{:<27}{}".format(name, datetime.now() - start))
+    assert results[0] == results[1] == results[2]
+    print("Vertices: {}, edges: {}".format(vertex_count, edge_count))
+
+
+if __name__ == '__main__':
+    main()
+"""
+FibHeap                    0:00:03.085919
+IndexedBinaryHeap          0:00:03.385545
+BinaryHeap, lazy deletion  0:00:03.474227
+Vertices: 100000, edges: 1000000
+
+The FibHeap wins by a little - with 10 edges per vertex most relaxations are decrease-keys,
+which are O(1) for it and O(log n) for the binary heaps.
+"""
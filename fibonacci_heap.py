@@ -1,17 +1,30 @@
-from collections import deque
+"""
+A Fibonacci min-heap.
+
+The roots and the children of every node are kept in circular doubly-linked lists,
+so adding a tree, cutting a node out and melding two heaps are all O(1).
+The work is postponed until delete_min, which links the trees of equal rank together.
+decrease_key cuts the node out of its parent and cuts every marked ancestor (one that has already lost a child) too,
+which keeps the trees bushy enough for an O(log n) amortized delete_min and an O(1) amortized decrease_key.
+"""
 
 
 class FibNode:
-    def __init__(self, value):
+    __slots__ = ('value', 'item', 'parent', 'child', 'left', 'right', 'rank', 'marked')
+
+    def __init__(self, value, item=None):
+        """ value is what the heap is ordered by, item is an optional payload """
         self.value = value
-        self.children = []
-        self.rank = 0
+        self.item = item
+        self.parent = None
+        self.child = None  # any one of the children
+        self.left = self
+        self.right = self
+        self.rank = 0  # the count of children
+        self.marked = False
 
-    def add_child(self, value):
-        if self.rank == 0:
-            self.rank = 1
-        self.rank += value.rank
-        self.children.append(value)
+    def __repr__(self):
+        return 'FibNode {val}'.format(val=self.value)
 
     def __lt__(self, other):
         if not isinstance(other, FibNode):
@@ -23,58 +36,203 @@ class FibNode:
             return self.value == other
         return self.value == other.value
 
+    __hash__ = object.__hash__  # nodes are handles, two nodes with the same value are still different
+
+    def add_child(self, node):
+        node.parent = self
+        node.marked = False
+        node.left = node.right = node
+        if self.child is None:
+            self.child = node
+        else:
+            _splice(self.child, node)
+        self.rank += 1
+
+    def children(self):
+        """ Returns a list of the node's children """
+        children = []
+        if self.child is not None:
+            child = self.child
+            while True:
+                children.append(child)
+                child = child.right
+                if child is self.child:
+                    break
+        return children
+
 
 class FibHeap:
     def __init__(self):
-        self.root_list = []
-        self.min = float('inf')
+        self.min = None
+        self.count = 0
 
-    def add_node(self, value):
-        if value < self.min:
-            self.min = value
-        self.root_list.append(value)
+    def __len__(self):
+        return self.count
 
-    def delete_min(self):
-        min_node = self.min
-        self.root_list.remove(self.min)
-        for child in self.min.children:
-            self.add_node(child)
+    def insert(self, value, item=None) -> FibNode:
+        """ Adds the value and returns its node, which is the handle for decrease_key and delete """
+        return self.add_node(FibNode(value, item))
 
-        if not self.root_list:
-            self.min = None
-            return min_node
-        self.min = min(self.root_list)
-
-        ranks = {}
-        # Consolidate trees so that no two trees have the same rank
-        for root in self.root_list:
-            if root.rank in ranks:
-                if ranks[root.rank] != root:
-                    continue
-                taken_root = ranks[root.rank]
-                if taken_root < root:
-                    taken_root.add_child(root)
-                else:
-                    root.add_child(taken_root)
-            else:
-                ranks[root.rank] = root
+    def add_node(self, node: FibNode) -> FibNode:
+        """ Adds the node to the root list - O(1) """
+        node.left = node.right = node
+        self.__add_root(node)
+        self.count += 1
+        return node
 
+    def find_min(self) -> FibNode:
+        return self.min
+
+    def delete_min(self) -> FibNode:
+        """ Removes the min node, makes its children roots and consolidates the roots - O(log n) amortized """
+        min_node = self.min
+        if min_node is None:
+            raise Exception('The heap is empty!')
+        for child in min_node.children():
+            child.parent = None
+            child.marked = False
+        if min_node.child is not None:
+            _splice(min_node, min_node.child)  # the children join the root list
+            min_node.child = None
+        if min_node.right is min_node:
+            self.min = None
+        else:
+            self.min = min_node.right
+            _unlink(min_node)
+            self.__consolidate()
+        min_node.left = min_node.right = min_node
+        min_node.rank = 0
+        self.count -= 1
         return min_node
 
-fh = FibHeap()
-fh.add_node(FibNode(5))
-fh.add_node(FibNode(2))
-fh.add_node(FibNode(6))
-fh.add_node(FibNode(1431))
-fh.add_node(FibNode(0))
-fh.add_node(FibNode(1))
-
-
-assert 0 == fh.delete_min()
-assert 1 == fh.delete_min()
-assert 2 == fh.delete_min()
-assert 5 == fh.delete_min()
-print(fh.delete_min().value)
-print(fh.delete_min().value)
-# print(fh.delete_min().value)
-# print(fh.delete_min().value)
+    def decrease_key(self, node: FibNode, value):
+        """ Lowers the node's value, cutting it out of its parent if it got smaller - O(1) amortized """
+        if node.value < value:
+            raise Exception('The new value {new} is bigger than the current one {old}!'.format(new=value, old=node.value))
+        node.value = value
+        parent = node.parent
+        if parent is not None and value < parent.value:
+            self.__cut(node, parent)
+            self.__cascading_cut(parent)
+        if value < self.min.value:
+            self.min = node
+
+    def delete(self, node: FibNode):
+        """ Removes the node from the heap - O(log n) amortized """
+        parent = node.parent
+        if parent is not None:
+            self.__cut(node, parent)
+            self.__cascading_cut(parent)
+        self.min = node  # it's a root now, so making it the min and deleting the min removes it
+        self.delete_min()
+
+    def meld(self, other):
+        """ Moves all the nodes of the other heap in this one by splicing the two root lists - O(1) """
+        if other.min is None:
+            return
+        if self.min is None:
+            self.min = other.min
+        else:
+            _splice(self.min, other.min)
+            if other.min.value < self.min.value:
+                self.min = other.min
+        self.count += other.count
+        other.min = None
+        other.count = 0
+
+    def __add_root(self, node):
+        if self.min is None:
+            self.min = node
+        else:
+            _splice(self.min, node)
+            if node.value < self.min.value:
+                self.min = node
+
+    def __cut(self, node, parent):
+        """ Moves the node from its parent's children to the root list """
+        if node.right is node:
+            parent.child = None
+        else:
+            if parent.child is node:
+                parent.child = node.right
+            _unlink(node)
+        parent.rank -= 1
+        node.parent = None
+        node.marked = False
+        node.left = node.right = node
+        _splice(self.min, node)
+
+    def __cascading_cut(self, node):
+        """ A node that loses a second child is cut out as well, and so on up the tree """
+        while node.parent is not None:
+            if not node.marked:
+                node.marked = True
+                return
+            parent = node.parent
+            self.__cut(node, parent)
+            node = parent
+
+    def __consolidate(self):
+        """ Links roots of the same rank until every rank is left with a single root """
+        roots = []
+        root = self.min
+        while True:
+            roots.append(root)
+            root = root.right
+            if root is self.min:
+                break
+        # the rank of a tree with n nodes is at most log_phi(n) < 1.45 log2(n)
+        roots_by_rank = [None] * (self.count.bit_length() * 3 // 2 + 2)
+        for root in roots:
+            rank = root.rank
+            while roots_by_rank[rank] is not None:
+                other = roots_by_rank[rank]
+                roots_by_rank[rank] = None
+                if other.value < root.value:
+                    root, other = other, root
+                _unlink(other)
+                root.add_child(other)
+                rank += 1
+            roots_by_rank[rank] = root
+
+        self.min = None
+        for root in roots_by_rank:
+            if root is not None and (self.min is None or root.value < self.min.value):
+                self.min = root
+
+
+def _splice(first, second):
+    """ Joins the circular list of second into the one of first, right after first - O(1) """
+    first_right, second_left = first.right, second.left
+    first.right = second
+    second.left = first
+    second_left.right = first_right
+    first_right.left = second_left
+
+
+def _unlink(node):
+    """ Takes the node out of its circular list """
+    node.left.right = node.right
+    node.right.left = node.left
+
+
+def main():
+    fh = FibHeap()
+    fh.add_node(FibNode(5))
+    fh.add_node(FibNode(2))
+    fh.add_node(FibNode(6))
+    fh.add_node(FibNode(1431))
+    fh.add_node(FibNode(0))
+    fh.add_node(FibNode(1))
+    assert 0 == fh.delete_min()
+    assert 1 == fh.delete_min()
+    assert 2 == fh.delete_min()
+    assert 5 == fh.delete_min()
+    print(fh.delete_min().value)
+    print(fh.delete_min().value)
+    # print(fh.delete_min().value)
+    # print(fh.delete_min().value)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+import random
+import unittest
+from fibonacci_heap import FibHeap, FibNode
+
+
+class FibHeapTests(unittest.TestCase):
+    def assertValidHeap(self, heap):
+        """ Checks the heap order, the ranks, the parent pointers and the count """
+        def check(node, parent):
+            count = 0
+            nodes = [node]
+            sibling = node.right
+            while sibling is not node:
+                nodes.append(sibling)
+                sibling = sibling.right
+            for node in nodes:
+                self.assertIs(node.left.right, node)
+                self.assertIs(node.parent, parent)
+                if parent is not None:
+                    self.assertLessEqual(parent.value, node.value)
+                self.assertEqual(node.rank, len(node.children()))
+                count += 1
+                if node.child is not None:
+                    count += check(node.child, node)
+            return count
+        if heap.min is None:
+            self.assertEqual(len(heap), 0)
+            return
+        self.assertEqual(check(heap.min, None), len(heap))
+
+    def test_delete_min_should_return_sorted_values(self):
+        nums = [random.randint(-1000, 1000) for _ in range(1000)]
+        heap = FibHeap()
+        for num in nums:
+            heap.insert(num)
+        result = []
+        while len(heap) > 0:
+            result.append(heap.delete_min().value)
+            if len(result) % 100 == 0:
+                self.assertValidHeap(heap)
+        self.assertEqual(result, sorted(nums))
+
+    def test_add_node(self):
+        heap = FibHeap()
+        for num in [5, 2, 6, 0]:
+            heap.add_node(FibNode(num))
+        self.assertEqual(heap.find_min(), 0)
+        self.assertEqual(heap.delete_min(), 0)
+        self.assertEqual(heap.delete_min(), 2)
+
+    def test_delete_min_from_empty_heap_should_raise(self):
+        self.assertRaises(Exception, FibHeap().delete_min)
+
+    def test_decrease_key_should_reorder(self):
+        heap = FibHeap()
+        nodes = {item: heap.insert(random.randint(0, 10000), item) for item in range(1000)}
+        del nodes[heap.delete_min().item]  # consolidates the roots into trees
+        expected = {item: node.value for item, node in nodes.items()}
+        for _ in range(2000):
+            item = random.choice(list(nodes))
+            new_value = expected[item] - random.randint(0, 100)
+            heap.decrease_key(nodes[item], new_value)
+            expected[item] = new_value
+        self.assertValidHeap(heap)
+        result = [heap.delete_min().value for _ in range(len(heap))]
+        self.assertEqual(result, sorted(expected.values()))
+
+    def test_decrease_key_to_bigger_value_should_raise(self):
+        heap = FibHeap()
+        node = heap.insert(5)
+        self.assertRaises(Exception, heap.decrease_key, node, 6)
+
+    def test_delete_should_remove_node(self):
+        heap = FibHeap()
+        nodes = [heap.insert(num) for num in range(500)]
+        heap.delete_min()
+        for node in nodes[1::3]:
+            heap.delete(node)
+        self.assertValidHeap(heap)
+        result = [heap.delete_min().value for _ in range(len(heap))]
+        self.assertEqual(result, [num for num in range(1, 500) if num % 3 != 1])
+
+    def test_meld_should_move_all_nodes(self):
+        first, second = FibHeap(), FibHeap()
+        for num in range(0, 100, 2):
+            first.insert(num)
+        for num in range(1, 100, 2):
+            second.insert(num)
+        first.delete_min()
+        second.delete_min()
+        first.meld(second)
+        self.assertEqual(len(first), 98)
+        self.assertEqual(len(second), 0)
+        self.assertIsNone(second.find_min())
+        self.assertValidHeap(first)
+        self.assertEqual([first.delete_min().value for _ in range(98)], list(range(2, 100)))
+
+if __name__ == '__main__':
+    unittest.main()
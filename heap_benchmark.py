@@ -0,0 +1,142 @@
+"""
+Runs the same push/pop/decrease-key traces through every heap.
+Every value is unique (value * handle_count + handle), so all the heaps pop the same handles in the same order,
+and the values never go below the last popped one, so the RadixHeap can run them too.
+"""
+import os
+import random
+import sys
+from datetime import datetime
+from fibonacci_heap import FibHeap
+from pairing_heap import PairingHeap
+from radix_heap import RadixHeap
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'SoftUni', 'Advanced Tree Structures'))
+from binary_heap import IndexedBinaryHeap
+
+# python heap_benchmark.py 1000000
+INSERT, DELETE_MIN, DECREASE_KEY = 0, 1, 2
+
+
+def dijkstra_trace(edge_count):
+    """ The operations of Dijkstra's algorithm on a random graph with 10 edges per vertex """
+    vertex_count = edge_count // 10
+    graph = [[] for _ in range(vertex_count)]
+    for _ in range(edge_count):
+        graph[random.randrange(vertex_count)].append((random.randrange(vertex_count), random.randint(1, 1000)))
+    trace = [(INSERT, 0, 0)]
+    heap = IndexedBinaryHeap([(0, 0)], order='min')
+    distances = {0: 0}
+    while len(heap) > 0:
+        vertex = heap.extract_max()
+        trace.append((DELETE_MIN,))
+        for neighbour, weight in graph[vertex]:
+            distance = distances[vertex] + weight
+            if neighbour not in distances:
+                distances[neighbour] = distance
+                heap.insert(neighbour, distance * vertex_count + neighbour)
+                trace.append((INSERT, neighbour, distance * vertex_count + neighbour))
+            elif distance < distances[neighbour] and neighbour in heap:
+                distances[neighbour] = distance
+                heap.update_priority(neighbour, distance * vertex_count + neighbour)
+                trace.append((DECREASE_KEY, neighbour, distance * vertex_count + neighbour))
+    return trace
+
+
+def random_trace(operation_count, insert_ratio, delete_ratio):
+    """ Random monotone operations, whatever is left from the ratios are decrease-keys """
+    trace = []
+    heap = IndexedBinaryHeap(order='min')
+    queued, positions = [], {}  # to pick a random queued handle in O(1)
+    last_base = 0
+    for handle in range(operation_count):
+        chance = random.random()
+        if chance < insert_ratio or len(heap) == 0:
+            value = (last_base + random.randint(1, 1000)) * operation_count + handle
+            heap.insert(handle, value)
+            positions[handle] = len(queued)
+            queued.append(handle)
+            trace.append((INSERT, handle, value))
+        elif chance < insert_ratio + delete_ratio:
+            min_handle = heap.peek()
+            last_base = heap.priority(min_handle) // operation_count
+            heap.extract_max()
+            last_handle = queued.pop()
+            if last_handle != min_handle:
+                queued[positions[min_handle]] = last_handle
+                positions[last_handle] = positions[min_handle]
+            del positions[min_handle]
+            trace.append((DELETE_MIN,))
+        else:
+            queued_handle = random.choice(queued)
+            current_base = heap.priority(queued_handle) // operation_count
+            if current_base <= last_base + 1:
+                continue
+            value = random.randint(last_base + 1, current_base - 1) * operation_count + queued_handle
+            heap.update_priority(queued_handle, value)
+            trace.append((DECREASE_KEY, queued_handle, value))
+    return trace
+
+
+def run_node_heap(heap_class, trace):
+    heap = heap_class()
+    nodes = {}
+    for operation in trace:
+        if operation[0] == INSERT:
+            nodes[operation[1]] = heap.insert(operation[2], operation[1])
+        elif operation[0] == DELETE_MIN:
+            del nodes[heap.delete_min().item]
+        else:
+            heap.decrease_key(nodes[operation[1]], operation[2])
+
+
+def run_binary_heap(trace):
+    heap = IndexedBinaryHeap(order='min')
+    for operation in trace:
+        if operation[0] == INSERT:
+            heap.insert(operation[1], operation[2])
+        elif operation[0] == DELETE_MIN:
+            heap.extract_max()
+        else:
+            heap.update_priority(operation[1], operation[2])
+
+
+def main():
+    test_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    random.seed(2016)
+    traces = [
+        ('dijkstra', dijkstra_trace(test_count)),
+        ('push-heavy', random_trace(test_count, 0.6, 0.2)),
+        ('pop-heavy', random_trace(test_count, 0.4, 0.4)),
+        ('decrease-key-heavy', random_trace(test_count, 0.3, 0.2)),
+    ]
+    heaps = [
+        ('FibHeap', lambda trace: run_node_heap(FibHeap, trace)),
+        ('PairingHeap', lambda trace: run_node_heap(PairingHeap, trace)),
+        ('RadixHeap', lambda trace: run_node_heap(RadixHeap, trace)),
+        ('IndexedBinaryHeap', run_binary_heap),
+    ]
+    print("{:<20}{:<12}".format('trace', 'operations') + ''.join('{:<18}'.format(name) for name, _ in heaps))
+    for trace_name, trace in traces:
+        times = []
+        for _, run in heaps:
+            start = datetime.now()
+            run(trace)
+            times.append(datetime.now() - start)
+        print("{:<20}{:<12}".format(trace_name, len(trace)) + ''.join('{:<18}'.format(str(time)) for time in times))
+
+
+if __name__ == '__main__':
+    main()
+"""
+trace               operations  FibHeap           PairingHeap       RadixHeap         IndexedBinaryHeap
+dijkstra            298628      0:00:02.064340    0:00:01.128548    0:00:01.245135    0:00:01.676671
+push-heavy          999460      0:00:06.942956    0:00:05.604760    0:00:04.938225    0:00:04.659245
+pop-heavy           999249      0:00:03.841775    0:00:01.662967    0:00:01.852324    0:00:02.344791
+decrease-key-heavy  996170      0:00:05.135660    0:00:03.237790    0:00:03.326086    0:00:04.168576
+
+The FibHeap loses every trace - the bookkeeping behind its bounds (four pointers, ranks, marks, consolidation)
+costs more than it saves at these sizes. The PairingHeap is the best all-rounder and the RadixHeap is as good
+when the values are monotone integers. The binary heap wins only when there are few pops.
+(dijkstra_benchmark.py has the FibHeap ahead, but it measures the whole algorithm and each heap there is driven
+by slightly different code, this suite runs the exact same operations.)
+"""
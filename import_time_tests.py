@@ -0,0 +1,47 @@
+"""
+Imports each module in a fresh interpreter and checks that it's quick and silent,
+these modules get imported at worker startup so they must not run any demo code.
+"""
+import os
+import subprocess
+import sys
+import unittest
+
+IMPORT_BUDGET = 0.05  # seconds
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MODULES = [
+    ('.', 'fibonacci_heap'),
+    ('.', 'pairing_heap'),
+    ('.', 'radix_heap'),
+    (os.path.join('SoftUni', 'Advanced Tree Structures'), 'avl_tree'),
+    (os.path.join('SoftUni', 'Advanced Tree Structures'), 'binary_heap'),
+    (os.path.join('SoftUni', 'Data Structure Efficiency', 'homework'), 'bi_dictionary'),
+    (os.path.join('SoftUni', 'Linear Data Structures - Stacks and Queues', 'homework'), 'array_based_stack'),
+]
+TIMED_IMPORT = ('import time\n'
+                'start = time.perf_counter()\n'
+                'import {module}\n'
+                'print(time.perf_counter() - start)')
+
+
+def time_import(directory, module):
+    """ Returns the import time and whatever the module printed """
+    result = subprocess.run([sys.executable, '-c', TIMED_IMPORT.format(module=module)],
+                            cwd=os.path.join(ROOT, directory), capture_output=True, text=True, check=True)
+    *output, elapsed = result.stdout.splitlines()
+    return float(elapsed), '\n'.join(output) + result.stderr
+
+
+class ImportTimeTests(unittest.TestCase):
+    def test_modules_import_quickly_without_output(self):
+        for directory, module in MODULES:
+            with self.subTest(module=module):
+                elapsed, output = time_import(directory, module)
+                self.assertEqual(output, '')
+                self.assertLess(elapsed, IMPORT_BUDGET)
+
+
+if __name__ == '__main__':
+    for directory, module in MODULES:
+        elapsed, _ = time_import(directory, module)
+        print('{:<20}{:.2f} ms'.format(module, elapsed * 1000))
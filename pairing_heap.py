@@ -0,0 +1,127 @@
+"""
+A pairing min-heap, with the same API as the FibHeap.
+
+It's a single tree where every node keeps only its first child and its next sibling.
+Melding two trees makes the bigger root the first child of the smaller one, which is all that insert,
+meld and decrease_key (after cutting the node out) need.
+delete_min melds the root's children in pairs from left to right and then melds the pairs from right to left,
+the two passes are what keep it O(log n) amortized.
+"""
+
+
+class PairingNode:
+    __slots__ = ('value', 'item', 'child', 'sibling', 'prev')
+
+    def __init__(self, value, item=None):
+        """ value is what the heap is ordered by, item is an optional payload """
+        self.value = value
+        self.item = item
+        self.child = None  # the first child
+        self.sibling = None  # the next sibling
+        self.prev = None  # the previous sibling, or the parent for a first child
+
+    def __repr__(self):
+        return 'PairingNode {val}'.format(val=self.value)
+
+
+class PairingHeap:
+    def __init__(self):
+        self.min = None
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def insert(self, value, item=None) -> PairingNode:
+        """ Adds the value and returns its node, which is the handle for decrease_key and delete """
+        return self.add_node(PairingNode(value, item))
+
+    def add_node(self, node: PairingNode) -> PairingNode:
+        node.child = node.sibling = node.prev = None
+        self.min = _meld(self.min, node)
+        self.count += 1
+        return node
+
+    def find_min(self) -> PairingNode:
+        return self.min
+
+    def delete_min(self) -> PairingNode:
+        min_node = self.min
+        if min_node is None:
+            raise Exception('The heap is empty!')
+        self.min = _merge_pairs(min_node.child)
+        min_node.child = None
+        self.count -= 1
+        return min_node
+
+    def decrease_key(self, node: PairingNode, value):
+        """ Lowers the node's value, cutting its subtree out and melding it with the root - O(1), O(log n) amortized """
+        if node.value < value:
+            raise Exception('The new value {new} is bigger than the current one {old}!'.format(new=value, old=node.value))
+        node.value = value
+        if node is not self.min:
+            _cut(node)
+            self.min = _meld(self.min, node)
+
+    def delete(self, node: PairingNode):
+        if node is self.min:
+            self.delete_min()
+            return
+        _cut(node)
+        self.min = _meld(self.min, _merge_pairs(node.child))
+        node.child = None
+        self.count -= 1
+
+    def meld(self, other):
+        """ Moves all the nodes of the other heap in this one - O(1) """
+        self.min = _meld(self.min, other.min)
+        self.count += other.count
+        other.min = None
+        other.count = 0
+
+
+def _meld(first, second):
+    """ Makes the root with the bigger value the first child of the other one and returns the new root """
+    if first is None:
+        return second
+    if second is None:
+        return first
+    if second.value < first.value:
+        first, second = second, first
+    second.prev = first
+    second.sibling = first.child
+    if first.child is not None:
+        first.child.prev = second
+    first.child = second
+    first.sibling = first.prev = None
+    return first
+
+
+def _cut(node):
+    """ Detaches the node (with its subtree) from its parent and siblings """
+    if node.prev.child is node:
+        node.prev.child = node.sibling
+    else:
+        node.prev.sibling = node.sibling
+    if node.sibling is not None:
+        node.sibling.prev = node.prev
+    node.prev = node.sibling = None
+
+
+def _merge_pairs(first):
+    """ The two-pass merge of a list of siblings, returns the new root """
+    pairs = []
+    node = first
+    while node is not None:
+        second = node.sibling
+        if second is None:
+            node.prev = node.sibling = None
+            pairs.append(node)
+            break
+        next_node = second.sibling
+        pairs.append(_meld(node, second))
+        node = next_node
+    root = None
+    for pair in reversed(pairs):
+        root = _meld(pair, root)
+    return root
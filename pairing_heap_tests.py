@@ -0,0 +1,76 @@
+import random
+import unittest
+from pairing_heap import PairingHeap
+
+
+class PairingHeapTests(unittest.TestCase):
+    def assertValidHeap(self, heap):
+        """ Checks the heap order, the prev pointers and the count """
+        def check(node):
+            count = 0
+            child = node.child
+            prev = node
+            while child is not None:
+                self.assertIs(child.prev, prev)
+                self.assertLessEqual(node.value, child.value)
+                count += 1 + check(child)
+                prev, child = child, child.sibling
+            return count
+        if heap.min is None:
+            self.assertEqual(len(heap), 0)
+            return
+        self.assertIsNone(heap.min.prev)
+        self.assertEqual(check(heap.min) + 1, len(heap))
+
+    def test_delete_min_should_return_sorted_values(self):
+        nums = [random.randint(-1000, 1000) for _ in range(1000)]
+        heap = PairingHeap()
+        for num in nums:
+            heap.insert(num)
+        result = []
+        while len(heap) > 0:
+            result.append(heap.delete_min().value)
+            if len(result) % 100 == 0:
+                self.assertValidHeap(heap)
+        self.assertEqual(result, sorted(nums))
+        self.assertRaises(Exception, heap.delete_min)
+
+    def test_decrease_key_should_reorder(self):
+        heap = PairingHeap()
+        nodes = {item: heap.insert(random.randint(0, 10000), item) for item in range(1000)}
+        del nodes[heap.delete_min().item]
+        expected = {item: node.value for item, node in nodes.items()}
+        for _ in range(2000):
+            item = random.choice(list(nodes))
+            new_value = expected[item] - random.randint(0, 100)
+            heap.decrease_key(nodes[item], new_value)
+            expected[item] = new_value
+        self.assertValidHeap(heap)
+        self.assertEqual([heap.delete_min().value for _ in range(len(heap))], sorted(expected.values()))
+        self.assertRaises(Exception, heap.decrease_key, heap.insert(5), 6)
+
+    def test_delete_should_remove_node(self):
+        heap = PairingHeap()
+        nodes = [heap.insert(num) for num in range(500)]
+        heap.delete_min()
+        for node in nodes[1::3]:
+            heap.delete(node)
+        self.assertValidHeap(heap)
+        self.assertEqual([heap.delete_min().value for _ in range(len(heap))],
+                         [num for num in range(1, 500) if num % 3 != 1])
+
+    def test_meld_should_move_all_nodes(self):
+        first, second = PairingHeap(), PairingHeap()
+        for num in range(0, 100, 2):
+            first.insert(num)
+        for num in range(1, 100, 2):
+            second.insert(num)
+        first.meld(second)
+        self.assertEqual(len(first), 100)
+        self.assertEqual(len(second), 0)
+        self.assertIsNone(second.find_min())
+        self.assertValidHeap(first)
+        self.assertEqual([first.delete_min().value for _ in range(100)], list(range(100)))
+
+if __name__ == '__main__':
+    unittest.main()
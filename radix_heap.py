@@ -0,0 +1,138 @@
+"""
+A monotone radix min-heap for non-negative integer values, with the same API as the FibHeap.
+
+Monotone means that a value never goes below the last deleted min, which is what Dijkstra and event simulations do.
+Bucket i holds the values whose highest bit that differs from the last min is bit i - 1 (bucket 0 holds the last min
+itself), so a value can only move to lower buckets. When bucket 0 runs out, the first non-empty bucket is spread
+over the lower ones around its min, which makes delete_min O(log C) amortized, C being the biggest value.
+"""
+
+
+class RadixNode:
+    __slots__ = ('value', 'item', 'bucket', 'position')
+
+    def __init__(self, value, item=None):
+        """ value is what the heap is ordered by, item is an optional payload """
+        self.value = value
+        self.item = item
+        self.bucket = None  # the index of the bucket the node is in
+        self.position = None  # the index of the node in its bucket
+
+    def __repr__(self):
+        return 'RadixNode {val}'.format(val=self.value)
+
+
+class RadixHeap:
+    def __init__(self):
+        self.last = 0  # the last deleted min, no value can be smaller than it
+        self.buckets = [[]]
+        self.count = 0
+        self.__min = None  # the cached min node, None when it has to be looked up again
+
+    def __len__(self):
+        return self.count
+
+    def insert(self, value, item=None) -> RadixNode:
+        """ Adds the value and returns its node, which is the handle for decrease_key and delete """
+        return self.add_node(RadixNode(value, item))
+
+    def add_node(self, node: RadixNode) -> RadixNode:
+        if node.value < self.last:
+            raise Exception('The value {val} is smaller than the last deleted min {last}!'.format(val=node.value, last=self.last))
+        self.__add(node)
+        self.count += 1
+        self.__lower_min(node)
+        return node
+
+    def find_min(self) -> RadixNode:
+        """
+        Looks through the first non-empty bucket without spreading it, last only moves when a min is deleted.
+        The min is cached, so the bucket is only looked through again after the min was deleted
+        """
+        if self.count == 0:
+            return None
+        if self.__min is None:
+            bucket_idx = 0
+            while not self.buckets[bucket_idx]:
+                bucket_idx += 1
+            if bucket_idx == 0:
+                self.__min = self.buckets[0][-1]
+            else:
+                self.__min = min(self.buckets[bucket_idx], key=lambda node: node.value)
+        return self.__min
+
+    def delete_min(self) -> RadixNode:
+        if self.count == 0:
+            raise Exception('The heap is empty!')
+        self.__fill_first_bucket()
+        node = self.__min if self.__min is not None else self.buckets[0][-1]  # the node find_min returned
+        self.__remove(node)
+        node.bucket = node.position = None
+        self.count -= 1
+        self.__min = None
+        return node
+
+    def decrease_key(self, node: RadixNode, value):
+        """ Lowers the node's value, moving it to the bucket it belongs to now - O(1) """
+        if node.value < value:
+            raise Exception('The new value {new} is bigger than the current one {old}!'.format(new=value, old=node.value))
+        if value < self.last:
+            raise Exception('The value {val} is smaller than the last deleted min {last}!'.format(val=value, last=self.last))
+        self.__remove(node)
+        node.value = value
+        self.__add(node)
+        self.__lower_min(node)
+
+    def delete(self, node: RadixNode):
+        self.__remove(node)
+        node.bucket = node.position = None
+        self.count -= 1
+        if node is self.__min:
+            self.__min = None
+
+    def meld(self, other):
+        """ Moves all the nodes of the other heap in this one - O(m) """
+        for bucket in other.buckets:
+            for node in bucket:
+                if node.value < self.last:
+                    raise Exception('The value {val} is smaller than the last deleted min {last}!'.format(val=node.value, last=self.last))
+        for bucket in other.buckets:
+            for node in bucket:
+                self.add_node(node)
+        other.buckets = [[]]
+        other.count = 0
+        other.__min = None
+
+    def __lower_min(self, node):
+        """ A cached min stays valid unless the added or decreased node goes below it """
+        if self.__min is not None and node.value < self.__min.value:
+            self.__min = node
+
+    def __add(self, node):
+        bucket_idx = (node.value ^ self.last).bit_length()
+        while len(self.buckets) <= bucket_idx:
+            self.buckets.append([])
+        bucket = self.buckets[bucket_idx]
+        node.bucket, node.position = bucket_idx, len(bucket)
+        bucket.append(node)
+
+    def __remove(self, node):
+        """ Swaps the last node of the bucket in the removed one's place - O(1) """
+        bucket = self.buckets[node.bucket]
+        last_node = bucket.pop()
+        if last_node is not node:
+            bucket[node.position] = last_node
+            last_node.position = node.position
+
+    def __fill_first_bucket(self):
+        """ Makes the first non-empty bucket's min the last min and spreads the bucket over the lower ones """
+        if self.buckets[0]:
+            return
+        bucket_idx = 1
+        while not self.buckets[bucket_idx]:
+            bucket_idx += 1
+        bucket = self.buckets[bucket_idx]
+        self.buckets[bucket_idx] = []
+        self.last = min(node.value for node in bucket)
+        for node in bucket:
+            self.__add(node)
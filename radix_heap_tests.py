@@ -0,0 +1,114 @@
+import random
+import unittest
+from radix_heap import RadixHeap
+
+
+class RadixHeapTests(unittest.TestCase):
+    def test_delete_min_should_return_sorted_values(self):
+        nums = [random.randint(0, 100000) for _ in range(1000)]
+        heap = RadixHeap()
+        for num in nums:
+            heap.insert(num)
+        self.assertEqual(heap.find_min().value, min(nums))
+        self.assertEqual([heap.delete_min().value for _ in range(len(heap))], sorted(nums))
+        self.assertIsNone(heap.find_min())
+        self.assertRaises(Exception, heap.delete_min)
+
+    def test_monotone_inserts_between_deletes(self):
+        heap = RadixHeap()
+        expected = []
+        last = 0
+        result = []
+        for _ in range(2000):
+            if expected and random.random() < 0.4:
+                expected.sort()
+                result.append(heap.delete_min().value)
+                last = expected.pop(0)
+                self.assertEqual(result[-1], last)
+            else:
+                value = last + random.randint(0, 1000)
+                heap.insert(value)
+                expected.append(value)
+        self.assertEqual(len(heap), len(expected))
+
+    def test_insert_below_last_min_should_raise(self):
+        heap = RadixHeap()
+        heap.insert(10)
+        heap.insert(20)
+        heap.delete_min()
+        self.assertRaises(Exception, heap.insert, 5)
+        self.assertRaises(Exception, heap.decrease_key, heap.find_min(), 5)
+
+    def test_decrease_key_and_delete(self):
+        heap = RadixHeap()
+        nodes = {item: heap.insert(random.randint(100, 10000), item) for item in range(1000)}
+        expected = {item: node.value for item, node in nodes.items()}
+        for _ in range(1000):
+            item = random.choice(list(nodes))
+            expected[item] = random.randint(0, expected[item])
+            heap.decrease_key(nodes[item], expected[item])
+        for item in list(nodes)[::4]:
+            heap.delete(nodes.pop(item))
+            del expected[item]
+        self.assertEqual([heap.delete_min().value for _ in range(len(heap))], sorted(expected.values()))
+
+    def test_meld_should_move_all_nodes(self):
+        first, second = RadixHeap(), RadixHeap()
+        for num in range(0, 100, 2):
+            first.insert(num)
+        for num in range(1, 100, 2):
+            second.insert(num)
+        first.meld(second)
+        self.assertEqual(len(first), 100)
+        self.assertEqual(len(second), 0)
+        self.assertEqual([first.delete_min().value for _ in range(100)], list(range(100)))
+
+    def test_insert_after_find_min(self):
+        heap = RadixHeap()
+        heap.insert(5)
+        self.assertEqual(heap.find_min().value, 5)
+        heap.insert(3)
+        self.assertEqual([heap.delete_min().value for _ in range(2)], [3, 5])
+
+        heap.insert(10)
+        heap.insert(20)
+        self.assertEqual(heap.delete_min().value, 10)
+        self.assertEqual(heap.find_min().value, 20)
+        heap.insert(15)
+        self.assertEqual([heap.delete_min().value for _ in range(2)], [15, 20])
+
+    def test_meld_below_last_min_should_raise_without_moving_nodes(self):
+        first, second = RadixHeap(), RadixHeap()
+        for num in [10, 20]:
+            first.insert(num)
+        first.delete_min()
+        for num in [30, 5, 40]:
+            second.insert(num)
+        self.assertRaises(Exception, first.meld, second)
+        self.assertEqual(len(first), 1)
+        self.assertEqual(len(second), 3)
+        self.assertEqual([first.delete_min().value], [20])
+        self.assertEqual([second.delete_min().value for _ in range(3)], [5, 30, 40])
+
+    def test_find_min_follows_every_change(self):
+        heap = RadixHeap()
+        nodes = [heap.insert(value) for value in [50, 40, 60]]
+        self.assertEqual(heap.find_min().value, 40)
+        heap.decrease_key(nodes[2], 30)
+        self.assertIs(heap.find_min(), nodes[2])
+        heap.delete(nodes[2])
+        self.assertIs(heap.find_min(), nodes[1])
+        heap.insert(45)
+        self.assertIs(heap.find_min(), nodes[1])
+        self.assertIs(heap.delete_min(), nodes[1])
+        self.assertEqual(heap.find_min().value, 45)
+        other = RadixHeap()
+        other.insert(41)
+        self.assertEqual(other.find_min().value, 41)
+        heap.meld(other)
+        self.assertEqual(heap.find_min().value, 41)
+        other.insert(100)
+        self.assertEqual(other.find_min().value, 100)
+
+if __name__ == '__main__':
+    unittest.main()